@@ -0,0 +1,24 @@
+"""Відтворювані бенчмарки CLI-асистента.
+
+Пакет містить:
+- generator — детермінований генератор N контактів і M нотаток із тегами
+  (однакове зерно дає однакові дані на будь-якій машині);
+- scenarios — сценарії, що викликають справжні обробники команд
+  (contacts, notes, birthdays_in, all_table) та load_data / save_data;
+- run — запуск сценаріїв на кількох розмірах, запис результатів у JSON
+  і порівняння з попереднім запуском.
+
+Запуск із кореня репозиторію:
+    python -m benchmarks --sizes 1000 100000 --output results.json
+    python -m benchmarks --sizes 1000000 --compare results.json
+
+Модулі команд імпортуються як пакет commands (тека cli_bot додається
+в sys.path), так само як під час запуску main.py скриптом.
+"""
+
+import sys
+from pathlib import Path
+
+_APP_DIR = str(Path(__file__).resolve().parent.parent / "cli_bot")
+if _APP_DIR not in sys.path:
+    sys.path.insert(0, _APP_DIR)
@@ -0,0 +1,133 @@
+"""Детермінований генератор контактів і нотаток для бенчмарків.
+
+Дані залежать лише від кількості та зерна (random.Random(seed)), тож два
+запуски з тими самими параметрами працюють з однаковими книгами.
+Імена, телефони та email унікальні; телефони утворюються перестановкою
+індексу (множення на просте число за модулем 10⁹), тому генерація не
+потребує множини вже виданих номерів.
+"""
+
+import random
+from datetime import date, timedelta
+
+from commands.address_book import AddressBook
+from commands.columnar import ColumnarAddressBook
+from commands.importer import import_rows
+from commands.note_book import NoteBook
+
+FIRST_NAMES = (
+    "Olena", "Andrii", "Iryna", "Taras", "Kateryna", "Maksym", "Sofiia", "Dmytro",
+    "Yuliia", "Oleksandr", "Nataliia", "Bohdan", "Oksana", "Serhii", "Mariia", "Yevhen",
+)
+LAST_NAMES = (
+    "Kovalenko", "Shevchenko", "Bondarenko", "Tkachenko", "Kravchenko", "Melnyk",
+    "Boiko", "Koval", "Oliinyk", "Lysenko", "Moroz", "Savchenko", "Rudenko", "Marchenko",
+)
+DOMAINS = ("example.com", "mail.test", "ukr.test", "corp.example", "uni.edu.test")
+CITIES = ("Kyiv", "Lviv", "Odesa", "Kharkiv", "Dnipro", "Poltava", "Chernihiv")
+STREETS = ("Shevchenka", "Franka", "Sadova", "Hrushevskoho", "Lesi_Ukrainky", "Soborna")
+WORDS = (
+    "meeting", "project", "deadline", "report", "budget", "call", "review", "plan",
+    "design", "release", "invoice", "travel", "doctor", "groceries", "gift", "birthday",
+    "school", "training", "book", "movie", "repair", "garden", "payment", "contract",
+    "client", "draft", "idea", "summary", "agenda", "ticket", "backup", "server",
+)
+TAGS = ("work", "home", "urgent", "later", "family", "finance", "health", "travel", "ideas", "archive")
+
+# Частки контактів, що мають відповідне поле.
+BIRTHDAY_SHARE = 0.8
+ADDRESS_SHARE = 0.6
+SECOND_PHONE_SHARE = 0.3
+EMAIL_SHARE = 0.7
+
+_PHONE_STEP = 7919  # просте, взаємно просте з 10⁹: i → (i * крок) mod 10⁹ — перестановка
+_FIRST_BIRTHDAY = date(1950, 1, 1)
+_BIRTHDAY_SPAN = (date(2010, 12, 31) - _FIRST_BIRTHDAY).days
+
+
+def contact_name(index: int) -> str:
+    """Повертає ім'я контакту з номером index (однакове для всіх запусків)."""
+    first = FIRST_NAMES[index % len(FIRST_NAMES)]
+    last = LAST_NAMES[index // len(FIRST_NAMES) % len(LAST_NAMES)]
+    return f"{first}{last}{index}"
+
+
+def contact_phone(index: int, slot: int = 0) -> str:
+    """Повертає унікальний номер телефону контакту index (slot — 0 або 1 для другого номера)."""
+    return f"0{((2 * index + slot) * _PHONE_STEP) % 10**9:09d}"
+
+
+def contact_email(index: int) -> str:
+    """Повертає унікальний email контакту index."""
+    return f"{contact_name(index).lower()}@{DOMAINS[index % len(DOMAINS)]}"
+
+
+def contact_rows(count: int, seed: int = 42):
+    """Генерує рядки контактів у форматі команди import.
+
+    Args:
+        count (int): Кількість контактів.
+        seed (int): Зерно генератора випадкових чисел.
+
+    Yields:
+        dict: Поля name, phones, emails, birthday, address.
+    """
+    rng = random.Random(seed)
+    for index in range(count):
+        phones = [contact_phone(index)]
+        if rng.random() < SECOND_PHONE_SHARE:
+            phones.append(contact_phone(index, 1))
+        row = {"name": contact_name(index), "phones": phones}
+        if rng.random() < EMAIL_SHARE:
+            row["emails"] = [contact_email(index)]
+        if rng.random() < BIRTHDAY_SHARE:
+            born = _FIRST_BIRTHDAY + timedelta(days=rng.randrange(_BIRTHDAY_SPAN + 1))
+            row["birthday"] = born.strftime("%d.%m.%Y")
+        if rng.random() < ADDRESS_SHARE:
+            row["address"] = f"{rng.choice(CITIES)}, {rng.choice(STREETS)} {rng.randrange(1, 200)}"
+        yield row
+
+
+def note_rows(count: int, seed: int = 42):
+    """Генерує рядки нотаток у форматі команди import.
+
+    Args:
+        count (int): Кількість нотаток.
+        seed (int): Зерно генератора випадкових чисел.
+
+    Yields:
+        dict: Поля title, text, tags.
+    """
+    rng = random.Random(seed + 1)
+    for index in range(count):
+        yield {
+            "title": f"Note{index}",
+            "text": " ".join(rng.choices(WORDS, k=rng.randrange(10, 60))),
+            "tags": rng.sample(TAGS, rng.randrange(0, 4)),
+        }
+
+
+def build(contacts: int, notes: int, seed: int = 42, layout: str = "records"):
+    """Створює заповнені адресну книгу й нотатник через масовий імпорт.
+
+    Args:
+        contacts (int): Кількість контактів.
+        notes (int): Кількість нотаток.
+        seed (int): Зерно генератора.
+        layout (str): "records" — AddressBook, "columnar" — ColumnarAddressBook.
+
+    Returns:
+        tuple[AddressBook, NoteBook]: Книга та нотатник.
+
+    Raises:
+        ValueError: Якщо layout невідомий або згенеровані дані не імпортувалися повністю.
+    """
+    if layout not in ("records", "columnar"):
+        raise ValueError(f"невідомий формат книги {layout!r}: очікується records або columnar.")
+    book = ColumnarAddressBook() if layout == "columnar" else AddressBook()
+    notebook = NoteBook()
+    for rows in (contact_rows(contacts, seed), note_rows(notes, seed)):
+        report = import_rows(rows, book, notebook)
+        if report.error_count:
+            raise ValueError(f"згенеровані дані містять помилки:\n{report}")
+    return book, notebook
@@ -0,0 +1,243 @@
+"""Запуск бенчмарків, запис результатів у JSON і порівняння запусків.
+
+Для кожного розміру книга й нотатник генеруються заново (generator.build,
+час побудови записується як сценарій build), після чого сценарії
+виконуються по черзі. Кожна операція вимірюється окремо через
+time.perf_counter з вимкненим збирачем сміття (як у timeit); у результат
+потрапляють мінімум, медіана, середнє та максимум у мілісекундах.
+
+Формат файлу результатів:
+    {
+      "meta": {"python": ..., "platform": ..., "commit": ..., "seed": ..., ...},
+      "results": [
+        {"scenario": "phone", "contacts": 1000, "notes": 100, "runs": 200,
+         "min_ms": ..., "median_ms": ..., "mean_ms": ..., "max_ms": ..., "lines": ...},
+        ...
+      ]
+    }
+
+Із --compare попередній файл зіставляється з поточним запуском за
+(scenario, contacts): виводиться відношення медіан (більше 1 — повільніше).
+"""
+
+import argparse
+import gc
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from time import perf_counter
+
+from commands import storage
+
+from .generator import build
+from .scenarios import Context, get_scenarios
+
+DEFAULT_SIZES = (1_000, 100_000)
+# Кількість нотаток відносно кількості контактів.
+DEFAULT_NOTES_RATIO = 0.1
+DEFAULT_SEED = 42
+# Відношення медіан, починаючи з якого compare позначає сценарій як регресію.
+REGRESSION_RATIO = 1.2
+# Параметри запуску, які мають збігатися, щоб порівняння було чесним.
+_COMPARABLE_META = ("seed", "layout", "storage", "notes_ratio")
+
+
+def _summary(name: str, contacts: int, notes: int, timings: list[float], lines: int) -> dict:
+    """Зводить виміри сценарію в запис результатів (час — у мілісекундах)."""
+    return {
+        "scenario": name,
+        "contacts": contacts,
+        "notes": notes,
+        "runs": len(timings),
+        "min_ms": round(min(timings) * 1000, 4),
+        "median_ms": round(statistics.median(timings) * 1000, 4),
+        "mean_ms": round(statistics.fmean(timings) * 1000, 4),
+        "max_ms": round(max(timings) * 1000, 4),
+        "lines": lines,
+    }
+
+
+def _time(run, ctx, repeat: int) -> tuple[list[float], int]:
+    """Виконує операцію repeat разів і повертає тривалості та кількість рядків останнього результату.
+
+    Як і реєстр команд, після кожної операції викликає release_views книги
+    (стовпцева книга записує зміни представлень); цей час входить у вимір.
+    """
+    release_views = getattr(ctx.book, "release_views", None) or (lambda: None)
+    timings = []
+    lines = 0
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for i in range(repeat):
+            started = perf_counter()
+            lines = run(ctx, i)
+            release_views()
+            timings.append(perf_counter() - started)
+    finally:
+        if gc_enabled:
+            gc.enable()
+    return timings, lines
+
+
+def run_size(contacts: int, notes: int, scenarios, seed: int, layout: str, repeat_scale: float, log) -> list[dict]:
+    """Генерує дані одного розміру та виконує на них сценарії.
+
+    Args:
+        contacts (int): Кількість контактів.
+        notes (int): Кількість нотаток.
+        scenarios (list[Scenario]): Сценарії для виконання.
+        seed (int): Зерно генератора.
+        layout (str): Формат адресної книги (records / columnar).
+        repeat_scale (float): Множник кількості повторів сценаріїв (не менше одного повтору).
+        log (callable): Функція для виводу прогресу.
+
+    Returns:
+        list[dict]: Записи результатів.
+    """
+    results = []
+    started = perf_counter()
+    book, notebook = build(contacts, notes, seed, layout)
+    results.append(_summary("build", contacts, notes, [perf_counter() - started], contacts + notes))
+    log(f"  build: {results[-1]['median_ms']:.1f} мс")
+
+    with tempfile.TemporaryDirectory(prefix="cli-bot-bench-") as workdir:
+        ctx = Context(book, notebook, contacts, notes, Path(workdir))
+        for scenario in scenarios:
+            if scenario.needs_files and not ctx.contact_file.exists():
+                get_scenarios(["save_data"])[0].run(ctx, 0)
+            repeat = max(1, round(scenario.repeat * repeat_scale))
+            timings, lines = _time(scenario.run, ctx, repeat)
+            results.append(_summary(scenario.name, contacts, notes, timings, lines))
+            log(f"  {scenario.name}: {results[-1]['median_ms']:.3f} мс (медіана з {repeat})")
+    return results
+
+
+def _git_commit() -> str | None:
+    """Повертає хеш поточного коміту репозиторію або None, якщо git недоступний."""
+    try:
+        completed = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=Path(__file__).resolve().parent, capture_output=True, text=True, check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return completed.stdout.strip() or None
+
+
+def compare(old: dict, new: dict) -> list[str]:
+    """Порівнює два файли результатів за медіанами.
+
+    Args:
+        old (dict): Попередні результати.
+        new (dict): Поточні результати.
+
+    Returns:
+        list[str]: Попередження про різні параметри запусків і рядки таблиці порівняння;
+            сценарії, що сповільнилися щонайменше в REGRESSION_RATIO раза, позначено «!».
+    """
+    previous = {(item["scenario"], item["contacts"]): item for item in old["results"]}
+    lines = [
+        f"Увага: {key} відрізняється ({old['meta'].get(key)} → {new['meta'].get(key)}), порівняння неточне."
+        for key in _COMPARABLE_META
+        if old["meta"].get(key) != new["meta"].get(key)
+    ]
+    lines += [f"{'Сценарій':<22} {'Контактів':>10} {'Було, мс':>12} {'Стало, мс':>12} {'Відношення':>11}"]
+    for item in new["results"]:
+        before = previous.get((item["scenario"], item["contacts"]))
+        if before is None:
+            continue
+        ratio = item["median_ms"] / before["median_ms"] if before["median_ms"] else float("inf")
+        mark = " !" if ratio >= REGRESSION_RATIO else ""
+        lines.append(
+            f"{item['scenario']:<22} {item['contacts']:>10} {before['median_ms']:>12.3f} "
+            f"{item['median_ms']:>12.3f} {ratio:>10.2f}x{mark}"
+        )
+    return lines
+
+
+def main(argv=None) -> int:
+    """Точка входу python -m benchmarks.
+
+    Args:
+        argv (list[str] | None): Аргументи командного рядка (None — sys.argv[1:]).
+
+    Returns:
+        int: Код завершення (0 — успіх, 1 — регресія при --fail-on-regression, 2 — помилка аргументів).
+    """
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Бенчмарки CLI-асистента.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES),
+                        help="кількості контактів (за замовчуванням 1000 100000; наприклад, 1000000)")
+    parser.add_argument("--notes-ratio", type=float, default=DEFAULT_NOTES_RATIO,
+                        help=f"кількість нотаток відносно контактів (за замовчуванням {DEFAULT_NOTES_RATIO})")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="зерно генератора даних")
+    parser.add_argument("--layout", choices=("records", "columnar"), default="records",
+                        help="формат адресної книги")
+    parser.add_argument("--scenario", action="append", metavar="NAME",
+                        help="виконати лише вказані сценарії (можна повторювати)")
+    parser.add_argument("--repeat-scale", type=float, default=1.0,
+                        help="множник кількості повторів (наприклад, 0.1 для швидкого запуску)")
+    parser.add_argument("--output", metavar="FILE", help="файл для результатів у JSON")
+    parser.add_argument("--compare", metavar="FILE", help="попередні результати для порівняння")
+    parser.add_argument("--fail-on-regression", action="store_true",
+                        help=f"код 1, якщо якийсь сценарій повільніший у {REGRESSION_RATIO} раза й більше")
+    parser.add_argument("--list", action="store_true", help="показати назви сценаріїв і вийти")
+    options = parser.parse_args(argv)
+
+    if options.list:
+        for scenario in get_scenarios():
+            print(scenario.name)
+        return 0
+    try:
+        scenarios = get_scenarios(options.scenario)
+    except ValueError as e:
+        parser.error(str(e))
+    if storage.STORAGE_BACKEND == "sqlite":
+        scenarios = [scenario for scenario in scenarios if scenario.name not in ("save_data", "load_data")]
+        print("[INFO] Режим sqlite: сценарії save_data і load_data пропущено.", file=sys.stderr)
+
+    def log(message: str) -> None:
+        print(message, file=sys.stderr, flush=True)
+
+    report = {
+        "meta": {
+            "started": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "commit": _git_commit(),
+            "seed": options.seed,
+            "layout": options.layout,
+            "storage": storage.STORAGE_BACKEND,
+            "notes_ratio": options.notes_ratio,
+            "repeat_scale": options.repeat_scale,
+        },
+        "results": [],
+    }
+    for size in options.sizes:
+        notes = round(size * options.notes_ratio)
+        log(f"Контактів: {size}, нотаток: {notes}")
+        report["results"].extend(
+            run_size(size, notes, scenarios, options.seed, options.layout, options.repeat_scale, log)
+        )
+
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if options.output:
+        Path(options.output).write_text(text + "\n", encoding="utf-8")
+        log(f"Результати записано у {options.output}")
+    else:
+        print(text)
+
+    if options.compare:
+        old = json.loads(Path(options.compare).read_text(encoding="utf-8"))
+        lines = compare(old, report)
+        for line in lines:
+            log(line)
+        if options.fail_on_regression and any(line.endswith("!") for line in lines):
+            return 1
+    return 0
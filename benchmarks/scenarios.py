@@ -0,0 +1,212 @@
+"""Сценарії бенчмарків: виклики справжніх обробників команд.
+
+Кожен сценарій — функція run(ctx, i), що виконує одну операцію (i — номер
+повтору, щоб, наприклад, кожен add додавав новий контакт чи шукав інше
+ім'я). Потокові результати (генератори рядків) вичитуються до кінця,
+тож вимірюється повна робота команди, але не вивід у термінал.
+
+Цілі пошуку беруться з тих самих детермінованих функцій, що й дані
+(contact_name, contact_phone, contact_email), тому кожен запуск шукає
+однакові контакти.
+"""
+
+import contextlib
+import io
+from pathlib import Path
+
+from commands import storage
+from commands.all_table import all_table
+from commands.birthdays_in import birthdays_in
+from commands.contacts import (
+    add_contact, birthdays, find_by_domain, find_by_email, find_by_phone_part,
+    find_by_prefix, show_all, show_phone,
+)
+from commands.notes import (
+    add_note, find_note, find_note_by_tags, search_notes, show_notes, sort_notes_by_tags,
+)
+
+from .generator import DOMAINS, TAGS, contact_email, contact_name, contact_phone
+
+
+class Context:
+    """Дані, на яких виконуються сценарії одного розміру."""
+
+    def __init__(self, book, notes, contacts: int, note_count: int, workdir: Path):
+        """Запам'ятовує книгу, нотатник, їхні розміри та теку для файлів збереження."""
+        self.book = book
+        self.notes = notes
+        self.contacts = contacts
+        self.note_count = note_count
+        self.contact_file = workdir / "addressbook.pkl"
+        self.note_file = workdir / "notes.pkl"
+        self.journal_file = workdir / "journal.log"
+
+    def target(self, i: int) -> int:
+        """Повертає номер наявного контакту для i-го повтору (рівномірно по книзі)."""
+        return (i * 7_919) % max(self.contacts, 1)
+
+
+class Scenario:
+    """Опис сценарію: назва, кількість повторів і функція однієї операції."""
+
+    def __init__(self, name: str, run, repeat: int, needs_files: bool = False):
+        """Створює сценарій.
+
+        Args:
+            name (str): Назва (команда CLI; варіанти з аргументами — з суфіксом, наприклад birthdays-30).
+            run (callable): Функція run(ctx, i).
+            repeat (int): Скільки разів виконати операцію.
+            needs_files (bool): Чи потребує сценарій збережених файлів (load_data).
+        """
+        self.name = name
+        self.run = run
+        self.repeat = repeat
+        self.needs_files = needs_files
+
+
+def _drain(result) -> int:
+    """Вичитує результат команди (рядок або генератор) і повертає кількість рядків."""
+    if result is None:
+        return 0
+    if isinstance(result, str):
+        return result.count("\n") + 1
+    return sum(1 for _ in result)
+
+
+def _add(ctx, i):
+    return _drain(add_contact([f"BenchAdd{i}", f"1{i:09d}"], ctx.book))
+
+
+def _phone(ctx, i):
+    return _drain(show_phone([contact_name(ctx.target(i))], ctx.book))
+
+
+def _email(ctx, i):
+    return _drain(find_by_email([contact_email(ctx.target(i))], ctx.book))
+
+
+def _domain(ctx, i):
+    return _drain(find_by_domain([DOMAINS[i % len(DOMAINS)]], ctx.book))
+
+
+def _prefix(ctx, i):
+    return _drain(find_by_prefix([contact_name(ctx.target(i))[:6], "--limit", "50"], ctx.book))
+
+
+def _find_phone(ctx, i):
+    return _drain(find_by_phone_part([contact_phone(ctx.target(i))[:5], "--limit", "50"], ctx.book))
+
+
+def _birthdays(ctx, i):
+    return _drain(birthdays([], ctx.book))
+
+
+def _birthdays_30(ctx, i):
+    return _drain(birthdays(["30"], ctx.book))
+
+
+def _birthdays_in(ctx, i):
+    return _drain(birthdays_in([str(i % 7)], ctx.book))
+
+
+def _birthdays_range(ctx, i):
+    return _drain(birthdays_in(["0..90"], ctx.book))
+
+
+def _all(ctx, i):
+    return _drain(show_all([], ctx.book))
+
+
+def _all_table(ctx, i):
+    return _drain(all_table([], ctx.book))
+
+
+def _all_table_page(ctx, i):
+    return _drain(all_table(["--limit", "50"], ctx.book))
+
+
+def _add_note(ctx, i):
+    return _drain(add_note([f"BenchNote{i}", "benchmark", "note", "text"], ctx.notes))
+
+
+def _find_note(ctx, i):
+    return _drain(find_note([f"Note{ctx.target(i) % max(ctx.note_count, 1)}"], ctx.notes))
+
+
+def _search_notes(ctx, i):
+    return _drain(search_notes(["budget", "deadline", "--top", "10"], ctx.notes))
+
+
+def _find_by_tag(ctx, i):
+    return _drain(find_note_by_tags([f"+{TAGS[i % len(TAGS)]}", f"-{TAGS[(i + 1) % len(TAGS)]}"], ctx.notes))
+
+
+def _sort_notes(ctx, i):
+    return _drain(sort_notes_by_tags(["--page", "1", "--size", "50"], ctx.notes))
+
+
+def _show_notes(ctx, i):
+    return _drain(show_notes([], ctx.notes))
+
+
+def _save(ctx, i):
+    with contextlib.redirect_stdout(io.StringIO()):
+        storage.save_data(
+            ctx.book, ctx.notes, ctx.contact_file, ctx.note_file, ctx.journal_file, force=True
+        )
+    return 0
+
+
+def _load(ctx, i):
+    with contextlib.redirect_stdout(io.StringIO()):
+        book, notes = storage.load_data(ctx.contact_file, ctx.note_file, ctx.journal_file)
+        # load_data повертає ліниві замісники: змушуємо їх прочитати файли.
+        return len(book.data) + len(notes.data)
+
+
+# Порядок важливий: змінюючі сценарії (add, add-note) — після читань, збереження — перед завантаженням.
+SCENARIOS = [
+    Scenario("phone", _phone, 200),
+    Scenario("email", _email, 200),
+    Scenario("domain", _domain, 5),
+    Scenario("prefix", _prefix, 200),
+    Scenario("find-phone", _find_phone, 200),
+    Scenario("birthdays", _birthdays, 10),
+    Scenario("birthdays-30", _birthdays_30, 10),
+    Scenario("birthdays-in", _birthdays_in, 20),
+    Scenario("birthdays-in-range", _birthdays_range, 5),
+    Scenario("all", _all, 3),
+    Scenario("all-table", _all_table, 3),
+    Scenario("all-table-page", _all_table_page, 50),
+    Scenario("find-note", _find_note, 20),
+    Scenario("search-notes", _search_notes, 20),
+    Scenario("find-by-tag", _find_by_tag, 20),
+    Scenario("sort-notes-by-tag", _sort_notes, 10),
+    Scenario("show-notes", _show_notes, 3),
+    Scenario("add", _add, 200),
+    Scenario("add-note", _add_note, 200),
+    Scenario("save_data", _save, 3),
+    Scenario("load_data", _load, 3, needs_files=True),
+]
+
+
+def get_scenarios(names=None) -> list[Scenario]:
+    """Повертає сценарії за назвами (усі, якщо назви не вказано).
+
+    Args:
+        names (Iterable[str] | None): Назви сценаріїв.
+
+    Returns:
+        list[Scenario]: Сценарії в порядку SCENARIOS.
+
+    Raises:
+        ValueError: Якщо якоїсь назви немає серед сценаріїв.
+    """
+    if not names:
+        return list(SCENARIOS)
+    known = {scenario.name for scenario in SCENARIOS}
+    unknown = [name for name in names if name not in known]
+    if unknown:
+        raise ValueError(f"невідомі сценарії: {', '.join(unknown)}.")
+    wanted = set(names)
+    return [scenario for scenario in SCENARIOS if scenario.name in wanted]
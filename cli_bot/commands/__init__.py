@@ -12,24 +12,74 @@
 - Класи AddressBook, Record, NoteBook
 - Модулі збереження та завантаження даних
 - Табличний вивід контактів та пошук днів народження через N днів
+- Статистику виконання команд (команда stats) та профілювання пам'яті (команда memory)
+- Масовий імпорт контактів і нотаток із CSV/JSONL та експорт у CSV, JSONL, vCard та iCalendar
+
+Імпорт ледачий (PEP 562): підмодуль завантажується лише під час першого
+звернення до його імені, тому запуск не тягне за собою модулі команд,
+якими користувач не скористався.
 
 Метою цього модуля є централізація імпорту та створення
 зручного публічного інтерфейсу для всього CLI-пакета.
 """
 
 
-from .contacts import add_contact,change_contact,show_phone,show_all,add_birthday,show_birthday, birthdays, add_address, add_email, delete_contact, find_by_email, find_by_name
-from .parser import parse_input
-from .decorator import input_error
-from .address_book import AddressBook, Record
-from .storage import save_data,load_data
-from .note_book import NoteBook
-from .notes import add_note, find_note, show_notes, edit_note, delete_note, add_tags_to_note, find_note_by_tags, sort_notes_by_tags
-from .help_text import help_text
-from .birthdays_in import birthdays_in
-from .all_table import all_table
+from importlib import import_module
+
+# Ім'я → підмодуль, з якого воно експортується.
+_EXPORTS = {
+    **dict.fromkeys(
+        ('add_contact', 'change_contact', 'show_phone', 'show_all', 'add_birthday', 'show_birthday',
+         'birthdays', 'add_address', 'add_email', 'delete_contact', 'find_by_email', 'find_by_domain',
+         'find_by_name', 'find_by_prefix', 'find_by_phone_part'),
+        'contacts',
+    ),
+    'parse_input': 'parser',
+    **dict.fromkeys(('input_error', 'Refusal'), 'decorator'),
+    'AddressBook': 'address_book',
+    'Record': 'address_book',
+    **dict.fromkeys(('save_data', 'load_data', 'log_command', 'AutoSaver'), 'storage'),
+    'NoteBook': 'note_book',
+    **dict.fromkeys(
+        ('add_note', 'find_note', 'search_notes', 'show_notes', 'edit_note', 'delete_note',
+         'add_tags_to_note', 'find_note_by_tags', 'sort_notes_by_tags'),
+        'notes',
+    ),
+    'help_text': 'help_text',
+    'birthdays_in': 'birthdays_in',
+    'all_table': 'all_table',
+    **dict.fromkeys(
+        ('COMMAND_REGISTRY', 'dispatch', 'get_command', 'command_names', 'suggest_command', 'suggest_argument'),
+        'registry',
+    ),
+    **dict.fromkeys(('import_data', 'import_file', 'import_rows', 'ImportReport'), 'importer'),
+    **dict.fromkeys(('export_data', 'export_file', 'ExportReport'), 'exporter'),
+    **dict.fromkeys(('STATS', 'STATS_FILE', 'show_stats', 'is_error_message'), 'stats'),
+    **dict.fromkeys(('memory', 'start_tracing'), 'memory'),
+    **dict.fromkeys(('run_server', 'DEFAULT_HOST', 'DEFAULT_PORT', 'END_MARKER'), 'server'),
+}
 
-__all__ = ['add_contact', 'change_contact','show_phone', 'show_all', 'parse_input' , 'input_error', 'AddressBook', 'Record', 
-        'add_birthday','show_birthday', 'birthdays', 'birthdays_in', 'save_data','load_data', 'NoteBook', 'add_note', 'find_note','show_notes',
+__all__ = ['add_contact', 'change_contact','show_phone', 'show_all', 'parse_input' , 'input_error', 'Refusal', 'AddressBook', 'Record', 
+        'add_birthday','show_birthday', 'birthdays', 'birthdays_in', 'save_data','load_data','log_command', 'AutoSaver', 'NoteBook', 'add_note', 'find_note','search_notes','show_notes',
         'edit_note','delete_note', 'help_text', 'add_tags_to_note','find_note_by_tags','sort_notes_by_tags','add_address','add_email', 
-        'delete_contact','find_by_email','find_by_name', 'all_table']
\ No newline at end of file
+        'delete_contact','find_by_email','find_by_domain','find_by_name', 'find_by_prefix', 'find_by_phone_part', 'all_table',
+        'COMMAND_REGISTRY', 'dispatch', 'get_command', 'command_names', 'suggest_command', 'suggest_argument',
+        'import_data', 'import_file', 'import_rows', 'ImportReport', 'export_data', 'export_file', 'ExportReport',
+        'STATS', 'STATS_FILE', 'show_stats', 'is_error_message', 'memory', 'start_tracing',
+        'run_server', 'DEFAULT_HOST', 'DEFAULT_PORT', 'END_MARKER']
+
+
+def __getattr__(name):
+    """Ліниво імпортує експортоване ім'я з відповідного підмодуля."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    # Підмодулі birthdays_in, help_text та all_table мають ту саму назву, що й функції:
+    # після імпорту атрибут пакета вказує на модуль, тому кешуємо саме функцію.
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -7,14 +7,25 @@
 - AddressBook — колекція контактів та робота з ними.
 """
 
+from calendar import isleap
 from collections import UserDict
 from datetime import datetime, timedelta, date
 import re
 from colorama import Fore, Style
 
+from .decorator import Refusal
+from .fuzzy import BKTree
+from .prefix import PrefixIndex
+
 
 class Field:
-    """Базовий клас для полів запису (значення, що виводиться як текст)."""
+    """Базовий клас для полів запису (значення, що виводиться як текст).
+
+    Поля мають __slots__ замість __dict__, а в pickle зберігається лише
+    значення поля, тож кожне поле займає кілька десятків байтів.
+    """
+
+    __slots__ = ("value",)
 
     def __init__(self, value):
         """Ініціалізує поле значенням.
@@ -28,10 +39,34 @@ class Field:
         """Повертає рядкове представлення значення поля."""
         return str(self.value)
 
+    def __getstate__(self):
+        """Повертає стан для pickle — саме значення поля."""
+        return self.value
+
+    def __setstate__(self, state):
+        """Відновлює поле з pickle (зокрема зі словника стану в старих файлах)."""
+        if isinstance(state, dict):
+            state = state["value"] if "value" in state else state["_value"]
+        _FIELD_VALUE.__set__(self, state)
+
+
+# Дескриптор слота value: ним користуються Phone (де value — властивість
+# з валідацією) та відновлення з pickle, щоб не валідувати дані повторно.
+_FIELD_VALUE = Field.value
+
+
+def _field(cls, value):
+    """Створює поле зі значенням без повторної валідації (як під час завантаження з pickle)."""
+    field = cls.__new__(cls)
+    field.__setstate__(value)
+    return field
+
 
 class Name(Field):
     """Поле для зберігання імені контакту."""
 
+    __slots__ = ()
+
     def __init__(self, name):
         """Ініціалізує ім'я контакту.
 
@@ -44,6 +79,8 @@ class Name(Field):
 class Address(Field):
     """Поле для зберігання поштової адреси."""
 
+    __slots__ = ()
+
     def __init__(self, address):
         """Ініціалізує адресу контакту.
 
@@ -56,6 +93,8 @@ class Address(Field):
 class Email(Field):
     """Поле для зберігання та валідації email-адреси."""
 
+    __slots__ = ()
+
     EMAIL_PATTERN = re.compile(r"^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}$")
 
     def __init__(self, email: str):
@@ -76,6 +115,8 @@ class Email(Field):
 class Phone(Field):
     """Поле для зберігання та валідації номера телефону."""
 
+    __slots__ = ()
+
     def __init__(self, phone):
         """Ініціалізує номер телефону.
 
@@ -90,7 +131,7 @@ class Phone(Field):
     @property
     def value(self):
         """Повертає збережений номер телефону."""
-        return self._value
+        return _FIELD_VALUE.__get__(self, Phone)
 
     @value.setter
     def value(self, new_value):
@@ -105,15 +146,21 @@ class Phone(Field):
         new_value = new_value.strip()
         if not new_value.isdigit() or len(new_value) != 10:
             raise ValueError("Номер телефону має бути до 10 символів.")
-        self._value = new_value
+        _FIELD_VALUE.__set__(self, new_value)
 
     def __str__(self):
         """Повертає номер телефону як рядок."""
-        return self._value
+        return self.value
 
 
 class Record:
-    """Окремий запис адресної книги (контакт)."""
+    """Окремий запис адресної книги (контакт).
+
+    Атрибути зберігаються в __slots__; записи з pickle-файлів старих версій
+    (зі словником стану) відновлюються тим самим __setstate__.
+    """
+
+    __slots__ = ("name", "phones", "birthday", "address", "emails", "_book")
 
     def __init__(self, name: str):
         """Створює новий контакт.
@@ -126,6 +173,25 @@ class Record:
         self.birthday: "Birthday" | None = None
         self.address: Address | None = None
         self.emails: list[Email] = []
+        self._book: "AddressBook" | None = None
+
+    def __getstate__(self):
+        """Повертає стан для pickle (кортеж полів) без зворотного посилання на адресну книгу."""
+        return self.name, self.phones, self.birthday, self.address, self.emails
+
+    def __setstate__(self, state):
+        """Відновлює стан із pickle (зокрема словник стану записів, збережених
+        до появи індексів і __slots__)."""
+        if isinstance(state, dict):
+            state = (
+                state["name"],
+                state.get("phones", []),
+                state.get("birthday"),
+                state.get("address"),
+                state.get("emails", []),
+            )
+        self.name, self.phones, self.birthday, self.address, self.emails = state
+        self._book = None
 
     def add_phone(self, phone: str) -> str:
         """Додає новий номер телефону до контакту.
@@ -138,11 +204,14 @@ class Record:
         """
         try:
             if self.find_phone(phone):
-                return "Такий номер вже існує у цьому контакті."
-            self.phones.append(Phone(phone))
+                return Refusal("Такий номер вже існує у цьому контакті.")
+            phone_obj = Phone(phone)
+            self.phones.append(phone_obj)
+            if self._book is not None:
+                self._book._index_phone(phone_obj.value, self)
             return "Телефон додано."
         except ValueError as e:
-            return f"Невірний номер: {e}"
+            return Refusal(f"Невірний номер: {e}")
 
     def remove(self, phone: str) -> str:
         """Видаляє номер телефону з контакту.
@@ -156,8 +225,10 @@ class Record:
         for p in self.phones:
             if p.value == phone:
                 self.phones.remove(p)
+                if self._book is not None:
+                    self._book._unindex_phone(phone, self)
                 return f"Телефон {phone} видалено."
-        return f"Телефон {phone} не знайдено."
+        return Refusal(f"Телефон {phone} не знайдено.")
 
     def edit_phone(self, old_phone: str, new_phone: str) -> str:
         """Змінює існуючий номер телефону на новий.
@@ -175,13 +246,16 @@ class Record:
                     existing.value == new_phone and existing.value != old_phone
                     for existing in self.phones
                 ):
-                    return f"Номер {new_phone} вже існує у цьому контакті."
+                    return Refusal(f"Номер {new_phone} вже існує у цьому контакті.")
                 try:
                     p.value = new_phone
+                    if self._book is not None:
+                        self._book._unindex_phone(old_phone, self)
+                        self._book._index_phone(p.value, self)
                     return f"Старий номер : {old_phone} був змінений на {new_phone}."
                 except ValueError as er:
-                    return f"Невірний номер: {er}"
-        return "Телефон не знайдено."
+                    return Refusal(f"Невірний номер: {er}")
+        return Refusal("Телефон не знайдено.")
 
     def find_phone(self, phone: str) -> Phone | None:
         """Шукає номер телефону в межах одного контакту.
@@ -222,7 +296,7 @@ class Record:
             str: Повідомлення про результат операції.
         """
         if self.birthday is not None:
-            return (
+            return Refusal(
                 f"У контакту '{self.name.value}' вже вказано день народження: "
                 f"{self.birthday}"
             )
@@ -250,10 +324,16 @@ class Record:
             str: Повідомлення про успіх або текст помилки.
         """
         try:
-            self.birthday = Birthday(birthday)
-            return success_message
+            new_birthday = Birthday(birthday)
         except ValueError as er:
-            return str(er)
+            return Refusal(er)
+        old_birthday = self.birthday
+        self.birthday = new_birthday
+        if self._book is not None:
+            if old_birthday is not None:
+                self._book._unindex_birthday(old_birthday.value, self)
+            self._book._index_birthday(new_birthday.value, self)
+        return success_message
 
     def add_address(self, address: str) -> str:
         """Додає адресу контакту.
@@ -289,7 +369,7 @@ class Record:
         """
         normalized = " ".join(address.split())
         if not normalized:
-            return "Будь ласка, введіть адресу."
+            return Refusal("Будь ласка, введіть адресу.")
         self.address = Address(normalized)
         return success_message
 
@@ -303,13 +383,15 @@ class Record:
             str: Повідомлення про результат операції.
         """
         if self.find_email(email):
-            return "Такий email вже існує у цьому контакті."
+            return Refusal("Такий email вже існує у цьому контакті.")
         try:
             email_obj = Email(email)
             self.emails.append(email_obj)
+            if self._book is not None:
+                self._book._index_email(email_obj.value, self)
             return "Email додано."
         except ValueError as er:
-            return f"Невірний email: {er}"
+            return Refusal(f"Невірний email: {er}")
 
     def change_name(self, book: "AddressBook", new_name: str) -> str:
         """Змінює ім'я контакту та оновлює ключ у адресній книзі.
@@ -323,15 +405,13 @@ class Record:
         """
         new_name = new_name.strip()
         if not new_name:
-            return "Нове ім'я не може бути порожнім."
+            return Refusal("Нове ім'я не може бути порожнім.")
         current_name = self.name.value
         if new_name == current_name:
-            return "Нове ім'я збігається з поточним."
+            return Refusal("Нове ім'я збігається з поточним.")
         if book.find(new_name):
-            return f"Контакт з ім'ям '{new_name}' вже існує."
-        del book.data[current_name]
-        self.name = Name(new_name)
-        book.add_record(self)
+            return Refusal(f"Контакт з ім'ям '{new_name}' вже існує.")
+        book.rename(self, new_name)
         return f"Ім'я контакту змінено на {new_name}."
 
     def edit_email(self, old_email: str, new_email: str) -> str:
@@ -352,13 +432,16 @@ class Record:
                     existing.value.casefold() == normalized_new and i != idx
                     for i, existing in enumerate(self.emails)
                 ):
-                    return f"Email {new_email} вже існує у цьому контакті."
+                    return Refusal(f"Email {new_email} вже існує у цьому контакті.")
                 try:
                     self.emails[idx] = Email(new_email)
+                    if self._book is not None:
+                        self._book._unindex_email(email.value, self)
+                        self._book._index_email(self.emails[idx].value, self)
                     return f"Email {old_email} змінено на {new_email}."
                 except ValueError as er:
-                    return f"Невірний email: {er}"
-        return f"Email {old_email} не знайдено."
+                    return Refusal(f"Невірний email: {er}")
+        return Refusal(f"Email {old_email} не знайдено.")
 
     def __str__(self):
         """Формує кольорове текстове представлення контакту для CLI."""
@@ -402,6 +485,8 @@ class Record:
 class Birthday(Field):
     """Поле для зберігання дати народження з валідацією формату."""
 
+    __slots__ = ()
+
     def __init__(self, value: str):
         """Створює дату народження з рядка.
 
@@ -422,8 +507,182 @@ class Birthday(Field):
         return self.value.strftime("%d.%m.%Y")
 
 
+# Найбільша довжина вікна (у днях) для birthdays_between: кожен контакт
+# трапляється у вікні щонайбільше двічі.
+MAX_BIRTHDAY_WINDOW = 366
+
+
 class AddressBook(UserDict):
-    """Колекція записів контактів (адресна книга)."""
+    """Колекція записів контактів (адресна книга).
+
+    Підтримує індекси, які оновлюються методами Record (add_phone, remove,
+    edit_phone, add_email, edit_email) та самою книгою (add_record, rename, delete):
+    - телефон → запис;
+    - відсортовані телефони та їхні цифри у зворотному порядку для пошуку
+      за початком і кінцем номера (будуються під час першого такого пошуку);
+    - email у casefold → запис;
+    - домен email → записи з адресами в цьому домені;
+    - календар (місяць, день) → записи з днем народження в цей день;
+    - BK-дерево імен для підказок при помилках у імені (будується під час
+      першої підказки, далі оновлюється разом з іншими індексами);
+    - відсортований індекс імен для пошуку за префіксом і автодоповнення
+      (будується під час першого пошуку, далі оновлюється так само).
+    Індекси не зберігаються в pickle і перебудовуються під час завантаження.
+    """
+
+    _INDEX_ATTRS = ("_phone_index", "_email_index", "_domain_index", "_birthday_index", "_name_tree",
+                    "_prefix_index", "_phone_prefixes", "_phone_suffixes")
+
+    def __init__(self, *args, **kwargs):
+        """Створює порожню книгу з індексами та (за потреби) наповнює її."""
+        self._reset_indexes()
+        super().__init__(*args, **kwargs)
+
+    def __setitem__(self, name, record):
+        """Зберігає запис під ім'ям, підтримуючи індекси в актуальному стані."""
+        old = self.data.get(name)
+        if old is not None and old is not record:
+            self._detach(old)
+        self.data[name] = record
+        self._attach(record)
+
+    def __delitem__(self, name):
+        """Видаляє запис за ім'ям разом із його записами в індексах."""
+        record = self.data.pop(name)
+        self._detach(record)
+
+    def __getstate__(self):
+        """Повертає стан для pickle без індексів (вони відновлюються при завантаженні)."""
+        state = self.__dict__.copy()
+        for attr in self._INDEX_ATTRS:
+            state.pop(attr, None)
+        return state
+
+    def __setstate__(self, state):
+        """Відновлює книгу з pickle та перебудовує індекси."""
+        self.__dict__.update(state)
+        self.rebuild_indexes()
+
+    def rebuild_indexes(self) -> None:
+        """Перебудовує всі індекси з нуля за поточними записами.
+
+        Викликається автоматично під час завантаження pickle, зокрема
+        створеного версіями без індексів.
+        """
+        self._reset_indexes()
+        for record in self.data.values():
+            self._attach(record)
+
+    def _reset_indexes(self) -> None:
+        """Створює порожні індекси."""
+        self._phone_index: dict[str, Record] = {}
+        self._email_index: dict[str, Record] = {}
+        self._domain_index: dict[str, dict[Record, None]] = {}
+        self._birthday_index: dict[tuple[int, int], dict[Record, None]] = {}
+        self._name_tree: BKTree | None = None
+        self._prefix_index: PrefixIndex | None = None
+        self._phone_prefixes: PrefixIndex | None = None
+        self._phone_suffixes: PrefixIndex | None = None
+
+    def _attach(self, record: Record) -> None:
+        """Прив'язує запис до книги та додає його дані до індексів."""
+        record._book = self
+        for phone in record.phones:
+            self._index_phone(phone.value, record)
+        for email in record.emails:
+            self._index_email(email.value, record)
+        if record.birthday is not None:
+            self._index_birthday(record.birthday.value, record)
+        self._index_name(record.name.value)
+
+    def _detach(self, record: Record) -> None:
+        """Відв'язує запис від книги та прибирає його дані з індексів."""
+        for phone in record.phones:
+            self._unindex_phone(phone.value, record)
+        for email in record.emails:
+            key = email.value.casefold()
+            if self._email_index.get(key) is record:
+                del self._email_index[key]
+            self._discard_domain(key.rpartition("@")[2], record)
+        if record.birthday is not None:
+            self._unindex_birthday(record.birthday.value, record)
+        self._unindex_name(record.name.value)
+        record._book = None
+
+    def _index_name(self, name: str) -> None:
+        """Додає ім'я до вже побудованих дерева підказок та індексу префіксів."""
+        if self._name_tree is not None:
+            self._name_tree.add(name)
+        if self._prefix_index is not None:
+            self._prefix_index.add(name)
+
+    def _unindex_name(self, name: str) -> None:
+        """Прибирає ім'я з уже побудованих дерева підказок та індексу префіксів."""
+        if self._name_tree is not None:
+            self._name_tree.discard(name)
+        if self._prefix_index is not None:
+            self._prefix_index.discard(name)
+
+    def _index_phone(self, phone: str, record: Record) -> None:
+        """Додає номер до індексу телефон → запис та до побудованих відсортованих індексів."""
+        self._phone_index[phone] = record
+        if self._phone_prefixes is not None:
+            self._phone_prefixes.add(phone)
+        if self._phone_suffixes is not None:
+            self._phone_suffixes.add(phone[::-1])
+
+    def _unindex_phone(self, phone: str, record: Record) -> None:
+        """Прибирає номер з індексу, якщо він належить вказаному запису."""
+        if self._phone_index.get(phone) is record:
+            del self._phone_index[phone]
+            if self._phone_prefixes is not None:
+                self._phone_prefixes.discard(phone)
+            if self._phone_suffixes is not None:
+                self._phone_suffixes.discard(phone[::-1])
+
+    def _index_email(self, email: str, record: Record) -> None:
+        """Додає email до індексів email → запис та домен → записи."""
+        key = email.casefold()
+        if key == email:
+            key = email  # ключ — той самий рядок, що й у записі, без окремої копії
+        self._email_index[key] = record
+        domain = key.rpartition("@")[2]
+        self._domain_index.setdefault(domain, {})[record] = None
+
+    def _unindex_email(self, email: str, record: Record) -> None:
+        """Прибирає email, який уже вилучено із запису, з індексів.
+
+        Запис лишається в індексі домену, якщо в нього є інший email у тому ж домені.
+        """
+        key = email.casefold()
+        if self._email_index.get(key) is record:
+            del self._email_index[key]
+        domain = key.rpartition("@")[2]
+        if not any(em.value.casefold().rpartition("@")[2] == domain for em in record.emails):
+            self._discard_domain(domain, record)
+
+    def _discard_domain(self, domain: str, record: Record) -> None:
+        """Прибирає запис з індексу домену та видаляє порожній домен."""
+        owners = self._domain_index.get(domain)
+        if owners is None:
+            return
+        owners.pop(record, None)
+        if not owners:
+            del self._domain_index[domain]
+
+    def _index_birthday(self, birthday: date, record: Record) -> None:
+        """Додає запис до кошика календаря (місяць, день)."""
+        self._birthday_index.setdefault((birthday.month, birthday.day), {})[record] = None
+
+    def _unindex_birthday(self, birthday: date, record: Record) -> None:
+        """Прибирає запис із кошика календаря та видаляє порожній кошик."""
+        key = (birthday.month, birthday.day)
+        bucket = self._birthday_index.get(key)
+        if bucket is None:
+            return
+        bucket.pop(record, None)
+        if not bucket:
+            del self._birthday_index[key]
 
     def add_record(self, record: Record) -> None:
         """Додає або оновлює запис контакту в адресній книзі.
@@ -431,7 +690,45 @@ class AddressBook(UserDict):
         Args:
             record (Record): Запис контакту для збереження.
         """
-        self.data[record.name.value] = record
+        self[record.name.value] = record
+
+    def add_records(self, records) -> None:
+        """Додає пакет нових записів (імен яких ще немає в книзі) для масового імпорту.
+
+        Args:
+            records (Iterable[Record]): Нові записи з унікальними іменами.
+        """
+        data = self.data
+        for record in records:
+            data[record.name.value] = record
+            self._attach(record)
+
+    def known_phones(self):
+        """Повертає множину (або відображення) номерів, уже зайнятих контактами книги.
+
+        Returns:
+            Container[str]: Номери телефонів; підтримує перевірку «in».
+        """
+        return self._phone_index
+
+    def known_emails(self):
+        """Повертає множину (або відображення) email у casefold, уже зайнятих контактами книги.
+
+        Returns:
+            Container[str]: Email-адреси в нижньому регістрі; підтримує перевірку «in».
+        """
+        return self._email_index
+
+    def rename(self, record: Record, new_name: str) -> None:
+        """Переносить запис під нове ім'я, зберігаючи індекси узгодженими.
+
+        Args:
+            record (Record): Запис, що належить книзі.
+            new_name (str): Нове ім'я контакту.
+        """
+        del self[record.name.value]
+        record.name = Name(new_name)
+        self[new_name] = record
 
     def find(self, name: str) -> Record | None:
         """Шукає контакт за ім'ям.
@@ -444,19 +741,75 @@ class AddressBook(UserDict):
         """
         return self.data.get(name)
 
+    def suggest_names(self, name: str, limit: int = 3) -> list[str]:
+        """Підказує імена існуючих контактів, схожі на введене.
+
+        Args:
+            name (str): Ім'я, якого немає в книзі.
+            limit (int): Найбільша кількість підказок.
+
+        Returns:
+            list[str]: Схожі імена (порожній список, якщо контакт існує).
+        """
+        if self.find(name) is not None:
+            return []
+        if self._name_tree is None:
+            self._name_tree = BKTree(self.data)
+        return self._name_tree.closest(name, limit)
+
+    def names_with_prefix(self, prefix: str, limit: int | None = None):
+        """Повертає імена контактів, що починаються з префікса, в алфавітному порядку.
+
+        Args:
+            prefix (str): Префікс імені (без урахування регістру).
+            limit (int | None): Найбільша кількість імен (None — без обмеження).
+
+        Returns:
+            Iterator[str]: Імена контактів.
+        """
+        if self._prefix_index is None:
+            self._prefix_index = PrefixIndex(self.data)
+        return self._prefix_index.iter_prefix(prefix, limit)
+
     def find_record_by_phone(self, phone: str) -> Record | None:
         """Шукає контакт, у якому є вказаний номер телефону.
 
+        Пошук виконується за індексом телефон → запис за O(1).
+
         Args:
             phone (str): Номер телефону для пошуку.
 
         Returns:
-            Record | None: Перший знайдений запис або None.
+            Record | None: Знайдений запис або None.
         """
-        for record in self.data.values():
-            if record.find_phone(phone):
-                return record
-        return None
+        return self._phone_index.get(phone)
+
+    def find_phones(self, digits: str, from_end: bool = False, limit: int | None = None):
+        """Знаходить телефони, що починаються (або закінчуються) вказаними цифрами.
+
+        Пошук за початком — бінарний пошук у відсортованих номерах, за
+        кінцем — у відсортованих номерах із цифрами у зворотному порядку.
+        Обидва індекси будуються під час першого такого пошуку.
+
+        Args:
+            digits (str): Цифри початку або кінця номера.
+            from_end (bool): Шукати за кінцем номера.
+            limit (int | None): Найбільша кількість номерів (None — без обмеження).
+
+        Returns:
+            Iterator[tuple[str, str]]: Пари (телефон, ім'я контакту) за зростанням
+                номера (для пошуку за кінцем — за зростанням перевернутого номера).
+        """
+        if from_end:
+            if self._phone_suffixes is None:
+                self._phone_suffixes = PrefixIndex(phone[::-1] for phone in self._phone_index)
+            phones = (key[::-1] for key in self._phone_suffixes.iter_prefix(digits[::-1], limit))
+        else:
+            if self._phone_prefixes is None:
+                self._phone_prefixes = PrefixIndex(self._phone_index)
+            phones = self._phone_prefixes.iter_prefix(digits, limit)
+        index = self._phone_index
+        return ((phone, index[phone].name.value) for phone in phones)
 
     def find_record_by_email(self, email: str) -> Record | None:
         """Шукає контакт за email-адресою.
@@ -467,12 +820,21 @@ class AddressBook(UserDict):
         Returns:
             Record | None: Запис контакту або None.
         """
-        target = email.strip().casefold()
-        for record in self.data.values():
-            for em in record.emails:
-                if em.value.casefold() == target:
-                    return record
-        return None
+        return self._email_index.get(email.strip().casefold())
+
+    def find_records_by_domain(self, domain: str) -> list[Record]:
+        """Повертає всі контакти, що мають email у вказаному домені.
+
+        Час роботи пропорційний кількості знайдених контактів, а не розміру книги.
+
+        Args:
+            domain (str): Домен (з '@' на початку або без нього).
+
+        Returns:
+            list[Record]: Контакти в порядку індексації.
+        """
+        key = domain.strip().lstrip("@").casefold()
+        return list(self._domain_index.get(key, ()))
 
     def delete(self, name: str) -> str:
         """Видаляє запис контакту з адресної книги.
@@ -484,50 +846,80 @@ class AddressBook(UserDict):
             str: Повідомлення про результат операції.
         """
         if name in self.data:
-            del self.data[name]
+            del self[name]
             return f"Запис {name} видалено."
-        return f"{name} не знайдено."
+        return Refusal(f"{name} не знайдено.")
 
-    def get_upcomming_birthdays(self) -> list[dict]:
-        """Формує список контактів з днями народження на найближчий тиждень.
+    def birthdays_on(self, day: date) -> list[Record]:
+        """Повертає контакти, чий день народження припадає на вказану дату.
 
-        При цьому:
-        - якщо день народження вже минув у поточному році, він переноситься на наступний;
-        - якщо дата привітання припадає на вихідний, вона переноситься на найближчий понеділок.
+        Переглядається лише кошик календаря для (місяць, день). Народжені
+        29 лютого у невисокосні роки святкують 28 лютого.
+
+        Args:
+            day (date): Дата, для якої шукаються дні народження.
 
         Returns:
-            list[dict]: Відсортований список словників з полями:
-                - name (str): Ім'я контакту;
-                - congrats_date (date): Дата привітання;
-                - birthday (date): Реальна дата народження (без зміни року).
+            list[Record]: Знайдені контакти.
         """
-        today = date.today()
-        horizon = today + timedelta(days=7)
-        upcoming: list[dict] = []
-
-        for record in self.data.values():
-            if not getattr(record, "birthday", None):
-                continue
+        result = list(self._birthday_index.get((day.month, day.day), ()))
+        if day.month == 2 and day.day == 28 and not isleap(day.year):
+            result.extend(self._birthday_index.get((2, 29), ()))
+        return result
 
-            original_birthday = record.birthday.value
+    def birthdays_between(self, first: date, last: date, shift_weekends: bool = False) -> list[dict]:
+        """Повертає дні народження, що припадають на дати від first до last включно.
 
-            birthday_this_year = original_birthday.replace(year=today.year)
-            if birthday_this_year < today:
-                birthday_this_year = birthday_this_year.replace(year=today.year + 1)
+        Переглядаються лише кошики календаря для кожного дня вікна. Народжені
+        29 лютого у невисокосні роки святкують 28 лютого.
 
-            congrats_date = birthday_this_year
-            if congrats_date.weekday() >= 5:
-                days_to_monday = 7 - congrats_date.weekday()
-                congrats_date = congrats_date + timedelta(days=days_to_monday)
+        Args:
+            first (date): Перша дата вікна.
+            last (date): Остання дата вікна (вікно — не довше за MAX_BIRTHDAY_WINDOW днів).
+            shift_weekends (bool): Переносити привітання з вихідних на понеділок;
+                привітання, що після переносу виходять за last, не включаються.
 
-            if today <= congrats_date <= horizon:
-                upcoming.append(
+        Returns:
+            list[dict]: Відсортований за (congrats_date, name) список словників з полями:
+                - name (str): Ім'я контакту;
+                - congrats_date (date): Дата привітання;
+                - birthday (date): Реальна дата народження (без зміни року).
+        """
+        found: list[dict] = []
+        for offset in range((last - first).days + 1):
+            day = first + timedelta(days=offset)
+
+            congrats_date = day
+            if shift_weekends and congrats_date.weekday() >= 5:
+                congrats_date = congrats_date + timedelta(days=7 - congrats_date.weekday())
+                if congrats_date > last:
+                    continue
+
+            for record in self.birthdays_on(day):
+                found.append(
                     {
                         "name": record.name.value,
                         "congrats_date": congrats_date,
-                        "birthday": original_birthday,
+                        "birthday": record.birthday.value,
                     }
                 )
 
-        upcoming.sort(key=lambda x: (x["congrats_date"], x["name"]))
-        return upcoming
+        found.sort(key=lambda x: (x["congrats_date"], x["name"]))
+        return found
+
+    def get_upcomming_birthdays(self, days: int = 7) -> list[dict]:
+        """Формує список контактів з днями народження на найближчі days днів.
+
+        При цьому:
+        - 29 лютого у невисокосний рік вважається 28 лютого;
+        - якщо дата привітання припадає на вихідний, вона переноситься на найближчий понеділок
+          (якщо понеділок ще в межах вікна).
+
+        Args:
+            days (int): Довжина вікна в днях від сьогодні (за замовчуванням тиждень).
+
+        Returns:
+            list[dict]: Див. birthdays_between.
+        """
+        today = date.today()
+        return self.birthdays_between(today, today + timedelta(days=days), shift_weekends=True)
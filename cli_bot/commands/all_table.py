@@ -1,92 +1,140 @@
 """Команди для табличного відображення всіх контактів адресної книги."""
 
+from itertools import chain, islice
+
 from colorama import Fore, Style
 from .decorator import input_error
+from .parser import parse_paging
 
+HEADERS = ["Ім'я", "Телефони", "День народження", "Адреса", "Email"]
 
-@input_error
-def all_table(book):
-    """Формує ASCII-таблицю всіх контактів у форматі, зручному для читання в CLI.
+# Скільки перших рядків переглядається для визначення ширини стовпців.
+WIDTH_SAMPLE_SIZE = 1000
 
-    Для кожного запису адресної книги будує рядок із такими стовпцями:
-    - Ім'я
-    - Телефони (через '; ')
-    - День народження
-    - Адреса
-    - Email (через '; ')
 
-    Таблиця:
-    - має заголовок і роздільник;
-    - ширина кожного стовпця підбирається за максимальним вмістом;
-    - значення в клітинках розфарбовані в magenta (Colorama), заголовки — без кольору.
+def _plain_row(record) -> list[str]:
+    """Формує значення клітинок рядка таблиці для одного запису без кольорів.
 
     Args:
-        book: Екземпляр AddressBook або сумісний об'єкт з атрибутом data (dict ім'я → Record).
+        record: Запис адресної книги (Record або сумісний об'єкт).
 
     Returns:
-        str: Готовий до виведення рядок із таблицею або повідомлення
-            «Немає збережених контактів.», якщо книга порожня.
+        list[str]: Ім'я, телефони, день народження, адреса та email.
     """
-    if not getattr(book, "data", None):
-        return "Немає збережених контактів."
+    name_plain = record.name.value
+
+    if getattr(record, "phones", None):
+        phones_plain = "; ".join(phone.value for phone in record.phones)
+    else:
+        phones_plain = ""
+
+    if getattr(record, "birthday", None):
+        birthday_plain = str(record.birthday)
+    else:
+        birthday_plain = ""
 
-    headers = ["Ім'я", "Телефони", "День народження", "Адреса", "Email"]
+    if getattr(record, "address", None):
+        address_plain = str(record.address)
+    else:
+        address_plain = ""
 
-    rows_plain: list[list[str]] = []
-    rows_colored: list[list[str]] = []
+    if getattr(record, "emails", None):
+        emails_plain = "; ".join(email.value for email in record.emails)
+    else:
+        emails_plain = ""
 
-    for record in book.data.values():
-        name_plain = record.name.value
+    return [name_plain, phones_plain, birthday_plain, address_plain, emails_plain]
 
-        if getattr(record, "phones", None):
-            phones_plain = "; ".join(phone.value for phone in record.phones)
-        else:
-            phones_plain = ""
 
-        if getattr(record, "birthday", None):
-            birthday_plain = str(record.birthday)
-        else:
-            birthday_plain = ""
+def _format_row(row_plain: list[str], col_widths: list[int]) -> str:
+    """Форматує рядок таблиці з кольоровими клітинками фіксованої ширини.
 
-        if getattr(record, "address", None):
-            address_plain = str(record.address)
-        else:
-            address_plain = ""
+    Значення, довші за ширину стовпця, виводяться повністю й зсувають решту
+    рядка праворуч (дані ніколи не обрізаються).
 
-        if getattr(record, "emails", None):
-            emails_plain = "; ".join(email.value for email in record.emails)
-        else:
-            emails_plain = ""
+    Args:
+        row_plain (list[str]): Значення клітинок без кольорів.
+        col_widths (list[int]): Ширина кожного стовпця.
 
-        row_plain = [name_plain, phones_plain, birthday_plain, address_plain, emails_plain]
-        rows_plain.append(row_plain)
+    Returns:
+        str: Готовий рядок таблиці.
+    """
+    cells = []
+    for plain, width in zip(row_plain, col_widths):
+        colored = Fore.MAGENTA + plain + Style.RESET_ALL if plain else ""
+        cells.append(colored + " " * max(width - len(plain), 0))
+    return " | ".join(cells)
+
+
+def iter_table(records, sample_size: int = WIDTH_SAMPLE_SIZE):
+    """Потоково формує рядки ASCII-таблиці для переданих записів.
+
+    Ширина стовпців визначається за обмеженою вибіркою з перших sample_size
+    записів, тому повторного проходу по всій книзі не потрібно: у пам'яті
+    тримається лише вибірка, а решта рядків форматується на льоту. Довші
+    значення з решти рядків не обрізаються, а виходять за межі стовпця.
+
+    Args:
+        records (Iterable): Записи адресної книги.
+        sample_size (int): Кількість записів для визначення ширини стовпців.
 
-        row_colored = [
-            Fore.MAGENTA + name_plain + Style.RESET_ALL if name_plain else "",
-            Fore.MAGENTA + phones_plain + Style.RESET_ALL if phones_plain else "",
-            Fore.MAGENTA + birthday_plain + Style.RESET_ALL if birthday_plain else "",
-            Fore.MAGENTA + address_plain + Style.RESET_ALL if address_plain else "",
-            Fore.MAGENTA + emails_plain + Style.RESET_ALL if emails_plain else "",
-        ]
-        rows_colored.append(row_colored)
+    Yields:
+        str: Заголовок, роздільник і рядки таблиці.
+    """
+    rows = (_plain_row(record) for record in records)
+    sample = list(islice(rows, sample_size))
 
-    col_widths = [len(h) for h in headers]
-    for row in rows_plain:
+    col_widths = [len(h) for h in HEADERS]
+    for row in sample:
         for i, cell in enumerate(row):
             col_widths[i] = max(col_widths[i], len(cell))
 
-    header_line = " | ".join(
-        header.ljust(col_widths[i]) for i, header in enumerate(headers)
-    )
-    separator = "-+-".join("-" * w for w in col_widths)
+    yield " | ".join(header.ljust(col_widths[i]) for i, header in enumerate(HEADERS))
+    yield "-+-".join("-" * w for w in col_widths)
+
+    for row_plain in chain(sample, rows):
+        yield _format_row(row_plain, col_widths)
+
+
+@input_error
+def all_table(args, book):
+    """Формує ASCII-таблицю контактів у форматі, зручному для читання в CLI.
+
+    Формат:
+        all-table [--limit N] [--page N] [--size M]
 
-    lines = [header_line, separator]
+    Для кожного запису адресної книги будує рядок із такими стовпцями:
+    - Ім'я
+    - Телефони (через '; ')
+    - День народження
+    - Адреса
+    - Email (через '; ')
 
-    for row_plain, row_colored in zip(rows_plain, rows_colored):
-        cells = []
-        for i, (plain, colored) in enumerate(zip(row_plain, row_colored)):
-            padding = col_widths[i] - len(plain)
-            cells.append(colored + " " * padding)
-        lines.append(" | ".join(cells))
+    Таблиця:
+    - має заголовок і роздільник;
+    - ширина кожного стовпця підбирається за вибіркою перших записів (див. iter_table);
+    - значення в клітинках розфарбовані в magenta (Colorama), заголовки — без кольору;
+    - виводиться потоково, рядок за рядком.
+
+    Args:
+        args (list[str]): Необов'язкові параметри --limit / --page / --size.
+        book: Екземпляр AddressBook або сумісний об'єкт з атрибутом data (dict ім'я → Record).
+
+    Returns:
+        Iterator[str] | str: Рядки таблиці або повідомлення
+            «Немає збережених контактів.», якщо книга порожня, повідомлення про
+            сторінку за межами книги чи текст помилки.
+    """
+    try:
+        _, offset, size = parse_paging(args)
+    except ValueError as e:
+        return f"Помилка: {e}"
+
+    if not getattr(book, "data", None):
+        return "Немає збережених контактів."
+    total = len(book.data)
+    if offset >= total:
+        return f"На цій сторінці немає контактів (усього контактів: {total})."
 
-    return "\n".join(lines)
+    records = islice(book.data.values(), offset, None if size is None else offset + size)
+    return iter_table(records)
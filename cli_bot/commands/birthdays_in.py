@@ -1,8 +1,12 @@
 """Команди для пошуку днів народження через задану кількість днів."""
 
 from datetime import date, timedelta
+from .address_book import MAX_BIRTHDAY_WINDOW
 from .decorator import input_error
 
+# Наступний день народження завжди не далі, ніж за стільки днів від сьогодні.
+YEAR_DAYS = 365
+
 
 def _days_word(n: int) -> str:
     """Повертає коректну словоформу слова «день» для української мови.
@@ -29,20 +33,59 @@ def _days_word(n: int) -> str:
     return "днів"
 
 
+def _birthdays_in_range(book, first_days: int, last_days: int) -> str:
+    """Формує перелік днів народження через first_days..last_days днів.
+
+    Args:
+        book: Екземпляр AddressBook (метод birthdays_between).
+        first_days (int): Початок вікна в днях від сьогодні.
+        last_days (int): Кінець вікна в днях від сьогодні (включно).
+
+    Returns:
+        str: По рядку на кожну дату з іменами або повідомлення про відсутність збігів.
+    """
+    today = date.today()
+    found = book.birthdays_between(
+        today + timedelta(days=first_days), today + timedelta(days=last_days)
+    )
+    if not found:
+        return (
+            f"Немає контактів з днем народження через {first_days}..{last_days} "
+            f"{_days_word(last_days)}."
+        )
+
+    lines = []
+    names: list[str] = []
+    for i, item in enumerate(found):
+        names.append(item["name"])
+        day = item["congrats_date"]
+        if i + 1 < len(found) and found[i + 1]["congrats_date"] == day:
+            continue
+        days = (day - today).days
+        lines.append(f"{day:%d.%m.%Y} (через {days} {_days_word(days)}): {', '.join(names)}")
+        names = []
+    return "\n".join(lines)
+
+
 @input_error
 def birthdays_in(args, book):
     """Шукає контакти, у яких день народження буде через вказану кількість днів.
 
-    Команда очікує один аргумент — кількість днів від сьогоднішньої дати.
-    Підтримується тільки невід’ємне ціле число.
+    Команда очікує один аргумент — кількість днів від сьогоднішньої дати
+    (невід’ємне ціле число) або діапазон A..B, не довший за MAX_BIRTHDAY_WINDOW днів.
 
     Логіка:
-    - для кожного контакту з днем народження обчислюється наступна дата його ДН;
-    - якщо наступна дата ДН рівно через N днів від сьогодні — контакт додається до результату.
+    - обчислюється цільова дата (сьогодні + N днів);
+    - з календарного індексу книги беруться контакти, чий день народження
+      припадає на цю дату (29 лютого у невисокосний рік — на 28 лютого);
+    - як і раніше, враховується лише наступний день народження: якщо до
+      цільової дати він уже буде (N ≥ 365), контакт не виводиться, тож для
+      N > 365 збігів немає;
+    - для діапазону контакти групуються за датами (метод birthdays_between).
 
     Args:
-        args (list[str]): Список аргументів командного рядка; args[0] — кількість днів.
-        book: Екземпляр AddressBook з атрибутом data (dict ім'я → Record).
+        args (list[str]): Список аргументів командного рядка; args[0] — кількість днів або A..B.
+        book: Екземпляр AddressBook (методи birthdays_on і birthdays_between).
 
     Returns:
         str: Текстове повідомлення з переліком імен або повідомлення про відсутність збігів,
@@ -51,11 +94,23 @@ def birthdays_in(args, book):
     if len(args) != 1:
         return (
             "Помилка: команда 'birthdays-in' очікує рівно 1 аргумент:\n"
-            "birthdays-in <кількість_днів>"
+            "birthdays-in <кількість_днів> або birthdays-in <від>..<до>"
         )
 
     days_str = args[0]
 
+    if ".." in days_str:
+        first_str, _, last_str = days_str.partition("..")
+        try:
+            first_days, last_days = int(first_str), int(last_str)
+        except ValueError:
+            return "Помилка: діапазон днів має бути у форматі <від>..<до>, наприклад 0..90."
+        if first_days < 0 or last_days < first_days:
+            return "Помилка: діапазон днів має бути невід'ємним і не спадати (наприклад 0..90)."
+        if last_days - first_days > MAX_BIRTHDAY_WINDOW:
+            return f"Помилка: діапазон не може бути довшим за {MAX_BIRTHDAY_WINDOW} днів."
+        return _birthdays_in_range(book, first_days, last_days)
+
     try:
         days = int(days_str)
     except ValueError:
@@ -67,21 +122,17 @@ def birthdays_in(args, book):
     today = date.today()
     target_date = today + timedelta(days=days)
 
-    matches: list[str] = []
-
-    for record in book.data.values():
-        birthday_field = getattr(record, "birthday", None)
-        if not birthday_field:
-            continue
-
-        bday = birthday_field.value
-
-        next_bday = bday.replace(year=today.year)
-        if next_bday < today:
-            next_bday = next_bday.replace(year=today.year + 1)
-
-        if next_bday == target_date:
-            matches.append(record.name.value)
+    if days > YEAR_DAYS:
+        matches = []
+    else:
+        matches = [record.name.value for record in book.birthdays_on(target_date)]
+    if days == YEAR_DAYS and matches:
+        # Рівно за рік: день народження міг бути вже сьогодні чи завтра (29 лютого).
+        earlier = {
+            item["name"]
+            for item in book.birthdays_between(today, target_date - timedelta(days=1))
+        }
+        matches = [name for name in matches if name not in earlier]
 
     if not matches:
         return (
@@ -0,0 +1,702 @@
+"""Стовпцева (columnar) адресна книга для мільйонів контактів.
+
+ColumnarAddressBook зберігає контакти не як об'єкти Record, а як кілька
+суцільних буферів, по рядку на контакт:
+- імена — список рядків і словник ім'я → номер рядка;
+- телефони — 64-бітні цілі (array('q')) зі зміщеннями рядків;
+- дні народження — порядкові номери дат (date.toordinal) і коди «місяць-день»;
+- email та адреси — байти UTF-8 у спільних bytearray зі зміщеннями рядків.
+
+Команди працюють із нею як зі звичайною AddressBook: звернення за іменем
+повертає Record-представлення, зібране зі стовпців. Видані представлення
+запам'ятовуються, а після кожної команди (release_views) змінені з них
+записуються назад. Пошук за телефоном, email, доменом і днем народження —
+прохід по буферу на рівні C (re по байтах стовпців) без створення
+об'єктів для кожного контакту: значення шукається як послідовність байтів
+у буфері стовпця, а знайдене зміщення перевіряється на вирівнювання.
+
+Змінений контакт дописується в кінець стовпців, а старий рядок
+позначається порожнім; коли порожніх рядків більше, ніж живих,
+стовпці перебудовуються. Кожен рядок пам'ятає порядковий номер
+додавання контакту, тож результати пошуку не залежать від того,
+котрий контакт змінювали останнім.
+
+Якщо встановлено NumPy, вікна днів народження (birthdays N, birthdays-in A..B)
+обчислюються векторно над стовпцем «місяць-день»: найближчі дати святкування,
+перенос привітань із вихідних і маска вікна. Без NumPy — одним проходом
+по тому самому стовпцю. Звичайна AddressBook векторизації не потребує: її
+календарний індекс уже групує контакти за днями, і вікно — це не більше
+367 звертань до словника, а не прохід по всіх контактах.
+
+Вмикається змінною середовища CLI_BOT_BOOK_LAYOUT=columnar (режими pickle і journal).
+"""
+
+import re
+from array import array
+from bisect import bisect_left, bisect_right
+from calendar import isleap
+from collections.abc import MutableMapping
+from heapq import merge
+from itertools import islice
+from datetime import date, timedelta
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - NumPy необов'язковий
+    np = None
+
+from .address_book import AddressBook, Record, Name, Phone, Email, Address, Birthday, _field
+
+# Стовпці перебудовуються, коли порожніх рядків щонайменше стільки й більше, ніж живих.
+COMPACT_MIN_DEAD = 1024
+
+# Відсортовані індекси телефонів перебудовуються, коли після побудови
+# дописано більше стількох номерів (до того нові номери перевіряються проходом).
+PHONE_INDEX_TAIL = 4096
+
+
+def _reversed_phone(number: int) -> int:
+    """Повертає число з десяти цифр номера у зворотному порядку (перетворення оборотне)."""
+    return int(f"{number:010d}"[::-1])
+
+
+def _md_code(month: int, day: int) -> int:
+    """Кодує (місяць, день) одним числом для стовпця днів народження."""
+    return month * 32 + day
+
+
+def _positions(column: array, value: int):
+    """Знаходить індекси елементів стовпця, рівних value.
+
+    Пошук іде по байтах буфера стовпця (re з літеральним шаблоном працює
+    на рівні C), а збіги, що не вирівняні на розмір елемента, пропускаються.
+
+    Args:
+        column (array): Стовпець.
+        value (int): Шукане значення.
+
+    Yields:
+        int: Індекси елементів у порядку зростання.
+    """
+    pattern = re.compile(re.escape(array(column.typecode, [value]).tobytes()))
+    size = column.itemsize
+    position = 0
+    while (match := pattern.search(column, position)) is not None:
+        start = match.start()
+        if start % size:
+            position = start + 1
+            continue
+        yield start // size
+        position = start + size
+
+
+def _window_tables(first: date, last: date, shift_weekends: bool):
+    """Обчислює для кожного коду «місяць-день» дати привітань у вікні [first, last].
+
+    Вікно не довше за рік і день, тож у кожного дня народження щонайбільше
+    два святкування: перше й друге після first. 29 лютого у невисокосний рік
+    святкується 28 лютого.
+
+    Args:
+        first (date): Перша дата вікна.
+        last (date): Остання дата вікна.
+        shift_weekends (bool): Переносити привітання з вихідних на понеділок.
+
+    Returns:
+        tuple[numpy.ndarray, numpy.ndarray]: Дві таблиці довжиною 13 * 32,
+            індексовані _md_code: дата привітання (date.toordinal) для першого
+            й другого святкування або 0, якщо воно не потрапляє у вікно.
+    """
+    tables = np.zeros((2, 13 * 32), dtype=np.int64)
+    day = date(2000, 1, 1)  # високосний рік містить усі коди
+    while day.year == 2000:
+        month, dom = day.month, day.day
+        found = 0
+        for year in range(first.year, first.year + 3):
+            if month == 2 and dom == 29 and not isleap(year):
+                occurrence = date(year, 2, 28)
+            else:
+                occurrence = date(year, month, dom)
+            if occurrence < first:
+                continue
+            congrats = occurrence
+            if shift_weekends and congrats.weekday() >= 5:
+                congrats += timedelta(days=7 - congrats.weekday())
+            if congrats <= last:
+                tables[found, _md_code(month, dom)] = congrats.toordinal()
+            found += 1
+            if found == 2:
+                break
+        day += timedelta(days=1)
+    return tables[0], tables[1]
+
+
+def _birthday_window(md_codes, first: date, last: date, shift_weekends: bool):
+    """Векторно знаходить святкування днів народження у вікні [first, last].
+
+    Дати привітань обчислюються один раз для кожного коду «місяць-день»
+    (_window_tables), а для контактів лишається вибірка з таблиць за
+    стовпцем кодів і відбір ненульових рядків — без об'єктів date.
+
+    Args:
+        md_codes (numpy.ndarray): Стовпець кодів «місяць-день» (0 — немає дати).
+        first (date): Перша дата вікна.
+        last (date): Остання дата вікна.
+        shift_weekends (bool): Переносити привітання з вихідних на понеділок.
+
+    Returns:
+        tuple: (номери рядків, дати привітання як date.toordinal) — масиви numpy.
+    """
+    found_rows, found_congrats = [], []
+    for table in _window_tables(first, last, shift_weekends):
+        congrats = table[md_codes]
+        rows = np.flatnonzero(congrats)
+        found_rows.append(rows)
+        found_congrats.append(congrats[rows])
+    return np.concatenate(found_rows), np.concatenate(found_congrats)
+
+
+class ColumnarContacts(MutableMapping):
+    """Відображення ім'я → Record поверх стовпців (див. опис модуля)."""
+
+    def __init__(self):
+        """Створює порожні стовпці."""
+        self._reset_columns()
+        self._views: dict[str, Record] = {}
+
+    def _reset_columns(self) -> None:
+        """Створює порожні стовпці та словник імен."""
+        self._names: list[str | None] = []
+        self._rows: dict[str, int] = {}
+        self._seq = array("q")
+        self._next_seq = 0
+        self._phones = array("q")
+        self._phone_off = array("q", [0])
+        self._birthdays = array("i")
+        self._birthday_md = array("H")
+        self._emails = bytearray()
+        self._email_off = array("q", [0])
+        self._addresses = bytearray()
+        self._address_off = array("q", [0])
+        self._dead = 0
+        self._phone_order = None
+
+    def __getstate__(self):
+        """Повертає для pickle стовпці лише з живими рядками (без представлень і словника імен)."""
+        self.sync()
+        source = self._compacted() if self._dead else self
+        state = source.__dict__.copy()
+        del state["_rows"], state["_views"], state["_phone_order"]
+        return state
+
+    def __setstate__(self, state):
+        """Відновлює стовпці з pickle та перебудовує словник імен."""
+        self.__dict__.update(state)
+        self._rows = {name: row for row, name in enumerate(self._names) if name is not None}
+        self._views = {}
+        self._phone_order = None
+
+    @staticmethod
+    def _encode(record: Record) -> tuple:
+        """Перетворює запис на значення рядка: (телефони, день народження, email, адреса)."""
+        birthday = record.birthday.value if record.birthday is not None else None
+        return (
+            array("q", [int(phone.value) for phone in record.phones]),
+            birthday.toordinal() if birthday else 0,
+            b"".join(email.value.encode() + b"\n" for email in record.emails),
+            record.address.value.encode() if record.address is not None else b"",
+        )
+
+    def _row_values(self, row: int) -> tuple:
+        """Повертає значення рядка у форматі _encode."""
+        return (
+            self._phones[self._phone_off[row]:self._phone_off[row + 1]],
+            self._birthdays[row],
+            bytes(self._emails[self._email_off[row]:self._email_off[row + 1]]),
+            bytes(self._addresses[self._address_off[row]:self._address_off[row + 1]]),
+        )
+
+    def _append(self, name: str, values: tuple, seq: int | None = None) -> int:
+        """Дописує рядок у кінець стовпців і пов'язує з ним ім'я.
+
+        Args:
+            name (str): Ім'я контакту.
+            values (tuple): Значення рядка у форматі _encode.
+            seq (int | None): Порядковий номер контакту (None — новий контакт).
+
+        Returns:
+            int: Номер нового рядка.
+        """
+        phones, ordinal, emails, address = values
+        row = len(self._names)
+        self._names.append(name)
+        if seq is None:
+            seq = self._next_seq
+            self._next_seq += 1
+        self._seq.append(seq)
+        self._phones.extend(phones)
+        self._phone_off.append(len(self._phones))
+        self._birthdays.append(ordinal)
+        if ordinal:
+            birthday = date.fromordinal(ordinal)
+            self._birthday_md.append(_md_code(birthday.month, birthday.day))
+        else:
+            self._birthday_md.append(0)
+        self._emails += emails
+        self._email_off.append(len(self._emails))
+        self._addresses += address
+        self._address_off.append(len(self._addresses))
+        self._rows[name] = row
+        return row
+
+    def _kill(self, row: int) -> None:
+        """Позначає рядок порожнім (його дані прибере наступна перебудова)."""
+        self._names[row] = None
+        self._dead += 1
+
+    def _compacted(self) -> "ColumnarContacts":
+        """Повертає нові стовпці лише з живими рядками в порядку словника імен.
+
+        Порядок словника збігається з порядком номерів додавання, тому
+        нумерація додавання починається заново без зміни порядку.
+        """
+        fresh = ColumnarContacts()
+        for name, row in self._rows.items():
+            fresh._append(name, self._row_values(row))
+        return fresh
+
+    def _maybe_compact(self) -> None:
+        """Перебудовує стовпці, коли порожні рядки переважають."""
+        if self._dead >= COMPACT_MIN_DEAD and self._dead > len(self._rows):
+            views = self._views
+            self.__dict__.update(self._compacted().__dict__)
+            self._views = views
+
+    def _view(self, row: int) -> Record:
+        """Збирає Record-представлення рядка."""
+        phones = self._phones[self._phone_off[row]:self._phone_off[row + 1]]
+        ordinal = self._birthdays[row]
+        emails = self._emails[self._email_off[row]:self._email_off[row + 1]].decode()
+        address = self._addresses[self._address_off[row]:self._address_off[row + 1]].decode()
+        record = Record.__new__(Record)
+        record.__setstate__((
+            _field(Name, self._names[row]),
+            [_field(Phone, f"{phone:010d}") for phone in phones],
+            _field(Birthday, date.fromordinal(ordinal)) if ordinal else None,
+            _field(Address, address) if address else None,
+            [_field(Email, email) for email in emails.split("\n")[:-1]],
+        ))
+        return record
+
+    def __getitem__(self, name):
+        view = self._views.get(name)
+        if view is None:
+            view = self._views[name] = self._view(self._rows[name])
+        return view
+
+    def __setitem__(self, name, record):
+        old = self._rows.get(name)
+        self._append(name, self._encode(record), None if old is None else self._seq[old])
+        if old is not None:
+            self._kill(old)
+        self._views[name] = record
+        self._maybe_compact()
+
+    def __delitem__(self, name):
+        self._kill(self._rows.pop(name))
+        self._views.pop(name, None)
+        self._maybe_compact()
+
+    def __contains__(self, name):
+        return name in self._rows
+
+    def __iter__(self):
+        return iter(self._rows)
+
+    def __len__(self):
+        return len(self._rows)
+
+    def values(self):
+        """Повертає генератор представлень у порядку додавання.
+
+        Представлення не запам'ятовуються, тож прохід по всій книзі не
+        накопичує об'єкти; змінювати записи слід через звернення за іменем.
+        """
+        return (self._views.get(name) or self._view(row) for name, row in self._rows.items())
+
+    def items(self):
+        """Повертає генератор пар (ім'я, представлення) у порядку додавання."""
+        return ((name, self._views.get(name) or self._view(row)) for name, row in self._rows.items())
+
+    def sync(self) -> None:
+        """Записує у стовпці представлення, змінені «на місці» (наприклад, Record.add_phone)."""
+        for name, record in self._views.items():
+            row = self._rows.get(name)
+            if row is None:
+                continue
+            values = self._encode(record)
+            if values != self._row_values(row):
+                self._append(name, values, self._seq[row])
+                self._kill(row)
+        self._maybe_compact()
+
+    def release_views(self) -> None:
+        """Записує зміни представлень і забуває їх (викликається після кожної команди)."""
+        self.sync()
+        self._views.clear()
+
+    def _live_rows(self, rows) -> list[int]:
+        """Відкидає порожні рядки та впорядковує решту за порядком додавання контактів."""
+        names = self._names
+        return sorted(dict.fromkeys(row for row in rows if names[row] is not None),
+                      key=self._seq.__getitem__)
+
+    def rows_with_phone(self, number: int) -> list[int]:
+        """Знаходить рядки з указаним номером телефону.
+
+        Args:
+            number (int): Номер телефону як ціле число.
+
+        Returns:
+            list[int]: Номери живих рядків у порядку додавання контактів.
+        """
+        offsets = self._phone_off
+        return self._live_rows(
+            bisect_right(offsets, position) - 1 for position in _positions(self._phones, number)
+        )
+
+    def _phone_rows(self, start: int = 0) -> array:
+        """Повертає номери рядків для позицій стовпця телефонів, починаючи зі start."""
+        rows = array("q")
+        offsets = self._phone_off
+        for row in range(bisect_right(offsets, start) - 1, len(self._names)):
+            rows.extend([row] * (offsets[row + 1] - max(offsets[row], start)))
+        return rows
+
+    def _phone_indexes(self) -> tuple:
+        """Повертає відсортовані індекси телефонів, за потреби перебудовуючи їх.
+
+        Індекс — пара масивів (ключі за зростанням, номери рядків): ключ —
+        номер телефону або число з його цифр у зворотному порядку. Порожні
+        рядки лишаються в індексі й відкидаються під час пошуку, тож індекс
+        перебудовується лише після перебудови стовпців або коли дописаних
+        після нього номерів більше за PHONE_INDEX_TAIL.
+
+        Returns:
+            tuple: (кількість проіндексованих позицій, індекс за номером,
+                індекс за зворотними цифрами).
+        """
+        order = self._phone_order
+        if order is not None and len(self._phones) - order[0] <= PHONE_INDEX_TAIL:
+            return order
+        numbers = self._phones.tolist()
+        rows = self._phone_rows()
+        indexes = []
+        for keys in (numbers, [_reversed_phone(number) for number in numbers]):
+            positions = sorted(range(len(keys)), key=keys.__getitem__)
+            indexes.append((array("q", [keys[i] for i in positions]), array("q", [rows[i] for i in positions])))
+        self._phone_order = (len(numbers), *indexes)
+        return self._phone_order
+
+    def phones_in_range(self, low: int, high: int, from_end: bool = False):
+        """Знаходить телефони, ключ яких лежить у проміжку [low, high).
+
+        Args:
+            low (int): Нижня межа ключа (включно).
+            high (int): Верхня межа ключа (не включно).
+            from_end (bool): Ключ — цифри номера у зворотному порядку.
+
+        Returns:
+            Iterator[tuple[int, int, int]]: (ключ, номер телефону, номер рядка)
+                живих рядків за зростанням ключа.
+        """
+        indexed, by_number, by_reversed = self._phone_indexes()
+        keys, rows = by_reversed if from_end else by_number
+        names = self._names
+        key_of = _reversed_phone if from_end else int
+        tail = sorted(
+            (key, number, row)
+            for number, row in zip(self._phones[indexed:], self._phone_rows(indexed))
+            if low <= (key := key_of(number)) < high and names[row] is not None
+        )
+
+        def indexed_matches():
+            for i in range(bisect_left(keys, low), bisect_left(keys, high)):
+                row = rows[i]
+                if names[row] is not None:
+                    key = keys[i]
+                    yield key, _reversed_phone(key) if from_end else key, row
+
+        return merge(indexed_matches(), tail)
+
+    def rows_matching_email(self, pattern: re.Pattern) -> list[int]:
+        """Знаходить рядки, email яких відповідає шаблону.
+
+        Args:
+            pattern (re.Pattern): Байтовий шаблон у режимі MULTILINE (email розділені «\\n»).
+
+        Returns:
+            list[int]: Номери живих рядків у порядку додавання контактів.
+        """
+        offsets = self._email_off
+        return self._live_rows(
+            bisect_right(offsets, match.start()) - 1 for match in pattern.finditer(self._emails)
+        )
+
+    def rows_with_birthday(self, month: int, day: int) -> list[int]:
+        """Знаходить рядки з днем народження в указаний день року.
+
+        Args:
+            month (int): Місяць.
+            day (int): День.
+
+        Returns:
+            list[int]: Номери живих рядків у порядку додавання контактів.
+        """
+        return self._live_rows(_positions(self._birthday_md, _md_code(month, day)))
+
+
+class ColumnarAddressBook(AddressBook):
+    """Адресна книга поверх стовпців ColumnarContacts.
+
+    Індекси звичайної книги (телефон, email, домен, календар) не потрібні:
+    їх замінюють проходи по стовпцях. Підтримується лише BK-дерево імен.
+    """
+
+    def __init__(self):
+        """Створює порожню стовпцеву книгу."""
+        super().__init__()
+        self.data = ColumnarContacts()
+
+    @classmethod
+    def from_book(cls, book: AddressBook) -> "ColumnarAddressBook":
+        """Перетворює звичайну адресну книгу на стовпцеву.
+
+        Args:
+            book (AddressBook): Книга з об'єктами Record.
+
+        Returns:
+            ColumnarAddressBook: Книга з тими самими контактами в тому ж порядку.
+        """
+        columnar = cls()
+        for name, record in book.data.items():
+            columnar.data._append(name, ColumnarContacts._encode(record))
+        return columnar
+
+    def to_book(self) -> AddressBook:
+        """Перетворює стовпцеву книгу на звичайну AddressBook.
+
+        Returns:
+            AddressBook: Книга з об'єктами Record у тому ж порядку.
+        """
+        self.data.sync()
+        book = AddressBook()
+        for name, record in self.data.items():
+            book[name] = record
+        return book
+
+    def rebuild_indexes(self) -> None:
+        """Скидає індекси: стовпцям вони не потрібні, а дерево імен будується на вимогу."""
+        self._reset_indexes()
+
+    def _attach(self, record: Record) -> None:
+        """Оновлює лише індекси імен (підказки та префікси): роль інших індексів виконують проходи по стовпцях."""
+        self._index_name(record.name.value)
+
+    def _detach(self, record: Record) -> None:
+        """Оновлює лише індекси імен (підказки та префікси): роль інших індексів виконують проходи по стовпцях."""
+        self._unindex_name(record.name.value)
+
+    def release_views(self) -> None:
+        """Записує у стовпці зміни виданих записів (викликається після кожної команди)."""
+        self.data.release_views()
+
+    def add_records(self, records) -> None:
+        """Дописує пакет нових записів прямо в стовпці, без представлень (масовий імпорт).
+
+        Args:
+            records (Iterable[Record]): Нові записи з унікальними іменами.
+        """
+        data = self.data
+        for record in records:
+            name = record.name.value
+            data._append(name, ColumnarContacts._encode(record))
+            self._index_name(name)
+
+    def known_phones(self) -> set[str]:
+        """Повертає номери телефонів усіх живих рядків (див. AddressBook.known_phones)."""
+        data = self.data
+        data.sync()
+        phones, offsets = data._phones, data._phone_off
+        return {
+            f"{phones[i]:010d}"
+            for row in data._rows.values()
+            for i in range(offsets[row], offsets[row + 1])
+        }
+
+    def known_emails(self) -> set[str]:
+        """Повертає email у casefold усіх живих рядків (див. AddressBook.known_emails)."""
+        data = self.data
+        data.sync()
+        emails, offsets = data._emails, data._email_off
+        return {
+            email
+            for row in data._rows.values()
+            for email in emails[offsets[row]:offsets[row + 1]].decode().casefold().split("\n")[:-1]
+        }
+
+    def _records(self, rows) -> list[Record]:
+        """Повертає представлення для номерів рядків."""
+        names = self.data._names
+        return [self.data[names[row]] for row in rows]
+
+    def find_record_by_phone(self, phone: str) -> Record | None:
+        """Шукає контакт за номером телефону проходом по стовпцю телефонів.
+
+        Args:
+            phone (str): Номер телефону для пошуку.
+
+        Returns:
+            Record | None: Перший знайдений запис або None.
+        """
+        phone = phone.strip()
+        if not phone.isdigit() or len(phone) != 10:
+            return None
+        self.data.sync()
+        rows = self.data.rows_with_phone(int(phone))
+        return self._records(rows[:1])[0] if rows else None
+
+    def find_phones(self, digits: str, from_end: bool = False, limit: int | None = None):
+        """Знаходить телефони за початком або кінцем номера (див. AddressBook.find_phones).
+
+        Цифри задають проміжок ключів у відсортованих індексах стовпця
+        телефонів (ColumnarContacts.phones_in_range).
+
+        Args:
+            digits (str): Цифри початку або кінця номера.
+            from_end (bool): Шукати за кінцем номера.
+            limit (int | None): Найбільша кількість номерів (None — без обмеження).
+
+        Returns:
+            Iterator[tuple[str, str]]: Пари (телефон, ім'я контакту).
+        """
+        self.data.sync()
+        scale = 10 ** (10 - len(digits))
+        key = int(digits[::-1] if from_end else digits)
+        matches = self.data.phones_in_range(key * scale, (key + 1) * scale, from_end)
+        names = self.data._names
+        return islice(((f"{number:010d}", names[row]) for _, number, row in matches), limit)
+
+    def find_record_by_email(self, email: str) -> Record | None:
+        """Шукає контакт за email проходом по буферу email.
+
+        Args:
+            email (str): Email для пошуку (без урахування регістру).
+
+        Returns:
+            Record | None: Запис контакту або None.
+        """
+        try:
+            key = email.strip().encode("ascii")
+        except UnicodeEncodeError:
+            return None
+        self.data.sync()
+        pattern = re.compile(rb"^" + re.escape(key) + rb"$", re.MULTILINE | re.IGNORECASE)
+        rows = self.data.rows_matching_email(pattern)
+        return self._records(rows[:1])[0] if rows else None
+
+    def find_records_by_domain(self, domain: str) -> list[Record]:
+        """Повертає контакти з email у вказаному домені проходом по буферу email.
+
+        Args:
+            domain (str): Домен (з '@' на початку або без нього).
+
+        Returns:
+            list[Record]: Контакти в порядку додавання.
+        """
+        try:
+            key = domain.strip().lstrip("@").encode("ascii")
+        except UnicodeEncodeError:
+            return []
+        self.data.sync()
+        pattern = re.compile(rb"@" + re.escape(key) + rb"$", re.MULTILINE | re.IGNORECASE)
+        return self._records(self.data.rows_matching_email(pattern))
+
+    def birthdays_on(self, day: date) -> list[Record]:
+        """Повертає контакти з днем народження на вказану дату проходом по стовпцю днів народження.
+
+        Args:
+            day (date): Дата, для якої шукаються дні народження.
+
+        Returns:
+            list[Record]: Знайдені контакти.
+        """
+        self.data.sync()
+        rows = self.data.rows_with_birthday(day.month, day.day)
+        if day.month == 2 and day.day == 28 and not isleap(day.year):
+            rows += self.data.rows_with_birthday(2, 29)
+        return self._records(rows)
+
+    def _rows_in_window(self, first: date, last: date, shift_weekends: bool):
+        """Знаходить святкування у вікні без NumPy: один прохід по стовпцю «місяць-день».
+
+        Args:
+            first (date): Перша дата вікна.
+            last (date): Остання дата вікна.
+            shift_weekends (bool): Переносити привітання з вихідних на понеділок.
+
+        Returns:
+            list[tuple[int, date]]: Пари (номер рядка, дата привітання).
+        """
+        by_day: dict[int, list[int]] = {}
+        for row, code in enumerate(self.data._birthday_md):
+            if code:
+                by_day.setdefault(code, []).append(row)
+        found = []
+        for offset in range((last - first).days + 1):
+            day = first + timedelta(days=offset)
+            congrats = day
+            if shift_weekends and day.weekday() >= 5:
+                congrats = day + timedelta(days=7 - day.weekday())
+                if congrats > last:
+                    continue
+            rows = by_day.get(_md_code(day.month, day.day), [])
+            if day.month == 2 and day.day == 28 and not isleap(day.year):
+                rows = rows + by_day.get(_md_code(2, 29), [])
+            found.extend((row, congrats) for row in rows)
+        return found
+
+    def birthdays_between(self, first: date, last: date, shift_weekends: bool = False) -> list[dict]:
+        """Повертає дні народження у вікні від first до last включно (див. AddressBook).
+
+        З NumPy вікно обчислюється векторно (_birthday_window), без нього — одним проходом по стовпцю «місяць-день».
+        Записи-представлення не створюються: результат будується зі стовпців.
+
+        Args:
+            first (date): Перша дата вікна.
+            last (date): Остання дата вікна.
+            shift_weekends (bool): Переносити привітання з вихідних на понеділок.
+
+        Returns:
+            list[dict]: Відсортований за (congrats_date, name) список словників
+                з полями name, congrats_date і birthday.
+        """
+        self.data.sync()
+        if np is not None:
+            md_codes = np.frombuffer(self.data._birthday_md, dtype=np.uint16)
+            rows, congrats = _birthday_window(md_codes, first, last, shift_weekends)
+            window = zip(rows.tolist(), map(date.fromordinal, congrats.tolist()))
+        else:
+            window = self._rows_in_window(first, last, shift_weekends)
+        names, ordinals = self.data._names, self.data._birthdays
+        found = [
+            {
+                "name": names[row],
+                "congrats_date": congrats_date,
+                "birthday": date.fromordinal(int(ordinals[row])),
+            }
+            for row, congrats_date in window
+            if names[row] is not None
+        ]
+        found.sort(key=lambda x: (x["congrats_date"], x["name"]))
+        return found
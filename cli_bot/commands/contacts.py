@@ -2,11 +2,15 @@
 
 Містить обробники команд:
 - add, change, phone, all, add-birthday, show-birthday,
-  add-address, add-email, delete, email, name, birthdays.
+  add-address, add-email, delete, email, domain, name, prefix, find-phone, birthdays.
 """
 
-from .decorator import input_error
-from .address_book import Record
+from itertools import chain, islice
+
+from .decorator import Refusal, input_error
+from .address_book import MAX_BIRTHDAY_WINDOW, Record
+from .birthdays_in import _days_word
+from .parser import parse_paging
 
 
 def add_contact(args, book):
@@ -18,7 +22,8 @@ def add_contact(args, book):
     Логіка:
     - якщо контакту з таким ім'ям немає — створюється новий запис Record;
     - номер телефону попередньо перевіряється через Record.add_phone;
-    - якщо номер уже використовується іншим контактом — повертається повідомлення про конфлікт.
+    - якщо номер уже використовується іншим контактом — повертається повідомлення про конфлікт;
+    - невірний або вже наявний у контакті номер нічого не змінює (відповідь — Refusal).
 
     Args:
         args (list[str]): Список аргументів командного рядка (ім'я та телефон).
@@ -35,18 +40,18 @@ def add_contact(args, book):
     existing_owner = book.find_record_by_phone(phone)
 
     if existing_owner and (record is None or existing_owner.name.value != record.name.value):
-        return f"Номер {phone} вже використовується контактом '{existing_owner.name.value}'."
+        return Refusal(f"Номер {phone} вже використовується контактом '{existing_owner.name.value}'.")
 
     if not record:
         temp_record = Record(name)
         phone_result = temp_record.add_phone(phone)
-        if "Невірний номер" in phone_result:
+        if isinstance(phone_result, Refusal):
             return phone_result
         book.add_record(temp_record)
         return f"Контакт додано. {phone_result}"
 
     phone_result = record.add_phone(phone)
-    if "Невірний номер" in phone_result:
+    if isinstance(phone_result, Refusal):
         return phone_result
 
     return f"Контакт оновлено. {phone_result}"
@@ -78,43 +83,43 @@ def change_contact(args, book):
     params = args[2:]
     record = book.find(name)
     if not record:
-        return 'Контакту не було знайдено.'
+        return Refusal('Контакту не було знайдено.')
 
     if subcommand == "name":
         if not params:
-            return "Формат: change <ім'я> name <нове_ім'я>."
+            return Refusal("Формат: change <ім'я> name <нове_ім'я>.")
         return record.change_name(book, params[0])
 
     if subcommand == "phone":
         if len(params) < 2:
-            return "Формат: change <ім'я> phone <старий_номер> <новий_номер>."
+            return Refusal("Формат: change <ім'я> phone <старий_номер> <новий_номер>.")
         old_phone, new_phone = params[0], params[1]
         owner = book.find_record_by_phone(new_phone)
         if owner and owner.name.value != record.name.value:
-            return f"Номер {new_phone} вже використовується контактом '{owner.name.value}'."
+            return Refusal(f"Номер {new_phone} вже використовується контактом '{owner.name.value}'.")
         return record.edit_phone(old_phone, new_phone)
 
     if subcommand == "email":
         if len(params) < 2:
-            return "Формат: change <ім'я> email <старий_email> <новий_email>."
+            return Refusal("Формат: change <ім'я> email <старий_email> <новий_email>.")
         old_email, new_email = params[0], params[1]
         owner = book.find_record_by_email(new_email)
         if owner and owner.name.value != record.name.value:
-            return f"Email {new_email} вже використовується контактом '{owner.name.value}'."
+            return Refusal(f"Email {new_email} вже використовується контактом '{owner.name.value}'.")
         return record.edit_email(old_email, new_email)
 
     if subcommand == "address":
         if not params:
-            return "Будь ласка, введіть нову адресу."
+            return Refusal("Будь ласка, введіть нову адресу.")
         return record.change_address(" ".join(params))
 
     if subcommand == "birthday":
         if not params:
-            return "Формат: change <ім'я> birthday <DD.MM.YYYY>."
+            return Refusal("Формат: change <ім'я> birthday <DD.MM.YYYY>.")
         return record.change_birthday(params[0])
 
     else:
-        return "Невідома підкоманда. Доступні: name, phone, address, birthday, email."
+        return Refusal("Невідома підкоманда. Доступні: name, phone, address, birthday, email.")
 
 
 @input_error
@@ -149,20 +154,34 @@ def show_phone(args, book):
 
 
 @input_error
-def show_all(book):
-    """Повертає всі контакти у вигляді списку рядків.
+def show_all(args, book):
+    """Повертає генератор рядків із контактами для потокового виводу.
+
+    Формат:
+        all [--page N] [--size M]
 
-    Використовує метод __str__ кожного Record.
+    Використовує метод __str__ кожного Record; контакти форматуються лише
+    тоді, коли вивід доходить до них, тож перші рядки з'являються одразу.
+    Сторінка за межами книги перевіряється до початку виводу.
 
     Args:
+        args (list[str]): Необов'язкові параметри посторінкового виводу.
         book: Екземпляр AddressBook.
 
     Returns:
-        str: Усі контакти, розділені переносами рядків, або повідомлення про відсутність записів.
+        Iterator[str] | str: Рядки контактів або повідомлення про відсутність записів чи помилку.
     """
+    try:
+        _, offset, size = parse_paging(args)
+    except ValueError as e:
+        return f"Помилка: {e}"
     if not book.data:
         return "Немає збережених контактів."
-    return "\n".join(str(record) for record in book.data.values())
+    total = len(book.data)
+    if offset >= total:
+        return f"На цій сторінці немає контактів (усього контактів: {total})."
+    records = islice(book.data.values(), offset, None if size is None else offset + size)
+    return (str(record) for record in records)
 
 
 @input_error
@@ -184,7 +203,7 @@ def add_birthday(args, book):
     name, birth_date = args[0], args[1]
     record = book.find(name)
     if not record:
-        return 'Контакт не було знайдено.'
+        return Refusal('Контакт не було знайдено.')
     return record.add_birthday(birth_date)
 
 
@@ -233,7 +252,7 @@ def add_address(args, book):
     address = " ".join(args[1:])
     record = book.find(name)
     if not record:
-        return 'Контакту не було знайдено.'
+        return Refusal('Контакту не було знайдено.')
     return record.add_address(address)
 
 
@@ -256,10 +275,10 @@ def add_email(args, book):
     name, email = args[0], args[1]
     record = book.find(name)
     if not record:
-        return 'Контакту не було знайдено.'
+        return Refusal('Контакту не було знайдено.')
     owner = book.find_record_by_email(email)
     if owner and owner.name.value != record.name.value:
-        return f"Email {email} вже використовується контактом '{owner.name.value}'."
+        return Refusal(f"Email {email} вже використовується контактом '{owner.name.value}'.")
     return record.add_email(email)
 
 
@@ -306,6 +325,29 @@ def find_by_email(args, book):
     return f'Контакт знайдено {record}.'
 
 
+@input_error
+def find_by_domain(args, book):
+    """Пошук усіх контактів, що мають email у вказаному домені.
+
+    Формат:
+        domain <домен>
+
+    Args:
+        args (list[str]): Список аргументів; args[0] — домен (наприклад, example.com або @example.com).
+        book: Екземпляр AddressBook.
+
+    Returns:
+        str: Текстове представлення знайдених контактів або повідомлення про відсутність.
+    """
+    if len(args) < 1:
+        return "Помилка: команда 'domain' очікує 1 аргумент: domain <домен>."
+    domain = args[0]
+    records = book.find_records_by_domain(domain)
+    if not records:
+        return f"Контактів з email у домені {domain} не знайдено."
+    return "\n".join(str(record) for record in records)
+
+
 @input_error
 def find_by_name(args, book):
     """Пошук контакту за ім'ям.
@@ -329,24 +371,104 @@ def find_by_name(args, book):
     return f'Контакт знайдено {record}.'
 
 
+@input_error
+def find_by_prefix(args, book):
+    """Повертає генератор контактів, ім'я яких починається з префікса.
+
+    Формат:
+        prefix <префікс> [--page N] [--size M | --limit N]
+
+    Імена беруться з відсортованого індексу книги, тож контакти виводяться
+    в алфавітному порядку, а перші рядки з'являються одразу.
+
+    Args:
+        args (list[str]): Префікс і необов'язкові параметри посторінкового виводу.
+        book: Екземпляр AddressBook.
+
+    Returns:
+        Iterator[str] | str: Рядки контактів або повідомлення про відсутність збігів чи помилку.
+    """
+    try:
+        rest, offset, size = parse_paging(args)
+    except ValueError as e:
+        return f"Помилка: {e}"
+    if len(rest) != 1:
+        return "Помилка: команда 'prefix' очікує 1 аргумент: prefix <префікс> [--limit N]."
+    prefix = rest[0]
+    names = book.names_with_prefix(prefix, None if size is None else offset + size)
+    names = islice(names, offset, None)
+    first = next(names, None)
+    if first is None:
+        return f"Немає контактів, ім'я яких починається з '{prefix}'."
+    return (str(book.find(name)) for name in chain((first,), names))
+
+
+@input_error
+def find_by_phone_part(args, book):
+    """Повертає генератор телефонів, що починаються або закінчуються вказаними цифрами.
+
+    Формат:
+        find-phone <цифри> [--suffix] [--page N] [--size M | --limit N]
+
+    Номери шукаються у відсортованих індексах книги, тож перші рядки
+    з'являються одразу навіть для дуже великої книги.
+
+    Args:
+        args (list[str]): Цифри, необов'язковий --suffix і параметри посторінкового виводу.
+        book: Екземпляр AddressBook.
+
+    Returns:
+        Iterator[str] | str: Рядки «телефон — ім'я» або повідомлення про відсутність збігів чи помилку.
+    """
+    try:
+        rest, offset, size = parse_paging(args)
+    except ValueError as e:
+        return f"Помилка: {e}"
+    from_end = "--suffix" in rest
+    rest = [arg for arg in rest if arg != "--suffix"]
+    if len(rest) != 1:
+        return "Помилка: команда 'find-phone' очікує 1 аргумент: find-phone <цифри> [--suffix] [--limit N]."
+    digits = rest[0]
+    if not digits.isdigit() or not digits.isascii() or len(digits) > 10:
+        return "Помилка: вкажіть від 1 до 10 цифр номера."
+    phones = book.find_phones(digits, from_end, None if size is None else offset + size)
+    phones = islice(phones, offset, None)
+    first = next(phones, None)
+    if first is None:
+        where = "закінчуються на" if from_end else "починаються з"
+        return f"Немає телефонів, що {where} {digits}."
+    return (f"{phone} — {name}" for phone, name in chain((first,), phones))
+
+
 @input_error
 @input_error
-def birthdays(book):
-    """Показує список найближчих днів народження на 7 днів уперед.
+def birthdays(args, book):
+    """Показує список найближчих днів народження на N днів уперед (типово 7).
 
     Дані беруться з методу AddressBook.get_upcomming_birthdays(), який
     повертає структуру з іменем, реальною датою народження та датою привітання.
 
     Args:
+        args (list[str]): Необов'язкова кількість днів (від 0 до 366).
         book: Екземпляр AddressBook.
 
     Returns:
         str: Кожен рядок містить дату привітання, ім'я та реальну дату народження,
              або повідомлення про відсутність найближчих днів народження.
     """
-    upcoming = book.get_upcomming_birthdays()
+    if len(args) > 1:
+        return "Помилка: команда 'birthdays' очікує не більше 1 аргументу: birthdays [кількість_днів]."
+    days = 7
+    if args:
+        try:
+            days = int(args[0])
+        except ValueError:
+            return "Помилка: кількість днів має бути цілим числом."
+        if not 0 <= days <= MAX_BIRTHDAY_WINDOW:
+            return f"Помилка: кількість днів має бути від 0 до {MAX_BIRTHDAY_WINDOW}."
+    upcoming = book.get_upcomming_birthdays(days)
     if not upcoming:
-        return "Немає днів народження впродовж наступних 7 днів."
+        return f"Немає днів народження впродовж наступних {days} {_days_word(days)}."
     lines = []
     for item in upcoming:
         congrats_date_str = item["congrats_date"].strftime("%d.%m.%Y")
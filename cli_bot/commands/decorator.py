@@ -1,5 +1,39 @@
 from functools import wraps
 
+from .stats import mark_error
+
+
+class Refusal(str):
+    """Відповідь команди, яка нічого не змінила (контакт не знайдено, невірні дані тощо).
+
+    Це звичайний рядок для виводу, але реєстр команд за типом відповіді
+    дізнається, що змінююча команда не виконалася, і не журналює її.
+    Помилкою для статистики така відповідь не вважається.
+    """
+
+    __slots__ = ()
+
+
+def _guard_stream(lines):
+    """Передає рядки потокового результату, перехоплюючи винятки під час їх формування.
+
+    Потоковий результат формується вже після повернення з обробника, тож
+    його винятки оминули б input_error і дійшли б до циклу команд чи сервера.
+    Замість цього вивід переривається рядком із повідомленням про помилку.
+
+    Args:
+        lines (Iterator[str]): Рядки результату.
+
+    Yields:
+        str: Рядки результату, а в разі винятку — повідомлення про помилку.
+    """
+    try:
+        yield from lines
+    except Exception as e:
+        mark_error()
+        yield f"Помилка: вивід перервано: {e}"
+
+
 def input_error(func):
     """Декоратор для обробки типових помилок, що виникають у командах CLI.
 
@@ -11,6 +45,10 @@ def input_error(func):
         - KeyError — спроба звернення до неіснуючого контакту.
         - IndexError — недостатня кількість аргументів у команді.
 
+    Перехоплений виняток зараховується команді як помилка (див. stats).
+    Потоковий результат (ітератор рядків) загортається в _guard_stream:
+    винятки під час формування рядків перетворюються на повідомлення.
+
     Args:
         func (callable): Функція-команда, до якої застосовується декоратор.
 
@@ -20,11 +58,17 @@ def input_error(func):
     @wraps(func)
     def inner(*args, **kwargs):
         try:
-            return func(*args, **kwargs)
+            result = func(*args, **kwargs)
         except ValueError:
+            mark_error()
             return "Прошу ввести ім'я та телефон."
         except KeyError:
+            mark_error()
             return "Введіть ім'я користувача або контакт не знайдено."
         except IndexError:
+            mark_error()
             return "Прошу ввести ім'я."
+        if result is None or isinstance(result, str):
+            return result
+        return _guard_stream(result)
     return inner
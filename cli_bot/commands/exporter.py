@@ -0,0 +1,277 @@
+"""Потоковий експорт контактів і нотаток у CSV, JSONL, vCard та iCalendar.
+
+Записи читаються з книги по одному й одразу записуються у файл, тож
+пам'ять не залежить від розміру книги: SQLite-книга читається без кешу
+(scan), стовпцева — через тимчасові представлення, а тексти нотаток із
+файлу текстів не запам'ятовуються (Note.read_text).
+
+Формат визначається розширенням файлу:
+- .csv — заголовок і по рядку на контакт/нотатку (кілька значень через «;»);
+- .jsonl / .ndjson — по об'єкту JSON на рядок;
+- .vcf — vCard 3.0, лише контакти;
+- .ics — iCalendar зі щорічними подіями днів народження.
+
+Файли CSV і JSONL мають ті самі поля, що читає команда import, тож
+експортовані дані можна імпортувати назад. Додатковий суфікс .gz або
+.xz стискає вивід (gzip / lzma). Значення записуються без кольорів ANSI.
+Файл записується через тимчасовий і з'являється лише після успішного
+завершення експорту.
+"""
+
+import csv
+import hashlib
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+
+from .importer import file_format
+
+CONTACT_FIELDS = ["name", "phones", "emails", "birthday", "address"]
+NOTE_FIELDS = ["title", "text", "tags", "created_at"]
+
+
+class ExportReport:
+    """Підсумок експорту: шлях до файлу та кількість записаних записів."""
+
+    def __init__(self, path: Path):
+        """Створює порожній підсумок для файлу path."""
+        self.path = path
+        self.contacts = 0
+        self.notes = 0
+
+    def __str__(self):
+        """Повертає підсумок для виводу в CLI."""
+        return f"Експортовано контактів: {self.contacts}, нотаток: {self.notes} у файл {self.path}."
+
+
+def _stream(owner):
+    """Повертає записи книги чи нотатки нотатника в порядку додавання, не накопичуючи їх у пам'яті."""
+    data = owner.data
+    scan = getattr(data, "scan", None)
+    values = scan() if scan is not None else data.values()
+    return (value for value in values if value is not None)
+
+
+def _contact_row(record) -> dict:
+    """Перетворює запис на словник полів CONTACT_FIELDS (значення — рядки або списки)."""
+    return {
+        "name": record.name.value,
+        "phones": [phone.value for phone in record.phones],
+        "emails": [email.value for email in record.emails],
+        "birthday": str(record.birthday) if record.birthday else None,
+        "address": record.address.value if record.address else None,
+    }
+
+
+def _note_row(note) -> dict:
+    """Перетворює нотатку на словник полів NOTE_FIELDS (значення — рядки або списки)."""
+    return {
+        "title": note.title,
+        "text": note.read_text(),
+        "tags": sorted(note.tags),
+        "created_at": note.created_at.isoformat(timespec="seconds"),
+    }
+
+
+def _csv_cell(value) -> str:
+    """Перетворює значення поля на клітинку CSV (списки — через «;»)."""
+    if value is None:
+        return ""
+    if isinstance(value, list):
+        return ";".join(value)
+    return value
+
+
+def _write_csv(f, book, notes, report: ExportReport) -> None:
+    """Записує контакти та нотатки в CSV з єдиним заголовком.
+
+    Рядки контактів мають порожні поля нотаток і навпаки: import
+    розрізняє їх за полем title.
+    """
+    fields = (CONTACT_FIELDS if book is not None else []) + (NOTE_FIELDS if notes is not None else [])
+    writer = csv.DictWriter(f, fieldnames=fields, restval="")
+    writer.writeheader()
+    if book is not None:
+        for record in _stream(book):
+            writer.writerow({key: _csv_cell(value) for key, value in _contact_row(record).items()})
+            report.contacts += 1
+    if notes is not None:
+        for note in _stream(notes):
+            writer.writerow({key: _csv_cell(value) for key, value in _note_row(note).items()})
+            report.notes += 1
+
+
+def _write_jsonl(f, book, notes, report: ExportReport) -> None:
+    """Записує контакти та нотатки по об'єкту JSON на рядок."""
+    if book is not None:
+        for record in _stream(book):
+            f.write(json.dumps(_contact_row(record), ensure_ascii=False))
+            f.write("\n")
+            report.contacts += 1
+    if notes is not None:
+        for note in _stream(notes):
+            f.write(json.dumps(_note_row(note), ensure_ascii=False))
+            f.write("\n")
+            report.notes += 1
+
+
+def _escape(value: str) -> str:
+    """Екранує текстове значення vCard / iCalendar (RFC 6350, RFC 5545)."""
+    return (
+        value.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,")
+        .replace("\r\n", "\\n").replace("\n", "\\n")
+    )
+
+
+def _fold(line: str) -> str:
+    """Завершує рядок CRLF і переносить його частинами до 75 байтів (RFC 5545, 3.1)."""
+    data = line.encode()
+    if len(data) <= 75:
+        return line + "\r\n"
+    parts = []
+    start, limit = 0, 75
+    while start < len(data):
+        end = min(start + limit, len(data))
+        # Не розриваємо багатобайтовий символ UTF-8.
+        while end < len(data) and data[end] & 0xC0 == 0x80:
+            end -= 1
+        parts.append(data[start:end].decode())
+        start, limit = end, 74
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def _write_vcard(f, book, notes, report: ExportReport) -> None:
+    """Записує контакти як картки vCard 3.0."""
+    for record in _stream(book):
+        name = _escape(record.name.value)
+        lines = ["BEGIN:VCARD", "VERSION:3.0", f"FN:{name}", f"N:{name};;;;"]
+        lines.extend(f"TEL;TYPE=CELL:{phone.value}" for phone in record.phones)
+        lines.extend(f"EMAIL;TYPE=INTERNET:{email.value}" for email in record.emails)
+        if record.birthday:
+            lines.append(f"BDAY:{record.birthday.value.isoformat()}")
+        if record.address:
+            lines.append(f"ADR;TYPE=HOME:;;{_escape(record.address.value)};;;;")
+        lines.append("END:VCARD")
+        f.write("".join(_fold(line) for line in lines))
+        report.contacts += 1
+
+
+def _write_icalendar(f, book, notes, report: ExportReport) -> None:
+    """Записує щорічні події днів народження у календар iCalendar.
+
+    Народжені 29 лютого в невисокосні роки святкують 28 лютого, як і в
+    командах birthdays: правило повторення — останній день лютого.
+    """
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    f.write(_fold("BEGIN:VCALENDAR"))
+    f.write(_fold("VERSION:2.0"))
+    f.write(_fold("PRODID:-//cli-bot//Birthdays//UK"))
+    f.write(_fold("CALSCALE:GREGORIAN"))
+    for record in _stream(book):
+        if not record.birthday:
+            continue
+        born = record.birthday.value
+        if (born.month, born.day) == (2, 29):
+            rule = "RRULE:FREQ=YEARLY;BYMONTH=2;BYMONTHDAY=-1"
+        else:
+            rule = "RRULE:FREQ=YEARLY"
+        uid = hashlib.sha1(record.name.value.encode()).hexdigest()
+        for line in (
+            "BEGIN:VEVENT",
+            f"UID:{uid}@cli-bot",
+            f"DTSTAMP:{stamp}",
+            f"DTSTART;VALUE=DATE:{born:%Y%m%d}",
+            rule,
+            f"SUMMARY:{_escape('День народження: ' + record.name.value)}",
+            "TRANSP:TRANSPARENT",
+            "END:VEVENT",
+        ):
+            f.write(_fold(line))
+        report.contacts += 1
+    f.write(_fold("END:VCALENDAR"))
+
+
+# Розширення → (функція запису, чи експортуються нотатки).
+_WRITERS = {
+    ".csv": (_write_csv, True),
+    ".jsonl": (_write_jsonl, True),
+    ".ndjson": (_write_jsonl, True),
+    ".vcf": (_write_vcard, False),
+    ".ics": (_write_icalendar, False),
+}
+
+
+def export_file(path, book, notes, contacts: bool = True, with_notes: bool = True) -> ExportReport:
+    """Експортує контакти й нотатки у файл, формат якого задає розширення.
+
+    Args:
+        path (str | Path): Шлях до файлу (.csv, .jsonl, .ndjson, .vcf або .ics,
+            за потреби з суфіксом .gz чи .xz).
+        book: Екземпляр AddressBook.
+        notes: Екземпляр NoteBook.
+        contacts (bool): Чи експортувати контакти.
+        with_notes (bool): Чи експортувати нотатки (лише для CSV та JSONL).
+
+    Returns:
+        ExportReport: Підсумок експорту.
+
+    Raises:
+        ValueError: Якщо формат файлу не підтримується або для нього нічого експортувати.
+        OSError: Якщо файл не вдалося записати.
+    """
+    path = Path(path).expanduser()
+    suffix, opener = file_format(path)
+    writer, supports_notes = _WRITERS.get(suffix, (None, False))
+    if writer is None:
+        raise ValueError("підтримуються файли .csv, .jsonl, .ndjson, .vcf та .ics (за потреби з .gz або .xz).")
+    with_notes = with_notes and supports_notes
+    if not contacts and not with_notes:
+        raise ValueError(f"у формат {suffix} можна експортувати лише контакти.")
+
+    report = ExportReport(path)
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        with opener(tmp_path, "wt", encoding="utf-8", newline="") as f:
+            writer(f, book if contacts else None, notes if with_notes else None, report)
+        os.replace(tmp_path, path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+    return report
+
+
+def export_data(args, book, notes):
+    """Команда export: записує контакти й нотатки у файл.
+
+    Формат:
+        export <файл.csv | .jsonl | .vcf | .ics>[.gz | .xz] [--contacts | --notes]
+
+    Args:
+        args (list[str]): Шлях до файлу та необов'язковий вибір даних.
+        book: Екземпляр AddressBook.
+        notes: Екземпляр NoteBook.
+
+    Returns:
+        str: Підсумок експорту або повідомлення про помилку.
+    """
+    usage = (
+        "Помилка: команда 'export' очікує: "
+        "export <файл.csv | .jsonl | .vcf | .ics>[.gz | .xz] [--contacts | --notes]."
+    )
+    if not args or len(args) > 2:
+        return usage
+    only = args[1] if len(args) == 2 else None
+    if only not in (None, "--contacts", "--notes"):
+        return usage
+    try:
+        report = export_file(
+            args[0], book, notes,
+            contacts=only != "--notes",
+            with_notes=only != "--contacts",
+        )
+    except ValueError as e:
+        return f"Помилка: {e}"
+    except OSError as e:
+        return f"Помилка запису файлу: {e}"
+    return str(report)
@@ -0,0 +1,208 @@
+"""Нечіткий пошук слів за відстанню редагування (Левенштейна).
+
+Містить:
+- edit_distance — відстань Левенштейна, обчислена бітово-паралельним
+  алгоритмом Маєрса (у варіанті Hyyrö): один прохід по рядку, де кожен
+  стовпець таблиці динамічного програмування — кілька операцій над цілими;
+- max_typos — допустима кількість помилок залежно від довжини слова;
+- BKTree — BK-дерево, яке будується один раз, оновлюється додаванням і
+  видаленням слів та знаходить найближчі слова без перебору всього словника.
+
+Порівняння нечутливе до регістру, а повертаються слова в початковому написанні.
+"""
+
+
+def _pattern_masks(pattern: str) -> dict[str, int]:
+    """Будує бітові маски позицій кожного символу шаблону.
+
+    Args:
+        pattern (str): Шаблон (рядок, з яким порівнюють).
+
+    Returns:
+        dict[str, int]: Символ → маска, у якій встановлено біти його позицій.
+    """
+    masks: dict[str, int] = {}
+    for i, char in enumerate(pattern):
+        masks[char] = masks.get(char, 0) | (1 << i)
+    return masks
+
+
+def _distance(masks: dict[str, int], length: int, text: str) -> int:
+    """Обчислює відстань Левенштейна між шаблоном (заданим масками) і текстом.
+
+    Args:
+        masks (dict[str, int]): Результат _pattern_masks для шаблону.
+        length (int): Довжина шаблону.
+        text (str): Рядок, з яким порівнюється шаблон.
+
+    Returns:
+        int: Відстань редагування.
+    """
+    if not length:
+        return len(text)
+    full = (1 << length) - 1
+    last = 1 << (length - 1)
+    pv, mv, score = full, 0, length
+    for char in text:
+        eq = masks.get(char, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | ~(xh | pv)
+        mh = pv & xh
+        if ph & last:
+            score += 1
+        elif mh & last:
+            score -= 1
+        ph = (ph << 1) | 1
+        mh <<= 1
+        pv = (mh | ~(xv | ph)) & full
+        mv = ph & xv & full
+    return score
+
+
+def edit_distance(a: str, b: str) -> int:
+    """Повертає відстань Левенштейна між двома рядками.
+
+    Args:
+        a (str): Перший рядок.
+        b (str): Другий рядок.
+
+    Returns:
+        int: Мінімальна кількість вставок, видалень і замін символів.
+    """
+    return _distance(_pattern_masks(a), len(a), b)
+
+
+def max_typos(word: str) -> int:
+    """Визначає, скільки помилок допускається для слова такої довжини.
+
+    Args:
+        word (str): Введене слово.
+
+    Returns:
+        int: 1 для слів до 4 символів, 2 — до 8, інакше 3.
+    """
+    if len(word) <= 4:
+        return 1
+    if len(word) <= 8:
+        return 2
+    return 3
+
+
+class BKTree:
+    """BK-дерево слів для пошуку найближчих за відстанню Левенштейна.
+
+    Кожен вузол — [ключ у casefold, слова з цим ключем, діти за відстанню].
+    Пошук з радіусом r відвідує лише дітей на відстанях [d - r, d + r]
+    від поточного вузла (нерівність трикутника), тому переглядається мала
+    частина словника. Видалене слово лишає порожній вузол, який пропускається
+    під час пошуку і повторно використовується, якщо слово додадуть знову.
+    """
+
+    def __init__(self, words=()):
+        """Створює дерево та (за потреби) наповнює його словами.
+
+        Args:
+            words (Iterable[str]): Початкові слова.
+        """
+        self._root = None
+        self._size = 0
+        for word in words:
+            self.add(word)
+
+    def __len__(self):
+        """Повертає кількість слів у дереві."""
+        return self._size
+
+    def _find_node(self, key: str, create: bool):
+        """Знаходить вузол із ключем (або створює його, якщо create=True)."""
+        if self._root is None:
+            if not create:
+                return None
+            self._root = [key, {}, {}]
+            return self._root
+        masks, length = _pattern_masks(key), len(key)
+        node = self._root
+        while True:
+            if node[0] == key:
+                return node
+            distance = _distance(masks, length, node[0])
+            child = node[2].get(distance)
+            if child is None:
+                if not create:
+                    return None
+                child = node[2][distance] = [key, {}, {}]
+                return child
+            node = child
+
+    def add(self, word: str) -> None:
+        """Додає слово до дерева (повторне додавання нічого не змінює).
+
+        Args:
+            word (str): Слово в початковому написанні.
+        """
+        words = self._find_node(word.casefold(), create=True)[1]
+        if word not in words:
+            words[word] = None
+            self._size += 1
+
+    def discard(self, word: str) -> None:
+        """Видаляє слово з дерева, якщо воно там є.
+
+        Args:
+            word (str): Слово в початковому написанні.
+        """
+        node = self._find_node(word.casefold(), create=False)
+        if node is not None and word in node[1]:
+            del node[1][word]
+            self._size -= 1
+
+    def search(self, word: str, max_distance: int) -> list[tuple[int, str]]:
+        """Знаходить усі слова на відстані не більше max_distance.
+
+        Args:
+            word (str): Слово для пошуку.
+            max_distance (int): Найбільша допустима відстань.
+
+        Returns:
+            list[tuple[int, str]]: Пари (відстань, слово), від найближчих.
+        """
+        if self._root is None:
+            return []
+        key = word.casefold()
+        masks, length = _pattern_masks(key), len(key)
+        found = []
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            distance = _distance(masks, length, node[0])
+            if distance <= max_distance:
+                found.extend((distance, match) for match in node[1])
+            low, high = distance - max_distance, distance + max_distance
+            stack.extend(child for d, child in node[2].items() if low <= d <= high)
+        found.sort(key=lambda item: (item[0], item[1].casefold()))
+        return found
+
+    def closest(self, word: str, limit: int = 3, max_distance: int | None = None) -> list[str]:
+        """Повертає підказки для слова, якого немає в дереві.
+
+        Args:
+            word (str): Введене слово.
+            limit (int): Найбільша кількість підказок.
+            max_distance (int | None): Найбільша відстань (None — max_typos(word)).
+
+        Returns:
+            list[str]: Слова від найближчого до найдальшого або порожній
+                список, якщо саме слово є в дереві.
+        """
+        if max_distance is None:
+            max_distance = max_typos(word)
+        # Радіус збільшується поступово: більшість помилок — один символ,
+        # а пошук з малим радіусом відвідує значно менше вузлів.
+        for radius in range(1, max_distance + 1):
+            matches = [match for _, match in self.search(word, radius)]
+            if word in matches:
+                return []
+            if matches:
+                return matches[:limit]
+        return []
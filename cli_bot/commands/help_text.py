@@ -28,13 +28,17 @@ HELP_TEXT = """\
       Приклад: phone John
       Результат: Показує всі номери телефону контакту з указаним ім'ям.
 
-  all
-      Результат: Усі контакти у форматі: <name>: <phones>, birthday: <DD.MM.YYYY|-> 
-                 Або: Адресна книга порожня.
+  all [--page N] [--size M]
+      Приклад: all --page 3 --size 100
+      Результат: Усі контакти (або одна сторінка) у форматі: <name>: <phones>, birthday: <DD.MM.YYYY|->
+                 Або: Адресна книга порожня. Вивід з'являється потоково.
 
-  all-table
+  all-table [--limit N] [--page N] [--size M]
+      Приклад: all-table --limit 20
       Результат: Усі контакти у вигляді таблиці (ті ж дані, що й команда 'all') з колонками:
                  Ім'я, Телефони, День народження, Адреса, Email.
+                 Ширина стовпців визначається за першими 1000 рядками; довші значення далі
+                 виводяться повністю й виходять за межі стовпця.
 
   add-birthday <name> <DD.MM.YYYY>
       Приклад: add-birthday John 17.08.1980
@@ -52,10 +56,26 @@ HELP_TEXT = """\
       Приклад: email john@example.com
       Результат: Показує контакт, що відповідає email.
 
+  domain <domain>
+      Приклад: domain example.com
+      Результат: Показує всі контакти, що мають email у вказаному домені.
+
   name <name>
       Приклад: name John
       Результат: Показує контакт з вказаним ім'ям.
 
+  prefix <prefix> [--page N] [--size M | --limit N]
+      Приклад: prefix Ol --limit 10
+      Результат: Контакти, ім'я яких починається з префікса (без урахування регістру),
+                 в алфавітному порядку. Або: Немає контактів, ім'я яких починається з 'Ol'.
+      Порада: в інтерактивному режимі Tab доповнює назви команд та імена контактів.
+
+  find-phone <digits> [--suffix] [--page N] [--size M | --limit N]
+      Приклад: find-phone 067 або find-phone 4567 --suffix
+      Результат: Телефони, що починаються (з --suffix — закінчуються) вказаними цифрами,
+                 у форматі: 0671234567 — John.
+                 Або: Немає телефонів, що починаються з 067.
+
   delete <name>
       Приклад: delete John
       Результат: Видаляє контакт з адресної книги.
@@ -64,15 +84,19 @@ HELP_TEXT = """\
       Приклад: show-birthday John
       Результат: <DD.MM.YYYY> Або: День народження не збережено.
 
-  birthdays
-      Результат: Список привітань на наступні 7 днів (дні народження у вихідні перенесено на понеділок),
+  birthdays [days]
+      Приклад: birthdays або birthdays 30
+      Результат: Список привітань на наступні 7 (або вказану кількість, до 366) днів
+                 (дні народження у вихідні перенесено на понеділок),
                  Або: Немає днів народження впродовж наступних 7 днів.
 
-  birthdays-in <days>
-      Приклад: birthdays-in 3
-      Результат: Показує контакти, у яких день народження рівно через вказану кількість днів,
+  birthdays-in <days> | <from>..<to>
+      Приклад: birthdays-in 3 або birthdays-in 0..90
+      Результат: Показує контакти, у яких наступний день народження рівно через вказану
+                 кількість днів (тому для N > 365 збігів немає),
                  у форматі: День народження через 3 дні у John.
                  Або: Немає контактів з днем народження через 3 дні.
+                 Для діапазону — по рядку на кожну дату: 20.10.2026 (через 4 дні): John, Mary
 
   add-note <title> <text>
       Приклад: add-note Shopping Buy milk and bread
@@ -82,6 +106,10 @@ HELP_TEXT = """\
       Приклад: find-note Shopping
       Результат: Текст нотатки Або: Нотатку не знайдено.
 
+  search-notes <words> [--top N]
+      Приклад: search-notes milk bread --top 5
+      Результат: Найрелевантніші нотатки за словами з назви та тексту (за замовчуванням 10).
+
   edit-note <title> <new_text>
       Приклад: edit-note Shopping Buy milk, bread and cheese
       Результат: Нотатку оновлено.
@@ -94,17 +122,55 @@ HELP_TEXT = """\
       Приклад: add-tags Shopping grocery urgent
       Результат: Додає один або кілька тегів до нотатки з указаною назвою.
 
-  find-by-tag <tag1[,tag2,...]>
+  find-by-tag <tag1[,tag2,...]> [+tag] [-tag]
       Приклади:
           find-by-tag grocery
+          find-by-tag work,urgent -archived
+          find-by-tag +work +urgent
       Результат: Показує всі нотатки, що містять хоча б один із перелічених тегів
-                 (теги можна розділяти пробілами або комами).
+                 (теги можна розділяти пробілами або комами); тег із «+» обов'язковий,
+                 нотатки з тегом із «-» виключаються.
 
-  sort-notes-by-tag
-      Результат: Відсортовує нотатки за тегами та виводить їх у впорядкованому вигляді.
+  sort-notes-by-tag [--page N] [--size M]
+      Приклад: sort-notes-by-tag --page 1 --size 50
+      Результат: Відсортовує нотатки за тегами та виводить їх у впорядкованому вигляді
+                 (за потреби — лише вказану сторінку, типовий розмір сторінки 50).
 
-  show-notes
-      Результат: Усі збережені нотатки Або: Жодної нотатки не збережено.
+  show-notes [--page N] [--size M]
+      Результат: Усі збережені нотатки (або одна сторінка) Або: Жодної нотатки не збережено.
+
+  import <file.csv | file.jsonl>[.gz | .xz]
+      Приклад: import ~/contacts.csv
+      Результат: Потоково імпортує контакти (name, phones, emails, birthday, address)
+                 і нотатки (title, text, tags) та виводить кількість доданих записів
+                 і помилки рядків у форматі: Рядок 12: контакт 'John' вже існує.
+
+  export <file.csv | .jsonl | .vcf | .ics>[.gz | .xz] [--contacts | --notes]
+      Приклади:
+          export ~/backup.jsonl.gz
+          export ~/contacts.vcf
+          export ~/birthdays.ics
+      Результат: Потоково записує контакти й нотатки без кольорів (CSV і JSONL — у форматі
+                 команди import; vCard — лише контакти; iCalendar — щорічні дні народження);
+                 суфікс .gz або .xz стискає файл.
+
+  stats [reset]
+      Результат: Таблиця команд цієї сесії (найповільніші — вгорі): кількість викликів і помилок,
+                 сумарний час, затримки p50/p95/p99 та максимальна (мс), середній розмір
+                 результату в рядках. stats reset очищує статистику.
+      Порада: CLI_BOT_STATS_FILE=stats.json записує статистику в JSON під час виходу.
+
+  memory [start | stop | mark | diff | objects] [--top N]
+      Приклади:
+          memory start
+          memory mark
+          memory diff --top 5
+          memory objects
+      Результат: memory — обсяг пам'яті, відстежений tracemalloc, модулі й рядки коду з найбільшими
+                 виділеннями; memory mark запам'ятовує стан, memory diff показує зміну відносно нього;
+                 memory objects — розмір контактів і нотаток за частинами (дані, індекси, кеші)
+                 та за типами об'єктів (Record, Field, Note, рядки), без tracemalloc.
+      Порада: cli-bot --trace-memory вмикає трасування ще до завантаження даних.
 
   help
       Показати цей текст.
@@ -0,0 +1,371 @@
+"""Масовий імпорт контактів і нотаток із файлів CSV та JSONL.
+
+Файл читається потоково, пакетами по IMPORT_CHUNK_ROWS рядків, тож
+навіть мільйони рядків не потрапляють у пам'ять одночасно. Для кожного
+пакета:
+- поля перевіряються швидкими перевірками (телефон — 10 цифр, email —
+  той самий шаблон, що в Email, дата DD.MM.YYYY — без datetime.strptime),
+  а поля створюються без повторної валідації;
+- телефони й email звіряються з уже зайнятими в книзі (множина, зібрана
+  один раз на початку імпорту) та з імпортованими раніше рядками;
+- коректні записи додаються в книгу й нотатник одним викликом
+  (add_records / add_notes), без пошуку дублікатів для кожного запису.
+
+Рядок з помилкою пропускається, а імпорт триває; помилки повертаються
+разом із номерами рядків.
+
+Рядок із полем title вважається нотаткою (поля title, text, tags і
+необов'язкове created_at у форматі ISO), решта — контактами (поля name,
+phones / phone, emails / email, birthday, address).
+Кілька значень в одному полі CSV розділяються «;», «,» або пробілами,
+у JSONL можна передати список. Файли з суфіксом .gz або .xz (наприклад,
+створені командою export) розпаковуються на льоту.
+"""
+
+import csv
+import gzip
+import json
+import lzma
+import re
+from datetime import date, datetime
+from itertools import islice
+from pathlib import Path
+
+from .address_book import Record, Name, Phone, Email, Address, Birthday, _field
+from .note_book import Note
+
+# Кількість рядків файлу, що перевіряються й додаються одним пакетом.
+IMPORT_CHUNK_ROWS = 10_000
+
+# Найбільша кількість помилок, що виводяться по рядку (решта лише рахуються).
+IMPORT_MAX_ERRORS = 100
+
+_COMPRESSORS = {".gz": gzip.open, ".xz": lzma.open}
+
+_SEPARATORS = re.compile(r"[;,\s]+")
+_DATE_ERROR = "Невірний формат дати. Використовуйте DD.MM.YYYY"
+
+
+class ImportReport:
+    """Підсумок імпорту: кількість доданих записів і помилки рядків."""
+
+    def __init__(self):
+        """Створює порожній підсумок."""
+        self.contacts = 0
+        self.notes = 0
+        self.error_count = 0
+        self.errors: list[str] = []
+        self.stopped: str | None = None
+
+    def error(self, line: int, message: str) -> None:
+        """Фіксує помилку рядка (текст зберігається для перших IMPORT_MAX_ERRORS).
+
+        Args:
+            line (int): Номер рядка файлу.
+            message (str): Опис помилки.
+        """
+        self.error_count += 1
+        if len(self.errors) < IMPORT_MAX_ERRORS:
+            self.errors.append(f"Рядок {line}: {message}")
+
+    def __str__(self):
+        """Повертає підсумок і перелік помилок для виводу в CLI."""
+        lines = [
+            f"Імпортовано контактів: {self.contacts}, нотаток: {self.notes}. "
+            f"Рядків з помилками: {self.error_count}."
+        ]
+        lines.extend(self.errors)
+        if self.error_count > len(self.errors):
+            lines.append(f"... і ще {self.error_count - len(self.errors)} помилок.")
+        if self.stopped is not None:
+            lines.append(f"Імпорт зупинено через помилку читання файлу: {self.stopped}")
+        return "\n".join(lines)
+
+
+def file_format(path: Path):
+    """Визначає формат файлу за розширенням з урахуванням стиснення.
+
+    Args:
+        path (Path): Шлях до файлу, наприклад contacts.csv або backup.jsonl.gz.
+
+    Returns:
+        tuple[str, callable]: Розширення формату (".csv", ".jsonl" тощо, "" — якщо
+            його немає) та функція відкриття файлу (open, gzip.open або lzma.open).
+    """
+    suffixes = [suffix.lower() for suffix in path.suffixes[-2:]]
+    opener = _COMPRESSORS.get(suffixes[-1]) if suffixes else None
+    if opener is not None:
+        suffixes.pop()
+    return (suffixes[-1] if suffixes else ""), opener or open
+
+
+def _values(value) -> list[str]:
+    """Розбиває поле з кількома значеннями (рядок або список JSON) на значення."""
+    if value is None:
+        return []
+    if isinstance(value, list):
+        return [str(item).strip() for item in value if str(item).strip()]
+    return [item for item in _SEPARATORS.split(str(value)) if item]
+
+
+def _text(row: dict, key: str) -> str:
+    """Повертає поле рядка як рядок без зайвих пробілів (порожній, якщо поля немає)."""
+    value = row.get(key)
+    return "" if value is None else str(value).strip()
+
+
+def parse_date(value: str) -> date:
+    """Розбирає дату DD.MM.YYYY; рядки точного формату — без datetime.strptime.
+
+    Швидкий шлях приймає лише рядки з десяти символів «ЦЦ.ЦЦ.ЦЦЦЦ» (цифри ASCII),
+    бо int() пропустив би знаки, пробіли чи «_»; решта рядків розбирається
+    strptime — так само, як дата народження в команді add-birthday.
+
+    Args:
+        value (str): Дата.
+
+    Returns:
+        date: Розібрана дата.
+
+    Raises:
+        ValueError: Якщо дата не відповідає формату або не існує.
+    """
+    try:
+        day, month, year = value[:2], value[3:5], value[6:]
+        if (
+            len(value) == 10 and value[2] == value[5] == "." and value.isascii()
+            and day.isdigit() and month.isdigit() and year.isdigit()
+        ):
+            return date(int(year), int(month), int(day))
+        return datetime.strptime(value, "%d.%m.%Y").date()
+    except ValueError:
+        raise ValueError(_DATE_ERROR) from None
+
+
+def _read_csv(path: Path, opener=open):
+    """Читає рядки CSV із заголовком.
+
+    Yields:
+        tuple[int, dict | None, str | None]: (номер рядка, поля, помилка).
+    """
+    with opener(path, "rt", newline="", encoding="utf-8-sig") as f:
+        reader = csv.DictReader(f)
+        for row in reader:
+            yield reader.line_num, row, None
+
+
+def _read_jsonl(path: Path, opener=open):
+    """Читає об'єкти JSON, по одному в рядку (порожні рядки пропускаються).
+
+    Yields:
+        tuple[int, dict | None, str | None]: (номер рядка, поля, помилка).
+    """
+    with opener(path, "rt", encoding="utf-8-sig") as f:
+        for line_no, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError as e:
+                yield line_no, None, f"некоректний JSON ({e.msg})."
+                continue
+            if not isinstance(row, dict):
+                yield line_no, None, "очікується об'єкт JSON."
+                continue
+            yield line_no, row, None
+
+
+_READERS = {".csv": _read_csv, ".jsonl": _read_jsonl, ".ndjson": _read_jsonl}
+
+
+class _Importer:
+    """Стан одного імпорту: зайняті імена, телефони та email і підсумок."""
+
+    def __init__(self, book, notes):
+        """Збирає множини зайнятих телефонів і email книги.
+
+        Args:
+            book: Екземпляр AddressBook.
+            notes: Екземпляр NoteBook.
+        """
+        self.book = book
+        self.notes = notes
+        self.known_phones = book.known_phones()
+        self.known_emails = book.known_emails()
+        self.new_names: set[str] = set()
+        self.new_phones: set[str] = set()
+        self.new_emails: set[str] = set()
+        self.new_titles: set[str] = set()
+        self.report = ImportReport()
+
+    def run(self, rows) -> ImportReport:
+        """Імпортує рядки пакетами по IMPORT_CHUNK_ROWS.
+
+        Args:
+            rows (Iterator[tuple]): Рядки від _read_csv / _read_jsonl.
+
+        Returns:
+            ImportReport: Підсумок імпорту (пакети до помилки читання файлу
+                лишаються імпортованими).
+        """
+        while True:
+            try:
+                chunk = list(islice(rows, IMPORT_CHUNK_ROWS))
+            except (UnicodeDecodeError, csv.Error, OSError, EOFError, lzma.LZMAError) as e:
+                self.report.stopped = str(e)
+                break
+            if not chunk:
+                break
+            records, notes = [], []
+            for line, row, error in chunk:
+                try:
+                    if error is not None:
+                        raise ValueError(error)
+                    if _text(row, "title"):
+                        notes.append(self._note(row))
+                    else:
+                        records.append(self._record(row))
+                except ValueError as e:
+                    self.report.error(line, str(e))
+            if records:
+                self.book.add_records(records)
+                self.report.contacts += len(records)
+            if notes:
+                self.notes.add_notes(notes)
+                self.report.notes += len(notes)
+        return self.report
+
+    def _record(self, row: dict) -> Record:
+        """Перевіряє рядок контакту та створює запис.
+
+        Raises:
+            ValueError: Якщо поле некоректне або ім'я, телефон чи email уже зайняті.
+        """
+        name = _text(row, "name")
+        if not name:
+            raise ValueError("не вказано ім'я контакту.")
+        if name in self.new_names or name in self.book.data:
+            raise ValueError(f"контакт '{name}' вже існує.")
+
+        phones = list(dict.fromkeys(_values(row.get("phones")) + _values(row.get("phone"))))
+        for phone in phones:
+            if len(phone) != 10 or not phone.isdigit() or not phone.isascii():
+                raise ValueError(f"невірний номер {phone}: номер має складатися з 10 цифр.")
+            if phone in self.known_phones or phone in self.new_phones:
+                raise ValueError(f"номер {phone} вже використовується іншим контактом.")
+
+        emails = list(dict.fromkeys(_values(row.get("emails")) + _values(row.get("email"))))
+        keys = []
+        for email in emails:
+            if not Email.EMAIL_PATTERN.match(email):
+                raise ValueError(f"некоректна адреса електронної пошти {email}.")
+            key = email.casefold()
+            if key in self.known_emails or key in self.new_emails or key in keys:
+                raise ValueError(f"email {email} вже використовується іншим контактом.")
+            keys.append(key)
+
+        birthday = _text(row, "birthday")
+        birthday = _field(Birthday, parse_date(birthday)) if birthday else None
+        address = _text(row, "address")
+
+        self.new_names.add(name)
+        self.new_phones.update(phones)
+        self.new_emails.update(keys)
+        record = Record.__new__(Record)
+        record.__setstate__((
+            _field(Name, name),
+            [_field(Phone, phone) for phone in phones],
+            birthday,
+            _field(Address, address) if address else None,
+            [_field(Email, email) for email in emails],
+        ))
+        return record
+
+    def _note(self, row: dict) -> Note:
+        """Перевіряє рядок нотатки та створює нотатку.
+
+        Raises:
+            ValueError: Якщо немає тексту або нотатка з такою назвою вже є.
+        """
+        title = _text(row, "title")
+        key = title.lower()
+        if key in self.new_titles or key in self.notes.data:
+            raise ValueError(f"нотатка '{title}' вже існує.")
+        text = _text(row, "text")
+        if not text:
+            raise ValueError(f"нотатка '{title}' не має тексту.")
+        created_at = _text(row, "created_at")
+        if created_at:
+            try:
+                created_at = datetime.fromisoformat(created_at)
+            except ValueError:
+                raise ValueError(f"невірна дата створення нотатки {created_at}.") from None
+        self.new_titles.add(key)
+        note = Note(title, text, _values(row.get("tags")))
+        if created_at:
+            note.created_at = created_at
+        return note
+
+
+def import_rows(rows, book, notes) -> ImportReport:
+    """Імпортує контакти й нотатки з уже розібраних рядків (словників полів).
+
+    Args:
+        rows (Iterable[dict]): Рядки з тими самими полями, що й у файлах CSV / JSONL;
+            номер рядка в помилках — порядковий номер словника, починаючи з 1.
+        book: Екземпляр AddressBook.
+        notes: Екземпляр NoteBook.
+
+    Returns:
+        ImportReport: Підсумок імпорту.
+    """
+    return _Importer(book, notes).run((line, row, None) for line, row in enumerate(rows, 1))
+
+
+def import_file(path, book, notes) -> ImportReport:
+    """Імпортує контакти й нотатки з файлу CSV або JSONL.
+
+    Args:
+        path (str | Path): Шлях до файлу (.csv, .jsonl або .ndjson, за потреби
+            стиснутого: .csv.gz, .jsonl.xz тощо).
+        book: Екземпляр AddressBook.
+        notes: Екземпляр NoteBook.
+
+    Returns:
+        ImportReport: Підсумок імпорту.
+
+    Raises:
+        ValueError: Якщо формат файлу не підтримується або файлу немає.
+    """
+    path = Path(path).expanduser()
+    suffix, opener = file_format(path)
+    reader = _READERS.get(suffix)
+    if reader is None:
+        raise ValueError("підтримуються файли .csv, .jsonl та .ndjson (за потреби з .gz або .xz).")
+    if not path.is_file():
+        raise ValueError(f"файл {path} не знайдено.")
+    return _Importer(book, notes).run(reader(path, opener))
+
+
+def import_data(args, book, notes):
+    """Команда import: імпортує контакти й нотатки з файлу.
+
+    Формат:
+        import <файл.csv | файл.jsonl>
+
+    Args:
+        args (list[str]): Шлях до файлу.
+        book: Екземпляр AddressBook.
+        notes: Екземпляр NoteBook.
+
+    Returns:
+        str: Підсумок імпорту з помилками рядків або повідомлення про помилку.
+    """
+    if len(args) != 1:
+        return "Помилка: команда 'import' очікує 1 аргумент: import <файл.csv | файл.jsonl>."
+    try:
+        return str(import_file(args[0], book, notes))
+    except ValueError as e:
+        return f"Помилка: {e}"
+    except OSError as e:
+        return f"Помилка читання файлу: {e}"
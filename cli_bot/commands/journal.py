@@ -0,0 +1,181 @@
+"""Журнал змін (write-ahead log) для режиму зберігання journal.
+
+Забезпечує:
+- дописування кожної змінюючої команди окремим JSON-рядком у кінець журналу з fsync;
+- відтворення журналу поверх останнього знімка під час запуску;
+- визначення розміру журналу та його очищення після компактизації.
+
+Записи журналу компактні: назва команди, її аргументи та момент виконання.
+Відтворення виконує ті самі обробники команд (через реєстр команд),
+що й інтерактивний цикл, з тим самим зафіксованим моментом часу (дати
+створення нотаток не змінюються), тому стан після перезапуску збігається
+зі станом до збою. Команди, що завершилися помилкою або відмовою
+(відповідь Refusal: контакт не знайдено, невірні дані тощо), не журналюються.
+
+Перший рядок журналу — заголовок із випадковим ідентифікатором покоління,
+а кожен запис має порядковий номер seq. Знімок книги запам'ятовує позицію
+журналу, яку він уже містить (journal_position = (покоління, seq)), тож під
+час відтворення записи, вже наявні в знімку, пропускаються. Так збій між
+записом знімка контактів і знімка нотаток не застосовує зміни двічі.
+Після очищення журналу наступний запис починає нове покоління.
+"""
+
+import json
+import os
+import secrets
+from datetime import datetime
+from pathlib import Path
+
+from .registry import get_command
+from .stats import STATS
+
+# Покоління та номер останнього запису для кожного журналу, з яким уже працювали.
+_positions: dict[Path, tuple[str | None, int]] = {}
+
+
+def _scan(journal_path: Path) -> tuple[str | None, list[dict]]:
+    """Читає журнал і запам'ятовує його позицію.
+
+    Обірваний останній рядок (збій під час запису) відкидається й обрізається
+    у файлі, щоб наступний запис почався з нового рядка.
+
+    Args:
+        journal_path (Path): Шлях до файлу журналу.
+
+    Returns:
+        tuple[str | None, list[dict]]: Покоління журналу (None — журналу немає або
+            він створений без заголовка) та записи команд.
+    """
+    generation, entries, last_seq = None, [], 0
+    if journal_path.exists():
+        with journal_path.open("rb+") as f:
+            valid = 0
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    break
+                try:
+                    entry = json.loads(raw)
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    break
+                valid += len(raw)
+                if "journal" in entry:
+                    generation = entry["journal"]
+                    continue
+                entries.append(entry)
+                last_seq = entry.get("seq", last_seq)
+            if valid < f.seek(0, os.SEEK_END):
+                f.truncate(valid)
+    _positions[journal_path] = (generation, last_seq)
+    return generation, entries
+
+
+def journal_position(journal_filename) -> tuple[str, int] | None:
+    """Повертає позицію кінця журналу для запису разом зі знімком.
+
+    Args:
+        journal_filename (str|Path): Шлях до файлу журналу.
+
+    Returns:
+        tuple[str, int] | None: (покоління, номер останнього запису) або None,
+            якщо журналу немає чи він не має заголовка.
+    """
+    journal_path = Path(journal_filename).resolve()
+    if journal_path not in _positions:
+        _scan(journal_path)
+    generation, last_seq = _positions[journal_path]
+    return (generation, last_seq) if generation is not None else None
+
+
+def append_entry(journal_filename, command: str, args: list[str], at: datetime | None = None) -> None:
+    """Дописує команду в кінець журналу та примусово скидає її на диск.
+
+    Args:
+        journal_filename (str|Path): Шлях до файлу журналу.
+        command (str): Назва змінюючої команди.
+        args (list[str]): Аргументи команди.
+        at (datetime | None): Момент виконання команди (відтворюється разом із нею).
+    """
+    journal_path = Path(journal_filename).resolve()
+    journal_path.parent.mkdir(parents=True, exist_ok=True)
+    if journal_path not in _positions:
+        _scan(journal_path)
+    generation, last_seq = _positions[journal_path]
+
+    lines = []
+    if not journal_path.exists() or journal_path.stat().st_size == 0:
+        generation, last_seq = secrets.token_hex(8), 0
+        lines.append({"journal": generation})
+    entry = {"seq": last_seq + 1, "cmd": command, "args": args}
+    if at is not None:
+        entry["at"] = at.isoformat()
+    lines.append(entry)
+
+    data = "".join(json.dumps(line, ensure_ascii=False, separators=(",", ":")) + "\n" for line in lines)
+    with journal_path.open("a", encoding="utf-8") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    _positions[journal_path] = (generation, last_seq + 1)
+
+
+def replay_journal(journal_filename, book, notes) -> int:
+    """Відтворює команди з журналу поверх завантаженого знімка.
+
+    Обірваний останній рядок (збій під час запису) ігнорується. Команда
+    виконується із записаним моментом часу (записи без нього — з поточним).
+    Записи, які вже містить знімок книги чи нотатника (див. journal_position),
+    пропускаються. Відтворені команди не потрапляють у статистику команд сесії.
+
+    Args:
+        journal_filename (str|Path): Шлях до файлу журналу.
+        book (AddressBook): Адресна книга, до якої застосовуються зміни.
+        notes (NoteBook): Нотатник, до якого застосовуються зміни.
+
+    Returns:
+        int: Кількість відтворених команд.
+    """
+    generation, entries = _scan(Path(journal_filename).resolve())
+
+    replayed = 0
+    with STATS.paused():
+        for entry in entries:
+            spec = get_command(entry.get("cmd"))
+            if spec is None or not spec.mutating:
+                continue
+            if generation is not None:
+                owner = {"book": book, "notes": notes}.get(spec.target)
+                covered = getattr(owner, "journal_position", None)
+                if covered is not None and covered[0] == generation and entry.get("seq", 0) <= covered[1]:
+                    continue
+            at = entry.get("at")
+            spec(entry.get("args", []), book, notes, at=datetime.fromisoformat(at) if at else None)
+            replayed += 1
+    return replayed
+
+
+def journal_size(journal_filename) -> int:
+    """Повертає розмір журналу в байтах (0, якщо журналу немає).
+
+    Args:
+        journal_filename (str|Path): Шлях до файлу журналу.
+
+    Returns:
+        int: Розмір файлу журналу.
+    """
+    try:
+        return Path(journal_filename).stat().st_size
+    except FileNotFoundError:
+        return 0
+
+
+def reset_journal(journal_filename) -> None:
+    """Очищує журнал після того, як його зміни увійшли до нового знімка.
+
+    Наступний запис почне нове покоління журналу.
+
+    Args:
+        journal_filename (str|Path): Шлях до файлу журналу.
+    """
+    journal_path = Path(journal_filename).resolve()
+    journal_path.unlink(missing_ok=True)
+    _positions.pop(journal_path, None)
@@ -0,0 +1,101 @@
+"""Ліниве завантаження адресної книги та нотатника.
+
+LazyProxy підміняє об'єкт, доки той не знадобиться: перше звернення до
+атрибута, елемента, довжини чи ітерації викликає завантажувач, а далі всі
+операції передаються справжньому об'єкту. Так сесія, що працює лише з
+контактами, ніколи не читає файл нотаток, і навпаки.
+"""
+
+
+class LazyProxy:
+    """Замісник об'єкта, який створюється під час першого звернення."""
+
+    __slots__ = ("_loader", "_target")
+
+    def __init__(self, loader):
+        """Запам'ятовує завантажувач, не викликаючи його.
+
+        Args:
+            loader (callable): Функція без аргументів, що повертає справжній об'єкт.
+        """
+        object.__setattr__(self, "_loader", loader)
+        object.__setattr__(self, "_target", None)
+
+    def _load(self):
+        """Повертає справжній об'єкт, завантажуючи його під час першого виклику."""
+        if self._target is None:
+            object.__setattr__(self, "_target", self._loader())
+            object.__setattr__(self, "_loader", None)
+        return self._target
+
+    def __getattr__(self, name):
+        return getattr(self._load(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self._load(), name, value)
+
+    def __len__(self):
+        return len(self._load())
+
+    def __bool__(self):
+        return bool(self._load())
+
+    def __iter__(self):
+        return iter(self._load())
+
+    def __contains__(self, key):
+        return key in self._load()
+
+    def __getitem__(self, key):
+        return self._load()[key]
+
+    def __setitem__(self, key, value):
+        self._load()[key] = value
+
+    def __delitem__(self, key):
+        del self._load()[key]
+
+    def __str__(self):
+        return str(self._load())
+
+    def __repr__(self):
+        if self._target is None:
+            return "<LazyProxy (не завантажено)>"
+        return repr(self._target)
+
+    def __reduce_ex__(self, protocol):
+        """У pickle потрапляє справжній об'єкт, а не замісник.
+
+        Власний __reduce_ex__ об'єкта тут не підходить: з протоколу 2 pickle
+        перевіряє, що клас у ньому збігається з класом серіалізованого об'єкта.
+        """
+        return _loaded, (self._load(),)
+
+
+def _loaded(obj):
+    """Повертає об'єкт, збережений замість LazyProxy (відновлення з pickle)."""
+    return obj
+
+
+def is_loaded(obj) -> bool:
+    """Перевіряє, чи об'єкт уже в пам'яті (звичайні об'єкти завжди завантажені).
+
+    Args:
+        obj: LazyProxy або будь-який інший об'єкт.
+
+    Returns:
+        bool: False лише для замісника, якого ще не завантажували.
+    """
+    return not isinstance(obj, LazyProxy) or obj._target is not None
+
+
+def unwrap(obj):
+    """Повертає справжній об'єкт (за потреби завантажуючи його).
+
+    Args:
+        obj: LazyProxy або будь-який інший об'єкт.
+
+    Returns:
+        Справжній об'єкт; звичайні об'єкти повертаються без змін.
+    """
+    return obj._load() if isinstance(obj, LazyProxy) else obj
@@ -0,0 +1,340 @@
+"""Профілювання пам'яті (команда memory).
+
+Два незалежні погляди на пам'ять процесу:
+- tracemalloc: скільки байтів виділено кодом кожного модуля та якими
+  рядками, а також різниця між позначкою (memory mark) і поточним
+  станом (memory diff). Трасування вмикається прапорцем --trace-memory
+  під час запуску (тоді видно й завантаження даних) або командою
+  memory start; воно сповільнює роботу, тож за замовчуванням вимкнене;
+- обхід об'єктів (memory objects): розмір адресної книги й нотатника за
+  частинами — дані, індекси, кеші — і за типами об'єктів (Record, поля
+  Field, Note, рядки, контейнери). Кожен об'єкт рахується один раз, у
+  першій частині, де його знайдено; не завантажені ще файли (LazyProxy)
+  не читаються. Обхід не потребує tracemalloc і займає час, пропорційний
+  кількості об'єктів.
+"""
+
+import linecache
+import sqlite3
+import sys
+import tracemalloc
+from collections import Counter
+from datetime import date
+from pathlib import Path
+from types import BuiltinFunctionType, FunctionType, MethodType, ModuleType
+
+from .address_book import Field, Record
+from .lazy import is_loaded
+from .note_book import Note
+
+# Скільки кадрів стеку зберігає tracemalloc для кожного виділення.
+TRACE_FRAMES = 1
+
+# Скільки модулів і рядків показувати за замовчуванням.
+DEFAULT_TOP = 10
+
+# Атрибути сховищ даних, що є кешами (SQLite — прочитані записи, стовпцева книга — представлення).
+_CACHE_ATTRS = ("_cache", "_views")
+
+# Об'єкти, до яких обхід не заходить: спільні для всього процесу, а не частина даних.
+_SKIP_TYPES = (type, ModuleType, FunctionType, BuiltinFunctionType, MethodType, sqlite3.Connection)
+
+_PACKAGE_DIR = Path(__file__).resolve().parent.parent
+
+# Виділення, яких не показуємо: сам tracemalloc, імпорт модулів і цей модуль.
+_EXCLUDED = frozenset((
+    tracemalloc.__file__,
+    __file__,
+    "<frozen importlib._bootstrap>",
+    "<frozen importlib._bootstrap_external>",
+    "<unknown>",
+))
+
+# Знімок, збережений командою memory mark.
+_mark: tracemalloc.Snapshot | None = None
+
+
+def start_tracing(frames: int = TRACE_FRAMES) -> bool:
+    """Вмикає tracemalloc, якщо його ще не ввімкнено.
+
+    Args:
+        frames (int): Кількість кадрів стеку для кожного виділення.
+
+    Returns:
+        bool: True, якщо трасування ввімкнено цим викликом.
+    """
+    if tracemalloc.is_tracing():
+        return False
+    tracemalloc.start(frames)
+    return True
+
+
+def _format_bytes(size: int, signed: bool = False) -> str:
+    """Форматує кількість байтів (Б, КіБ, МіБ, ГіБ), за потреби зі знаком."""
+    sign = ("+" if size >= 0 else "-") if signed else ("-" if size < 0 else "")
+    value = float(abs(size))
+    for unit in ("Б", "КіБ", "МіБ"):
+        if value < 1024:
+            return f"{sign}{value:.0f} {unit}" if unit == "Б" else f"{sign}{value:.1f} {unit}"
+        value /= 1024
+    return f"{sign}{value:.1f} ГіБ"
+
+
+def _short_path(filename: str) -> str:
+    """Скорочує шлях модуля: відносно пакета застосунку або до двох останніх частин."""
+    path = Path(filename)
+    try:
+        return str(path.resolve().relative_to(_PACKAGE_DIR))
+    except (ValueError, OSError):
+        return str(Path(*path.parts[-2:])) if len(path.parts) > 1 else filename
+
+
+def _site(frame) -> str:
+    """Описує місце виділення: модуль:рядок і сам рядок коду."""
+    source = linecache.getline(frame.filename, frame.lineno).strip()
+    if len(source) > 60:
+        source = source[:59] + "…"
+    return f"{_short_path(frame.filename)}:{frame.lineno}  {source}"
+
+
+def _by_line(previous: tracemalloc.Snapshot | None = None) -> list:
+    """Повертає статистику виділень за рядками коду (або її зміну відносно знімка previous).
+
+    Виключені файли (_EXCLUDED) відкидаються з готової статистики, а не зі
+    знімка: Snapshot.filter_traces перевіряє кожне виділення окремо й на
+    сотнях тисяч виділень працює секундами.
+    """
+    snapshot = tracemalloc.take_snapshot()
+    stats = snapshot.compare_to(previous, "lineno") if previous else snapshot.statistics("lineno")
+    return [stat for stat in stats if stat.traceback[0].filename not in _EXCLUDED]
+
+
+def _by_file(stats: list, diff: bool = False) -> list[tuple[str, int, int]]:
+    """Групує статистику рядків за модулями: (файл, байти, блоки), найбільші — першими."""
+    totals = {}
+    for stat in stats:
+        entry = totals.setdefault(stat.traceback[0].filename, [0, 0])
+        entry[0] += stat.size_diff if diff else stat.size
+        entry[1] += stat.count_diff if diff else stat.count
+    return sorted(
+        ((filename, size, count) for filename, (size, count) in totals.items()),
+        key=lambda item: abs(item[1]), reverse=True,
+    )
+
+
+def _trace_report(top: int):
+    """Формує звіт tracemalloc: загальний обсяг, модулі та рядки з найбільшими виділеннями."""
+    current, peak = tracemalloc.get_traced_memory()
+    stats = _by_line()
+    yield f"Відстежується: {_format_bytes(current)} (пік {_format_bytes(peak)})."
+    yield ""
+    yield f"Модулі з найбільшими виділеннями (перші {top}):"
+    for filename, size, count in _by_file(stats)[:top]:
+        yield f"  {_format_bytes(size):>10}  {count:>9} блоків  {_short_path(filename)}"
+    yield ""
+    yield f"Рядки з найбільшими виділеннями (перші {top}):"
+    for stat in stats[:top]:
+        yield f"  {_format_bytes(stat.size):>10}  {stat.count:>9} блоків  {_site(stat.traceback[0])}"
+
+
+def _diff_report(top: int):
+    """Формує різницю між позначкою та поточним станом (модулі та рядки)."""
+    stats = _by_line(_mark)
+    by_file = _by_file(stats, diff=True)
+    yield f"Зміна з моменту позначки: {_format_bytes(sum(size for _, size, _ in by_file), signed=True)}."
+    yield ""
+    yield f"Модулі з найбільшою зміною (перші {top}):"
+    for filename, size, count in by_file[:top]:
+        if size:
+            yield f"  {_format_bytes(size, signed=True):>11}  {count:>+9} блоків  {_short_path(filename)}"
+    yield ""
+    yield f"Рядки з найбільшою зміною (перші {top}):"
+    for stat in stats[:top]:
+        if stat.size_diff:
+            yield (
+                f"  {_format_bytes(stat.size_diff, signed=True):>11}  "
+                f"{stat.count_diff:>+9} блоків  {_site(stat.traceback[0])}"
+            )
+
+
+def _kind(obj) -> str:
+    """Повертає категорію об'єкта для звіту за типами."""
+    if isinstance(obj, Record):
+        return "Record"
+    if isinstance(obj, Field):
+        return "поля (Field)"
+    if isinstance(obj, Note):
+        return "Note"
+    if isinstance(obj, str):
+        return "рядки (str)"
+    if isinstance(obj, (bytes, bytearray)) or hasattr(obj, "typecode") or hasattr(obj, "dtype"):
+        return "масиви та байти"
+    if isinstance(obj, dict):
+        return "dict"
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return "list / tuple / set"
+    if isinstance(obj, date):
+        return "дати"
+    return "інше"
+
+
+def _slot_names(cls: type) -> tuple[str, ...]:
+    """Повертає імена __slots__ класу та його предків (крім __dict__ і __weakref__)."""
+    names = []
+    for base in cls.__mro__:
+        slots = base.__dict__.get("__slots__", ())
+        names.extend((slots,) if isinstance(slots, str) else slots)
+    return tuple(name for name in names if name not in ("__dict__", "__weakref__"))
+
+
+def _deep_size(root, seen: set[int], kinds: Counter, types: dict) -> int:
+    """Рахує розмір об'єкта й усього, що з нього досяжне, крім уже врахованого.
+
+    Args:
+        root: Початковий об'єкт.
+        seen (set[int]): id уже врахованих об'єктів (доповнюється).
+        kinds (Counter): Розміри за категоріями _kind (доповнюється).
+        types (dict): Кеш тип → (категорія, спосіб обходу, імена слотів), спільний для викликів.
+
+    Returns:
+        int: Кількість байтів (sys.getsizeof) нових об'єктів.
+    """
+    total = 0
+    stack = [root]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        cls = type(obj)
+        info = types.get(cls)
+        if info is None:
+            if issubclass(cls, _SKIP_TYPES) or obj is None:
+                info = types[cls] = None, None, ()
+            elif issubclass(cls, dict):
+                info = types[cls] = _kind(obj), "dict", ()
+            elif issubclass(cls, (list, tuple, set, frozenset)):
+                info = types[cls] = _kind(obj), "items", ()
+            elif issubclass(cls, (str, bytes, bytearray, int, float, date)):
+                info = types[cls] = _kind(obj), None, ()
+            else:
+                info = types[cls] = _kind(obj), "attrs", _slot_names(cls)
+        kind, walk, slots = info
+        if kind is None:
+            continue
+        seen.add(id(obj))
+        size = sys.getsizeof(obj)
+        total += size
+        kinds[kind] += size
+        if walk == "dict":
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif walk == "items":
+            stack.extend(obj)
+        elif walk == "attrs":
+            attrs = getattr(obj, "__dict__", None)
+            if attrs is not None:
+                stack.append(attrs)
+            for slot in slots:
+                stack.append(getattr(obj, slot, None))
+    return total
+
+
+def _objects_report(book, notes):
+    """Формує звіт про розмір книги й нотатника за частинами та за типами об'єктів."""
+    owners = []
+    for title, owner in (("Контакти", book), ("Нотатки", notes)):
+        if is_loaded(owner):
+            owners.append((title, getattr(owner, "_target", None) or owner))
+        else:
+            owners.append((title, None))
+
+    # Самі книги та їхні словники атрибутів не відносимо до жодної частини,
+    # щоб зворотні посилання (Record._book, Note._notebook) не тягнули за собою індекси.
+    seen = set()
+    for _, owner in owners:
+        if owner is not None:
+            seen.update((id(owner), id(owner.__dict__)))
+    kinds: Counter = Counter()
+    types = {}
+    yield "Пам'ять за частинами:"
+    grand_total = 0
+    for title, owner in owners:
+        if owner is None:
+            yield f"  {title}: файл ще не завантажено."
+            continue
+        data = owner.data
+        caches = sum(
+            _deep_size(getattr(data, attr), seen, kinds, types) for attr in _CACHE_ATTRS if hasattr(data, attr)
+        )
+        stored = _deep_size(data, seen, kinds, types)
+        indexes = sum(
+            _deep_size(value, seen, kinds, types) for name, value in vars(owner).items() if name != "data"
+        )
+        grand_total += caches + stored + indexes
+        yield f"  {title} — дані: {_format_bytes(stored)}, індекси: {_format_bytes(indexes)}, кеші: {_format_bytes(caches)}"
+    yield f"  Разом: {_format_bytes(grand_total)}"
+    yield ""
+    yield "За типами об'єктів:"
+    for kind, size in kinds.most_common():
+        yield f"  {_format_bytes(size):>10}  {kind}"
+
+
+def memory(args, book, notes):
+    """Команда memory: профілювання пам'яті.
+
+    Формат:
+        memory [--top N]        — обсяг і найбільші виділення (tracemalloc)
+        memory start | stop     — увімкнути / вимкнути трасування
+        memory mark             — запам'ятати поточний стан (і скинути пік)
+        memory diff [--top N]   — зміна відносно позначки
+        memory objects          — розмір книги й нотатника за частинами та типами
+
+    Args:
+        args (list[str]): Підкоманда та параметри.
+        book: Екземпляр AddressBook.
+        notes: Екземпляр NoteBook.
+
+    Returns:
+        Iterator[str] | str: Рядки звіту або повідомлення.
+    """
+    global _mark
+    usage = "Помилка: команда 'memory' очікує: memory [start | stop | mark | diff | objects] [--top N]."
+    top = DEFAULT_TOP
+    if len(args) >= 2 and args[-2] == "--top":
+        if not args[-1].isdigit() or int(args[-1]) < 1:
+            return "Помилка: значення --top має бути додатним цілим числом."
+        top = int(args[-1])
+        args = args[:-2]
+    if len(args) > 1:
+        return usage
+    action = args[0] if args else None
+
+    if action == "objects":
+        return _objects_report(book, notes)
+    if action == "start":
+        if not start_tracing():
+            return "Трасування пам'яті вже ввімкнено."
+        return "Трасування пам'яті ввімкнено: відстежуються виділення, зроблені після цієї команди."
+    if action == "stop":
+        if not tracemalloc.is_tracing():
+            return "Трасування пам'яті не ввімкнено."
+        tracemalloc.stop()
+        _mark = None
+        return "Трасування пам'яті вимкнено."
+    if action not in (None, "mark", "diff"):
+        return usage
+    if not tracemalloc.is_tracing():
+        return (
+            "Трасування пам'яті не ввімкнено. Запустіть програму з --trace-memory "
+            "або виконайте memory start (memory objects працює без трасування)."
+        )
+    if action == "mark":
+        _mark = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        current, _ = tracemalloc.get_traced_memory()
+        return f"Позначку збережено: відстежується {_format_bytes(current)}. Порівняння: memory diff."
+    if action == "diff":
+        if _mark is None:
+            return "Помилка: спочатку збережіть позначку командою memory mark."
+        return _diff_report(top)
+    return _trace_report(top)
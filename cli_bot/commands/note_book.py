@@ -4,18 +4,101 @@
 - створення нотаток із назвою, текстом і тегами;
 - редагування та видалення нотаток;
 - пошук за назвою;
-- пошук за тегами;
-- сортування нотаток за тегами;
+- ранжований повнотекстовий пошук (BM25) за назвою та текстом;
+- пошук за тегами з умовами «будь-який», «обов'язковий» (+тег) та «виключений» (-тег);
+- сортування нотаток за тегами (порядок підтримується інкрементально, з посторінковим доступом);
+- підказки схожих назв і тегів при помилках у введенні;
 - форматований кольоровий вивід нотатки у CLI.
 """
 
-from collections import UserDict
+from bisect import bisect_left, insort
+from collections import Counter, UserDict
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime
+import heapq
+import math
+import re
+import sys
 from colorama import Fore, Style
 
+from .decorator import Refusal
+from .fuzzy import BKTree
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+# Час, яким позначаються нові нотатки, поки діє frozen_time (None — поточний час).
+_frozen_time: ContextVar[datetime | None] = ContextVar("frozen_time", default=None)
+
+
+@contextmanager
+def frozen_time(moment: datetime | None):
+    """Фіксує час створення нових нотаток на час виконання блоку.
+
+    Змінююча команда виконується з одним моментом часу, який журнал
+    записує разом із командою, а під час відтворення журналу фіксується
+    той самий момент — тож дати нотаток після перезапуску не змінюються.
+
+    Args:
+        moment (datetime | None): Момент часу (None — не фіксувати).
+    """
+    token = _frozen_time.set(moment)
+    try:
+        yield
+    finally:
+        _frozen_time.reset(token)
+
+
+def tokenize(text: str) -> list[str]:
+    """Розбиває текст на слова в нижньому регістрі для повнотекстового індексу.
+
+    Args:
+        text (str): Довільний текст.
+
+    Returns:
+        list[str]: Список термінів.
+    """
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+def parse_tag_query(tags_query: str) -> tuple[set[str], set[str], set[str]]:
+    """Розбирає булевий запит за тегами.
+
+    Теги розділяються пробілами або комами:
+    - «тег» — нотатка має містити хоча б один із таких тегів (OR);
+    - «+тег» — тег обов'язковий (AND);
+    - «-тег» — нотатка не повинна містити тег (NOT).
+
+    Args:
+        tags_query (str): Рядок запиту, наприклад «work,urgent -archived».
+
+    Returns:
+        tuple[set[str], set[str], set[str]]: Теги «будь-який», «обов'язкові» та «виключені».
+    """
+    any_tags, all_tags, none_tags = set(), set(), set()
+    for token in tags_query.replace(',', ' ').split():
+        token = token.strip().lower()
+        if token.startswith("+") and len(token) > 1:
+            all_tags.add(token[1:])
+        elif token.startswith("-") and len(token) > 1:
+            none_tags.add(token[1:])
+        else:
+            any_tags.add(token)
+    return any_tags, all_tags, none_tags
+
 
 class Note:
-    """Окрема нотатка з назвою, текстом, датою створення та тегами."""
+    """Окрема нотатка з назвою, текстом, датою створення та тегами.
+
+    Текст нотатки, збереженої у файлі текстів (див. note_store), читається
+    лише під час першого звернення до text: нотатка пам'ятає його зміщення
+    та довжину (_body), а нотатник — звідки читати.
+
+    Атрибути зберігаються в __slots__, а теги інтернуються (sys.intern),
+    тож однакові теги різних нотаток — один рядок у пам'яті.
+    """
+
+    __slots__ = ("title", "_text", "_body", "created_at", "tags", "_notebook")
 
     def __init__(self, title, text, tags=None):
         """Створює нову нотатку.
@@ -26,18 +109,72 @@ class Note:
             tags (iterable[str] | None): Початкові теги (необов'язково).
         """
         self.title = title
+        self._body: tuple[int, int] | None = None
         self.text = text
-        self.created_at = datetime.now()
-        self.tags = set(tag.lower() for tag in tags) if tags else set()
+        self.created_at = _frozen_time.get() or datetime.now()
+        self.tags = set(sys.intern(tag.lower()) for tag in tags) if tags else set()
+        self._notebook: "NoteBook" | None = None
+
+    @property
+    def text(self) -> str:
+        """Текст нотатки (за потреби читається з файлу текстів нотатника)."""
+        if self._text is None and self._body is not None:
+            self._text = self._notebook.read_body(*self._body)
+        return self._text
+
+    @text.setter
+    def text(self, value: str) -> None:
+        self._text = value
+        self._body = None
+
+    def read_text(self) -> str:
+        """Повертає текст нотатки, не запам'ятовуючи прочитаний з файлу текст (для експорту)."""
+        if self._text is None and self._body is not None:
+            return self._notebook.read_body(*self._body)
+        return self._text
+
+    def __getstate__(self):
+        """Повертає стан для pickle (кортеж полів) без зворотного посилання на нотатник.
+
+        Якщо текст уже лежить у файлі текстів, зберігається лише посилання на нього.
+        """
+        text = self._text if self._body is None else None
+        return self.title, text, self._body, self.created_at, self.tags
+
+    def __setstate__(self, state):
+        """Відновлює стан із pickle (зокрема словник стану нотаток, збережених
+        до появи індексів, окремого файлу текстів і __slots__)."""
+        if isinstance(state, dict):
+            state = (
+                state["title"],
+                state["text"] if "text" in state else state.get("_text"),
+                state.get("_body"),
+                state["created_at"],
+                state.get("tags", set()),
+            )
+        self.title, self._text, self._body, self.created_at, tags = state
+        self.tags = {sys.intern(tag) for tag in tags}
+        self._notebook = None
 
     def add_tags(self, new_tags):
         """Додає один або кілька тегів до нотатки.
 
+        Нові теги одразу потрапляють до індексу тегів нотатника, якому належить нотатка.
+
         Args:
             new_tags (iterable[str]): Список або інший ітератор тегів.
         """
+        added = False
         for tag in new_tags:
-            self.tags.add(tag.lower())
+            tag = sys.intern(tag.lower())
+            if tag in self.tags:
+                continue
+            self.tags.add(tag)
+            added = True
+            if self._notebook is not None:
+                self._notebook._index_tag(tag, self.title.lower())
+        if added and self._notebook is not None:
+            self._notebook._update_sort_entry(self.title.lower(), self)
 
     def __str__(self):
         """Повертає нотатку у кольоровому форматі для CLI-виводу.
@@ -67,7 +204,188 @@ class Note:
 
 
 class NoteBook(UserDict):
-    """Колекція нотаток, що забезпечує пошук, редагування і зберігання."""
+    """Колекція нотаток, що забезпечує пошук, редагування і зберігання.
+
+    Підтримує індекси, які оновлюються методами add, edit, delete та Note.add_tags:
+    - інвертований індекс термін → {ключ нотатки: частота терміна} за назвою та текстом;
+    - індекс тег → множина ключів нотаток;
+    - відсортований список нотаток за найменшим тегом (без тегів — у кінці);
+    - BK-дерева назв і тегів для підказок при помилках (будуються під час
+      першої підказки, далі оновлюються разом з іншими індексами).
+    Індекси не зберігаються в pickle і перебудовуються під час завантаження,
+    причому інвертований індекс — лише під час першого повнотекстового пошуку,
+    бо для нього потрібні тексти всіх нотаток.
+
+    Тексти нотаток можуть лежати в окремому файлі (_bodies_file, див. note_store);
+    тоді нотатник читає їх на вимогу через read_body.
+    """
+
+    _INDEX_ATTRS = (
+        "_postings", "_doc_lengths", "_total_length", "_text_indexed", "_tag_index", "_order",
+        "_next_order", "_sorted_by_tag", "_sort_entries", "_title_tree", "_tag_tree",
+    )
+    BM25_K1 = 1.5
+    BM25_B = 0.75
+
+    def __init__(self, *args, **kwargs):
+        """Створює порожній нотатник з індексами та (за потреби) наповнює його."""
+        self._bodies_file: str | None = None
+        self._bodies = None
+        self._reset_indexes()
+        super().__init__(*args, **kwargs)
+
+    def __setitem__(self, key, note):
+        """Зберігає нотатку під ключем, підтримуючи індекси в актуальному стані."""
+        old = self.data.get(key)
+        if old is not None:
+            self._detach(key, old)
+        self.data[key] = note
+        self._attach(key, note)
+
+    def __delitem__(self, key):
+        """Видаляє нотатку за ключем разом із її записами в індексах."""
+        note = self.data.pop(key)
+        self._detach(key, note)
+
+    def __getstate__(self):
+        """Повертає стан для pickle без індексів (вони відновлюються при завантаженні)."""
+        state = self.__dict__.copy()
+        for attr in self._INDEX_ATTRS:
+            state.pop(attr, None)
+        state.pop("_bodies", None)
+        return state
+
+    def __setstate__(self, state):
+        """Відновлює нотатник з pickle та перебудовує індекси."""
+        state.setdefault("_bodies_file", None)
+        self.__dict__.update(state)
+        self._bodies = None
+        self.rebuild_indexes()
+
+    def read_body(self, offset: int, length: int) -> str:
+        """Читає текст нотатки з файлу текстів.
+
+        Args:
+            offset (int): Зміщення тексту у файлі.
+            length (int): Довжина тексту в байтах.
+
+        Returns:
+            str: Текст нотатки.
+        """
+        return self._bodies.read(offset, length)
+
+    def rebuild_indexes(self) -> None:
+        """Перебудовує всі індекси з нуля за поточними нотатками."""
+        self._reset_indexes()
+        for key, note in self.data.items():
+            self._attach(key, note)
+
+    def _reset_indexes(self) -> None:
+        """Створює порожні індекси."""
+        self._postings: dict[str, dict[str, int]] = {}
+        self._doc_lengths: dict[str, int] = {}
+        self._total_length = 0
+        self._text_indexed = False
+        self._tag_index: dict[str, set[str]] = {}
+        self._order: dict[str, int] = {}
+        self._next_order = 0
+        self._sorted_by_tag: list[tuple[bool, str, int, str]] = []
+        self._sort_entries: dict[str, tuple[bool, str, int, str]] = {}
+        self._title_tree: BKTree | None = None
+        self._tag_tree: BKTree | None = None
+
+    def _attach(self, key: str, note: Note) -> None:
+        """Прив'язує нотатку до нотатника та додає її до індексів."""
+        note._notebook = self
+        self._order[key] = self._next_order
+        self._next_order += 1
+        self._index_text(key, note)
+        for tag in note.tags:
+            self._index_tag(tag, key)
+        self._update_sort_entry(key, note)
+        if self._title_tree is not None:
+            self._title_tree.add(note.title)
+
+    def _detach(self, key: str, note: Note) -> None:
+        """Відв'язує нотатку від нотатника та прибирає її з індексів."""
+        self._unindex_text(key, note)
+        for tag in note.tags:
+            self._unindex_tag(tag, key)
+        self._remove_sort_entry(key)
+        self._order.pop(key, None)
+        if self._title_tree is not None:
+            self._title_tree.discard(note.title)
+        note._notebook = None
+
+    def _index_tag(self, tag: str, key: str) -> None:
+        """Додає ключ нотатки до множини нотаток із цим тегом."""
+        if tag not in self._tag_index and self._tag_tree is not None:
+            self._tag_tree.add(tag)
+        self._tag_index.setdefault(tag, set()).add(key)
+
+    def _update_sort_entry(self, key: str, note: Note) -> None:
+        """Вставляє (або переставляє) нотатку у відсортованому за тегами списку.
+
+        Ключ сортування — (немає тегів, найменший тег, порядок додавання),
+        тож нотатки без тегів ідуть у кінці, а рівні — у порядку додавання.
+        """
+        entry = (not note.tags, min(note.tags, default=""), self._order[key], key)
+        if self._sort_entries.get(key) == entry:
+            return
+        self._remove_sort_entry(key)
+        insort(self._sorted_by_tag, entry)
+        self._sort_entries[key] = entry
+
+    def _remove_sort_entry(self, key: str) -> None:
+        """Прибирає нотатку з відсортованого за тегами списку."""
+        entry = self._sort_entries.pop(key, None)
+        if entry is None:
+            return
+        index = bisect_left(self._sorted_by_tag, entry)
+        del self._sorted_by_tag[index]
+
+    def _unindex_tag(self, tag: str, key: str) -> None:
+        """Прибирає ключ нотатки з індексу тегу та видаляє порожній тег."""
+        keys = self._tag_index.get(tag)
+        if keys is None:
+            return
+        keys.discard(key)
+        if not keys:
+            del self._tag_index[tag]
+            if self._tag_tree is not None:
+                self._tag_tree.discard(tag)
+
+    def _ensure_text_index(self) -> None:
+        """Будує інвертований індекс під час першого повнотекстового пошуку."""
+        if self._text_indexed:
+            return
+        self._text_indexed = True
+        for key, note in self.data.items():
+            self._index_text(key, note)
+
+    def _index_text(self, key: str, note: Note) -> None:
+        """Додає терміни назви й тексту нотатки до інвертованого індексу (якщо він уже побудований)."""
+        if not self._text_indexed:
+            return
+        counts = Counter(tokenize(note.title) + tokenize(note.text))
+        for term, freq in counts.items():
+            self._postings.setdefault(term, {})[key] = freq
+        length = sum(counts.values())
+        self._doc_lengths[key] = length
+        self._total_length += length
+
+    def _unindex_text(self, key: str, note: Note) -> None:
+        """Прибирає терміни нотатки з інвертованого індексу (якщо він уже побудований)."""
+        if not self._text_indexed:
+            return
+        for term in set(tokenize(note.title) + tokenize(note.text)):
+            postings = self._postings.get(term)
+            if postings is None:
+                continue
+            postings.pop(key, None)
+            if not postings:
+                del self._postings[term]
+        self._total_length -= self._doc_lengths.pop(key, 0)
 
     def add(self, note: Note):
         """Додає нову нотатку до нотатника.
@@ -78,9 +396,18 @@ class NoteBook(UserDict):
         Returns:
             str: Повідомлення про успішне додавання.
         """
-        self.data[note.title.lower()] = note
+        self[note.title.lower()] = note
         return f"Нотатку '{note.title}' додано."
 
+    def add_notes(self, notes) -> None:
+        """Додає пакет нових нотаток (назв яких ще немає в нотатнику) для масового імпорту.
+
+        Args:
+            notes (Iterable[Note]): Нові нотатки з унікальними назвами.
+        """
+        for note in notes:
+            self[note.title.lower()] = note
+
     def edit(self, title, new_text):
         """Редагує текст нотатки.
 
@@ -91,10 +418,13 @@ class NoteBook(UserDict):
         Returns:
             str: Повідомлення про результат.
         """
-        note = self.data.get(title.lower())
+        key = title.lower()
+        note = self.data.get(key)
         if not note:
-            return f"Нотатку '{title}' не знайдено."
+            return Refusal(f"Нотатку '{title}' не знайдено.")
+        self._unindex_text(key, note)
         note.text = new_text
+        self._index_text(key, note)
         return f"Нотатку '{title}' оновлено."
 
     def add_tags(self, title, tags):
@@ -112,35 +442,94 @@ class NoteBook(UserDict):
         if note:
             note.add_tags(tags)
             return f"До нотатки '{title}' додано теги: {', '.join(tags)}"
-        return f"Помилка: Нотатка з назвою '{title}' не знайдена."
+        return Refusal(f"Помилка: Нотатка з назвою '{title}' не знайдена.")
 
     def find_by_tags(self, tags_query):
-        """Шукає нотатки за одним або кількома тегами.
+        """Шукає нотатки за булевим запитом тегів (див. parse_tag_query).
+
+        Запит обчислюється операціями над множинами з індексу тегів,
+        тож вартість залежить від кількості відповідних нотаток, а не від розміру нотатника.
+        Лише запит, що складається тільки з виключень, стартує з усіх нотаток.
 
         Args:
             tags_query (str): Рядок із тегами, розділеними пробілами або комами.
 
         Returns:
-            list[Note]: Список відповідних нотаток.
+            list[Note]: Список відповідних нотаток у порядку додавання.
         """
-        search_tags = {tag.strip().lower() for tag in tags_query.replace(',', ' ').split()}
-        return [note for note in self.data.values() if note.tags.intersection(search_tags)]
+        any_tags, all_tags, none_tags = parse_tag_query(tags_query)
+        if not (any_tags or all_tags or none_tags):
+            return []
+
+        empty: set[str] = set()
+        if any_tags:
+            matched = set().union(*(self._tag_index.get(tag, empty) for tag in any_tags))
+        elif all_tags:
+            smallest = min(all_tags, key=lambda tag: len(self._tag_index.get(tag, empty)))
+            matched = set(self._tag_index.get(smallest, empty))
+        else:
+            matched = set(self.data)
+        for tag in all_tags:
+            matched &= self._tag_index.get(tag, empty)
+        for tag in none_tags:
+            matched -= self._tag_index.get(tag, empty)
+
+        return [self.data[key] for key in sorted(matched, key=self._order.__getitem__)]
 
-    def sort_by_tags(self):
-        """Сортує нотатки за алфавітом першого тегу.
+    def sort_by_tags(self, offset: int = 0, limit: int | None = None):
+        """Повертає нотатки, впорядковані за алфавітом першого тегу.
 
-        Нотатки без тегів розміщуються в кінці.
+        Нотатки без тегів розміщуються в кінці. Порядок підтримується
+        інкрементально, тому виклик лише проходить готовий список,
+        а offset / limit дозволяють взяти одну сторінку без решти нотаток.
+
+        Args:
+            offset (int): Кількість нотаток, які треба пропустити.
+            limit (int | None): Максимальна кількість нотаток (None — усі).
 
         Returns:
             list[Note]: Відсортований список нотаток.
         """
+        end = None if limit is None else offset + limit
+        return [self.data[entry[3]] for entry in self._sorted_by_tag[offset:end]]
 
-        def sort_key(note):
-            if note.tags:
-                return sorted(note.tags)[0]
-            return "zzzzz"  # гарантія, що безтеговi підуть у кінець
+    def _titles(self):
+        """Повертає назви всіх нотаток (для побудови дерева підказок)."""
+        return (note.title for note in self.data.values())
 
-        return sorted(self.data.values(), key=sort_key)
+    def _tags(self):
+        """Повертає всі наявні теги (для побудови дерева підказок)."""
+        return self._tag_index
+
+    def suggest_titles(self, title: str, limit: int = 3) -> list[str]:
+        """Підказує назви існуючих нотаток, схожі на введену.
+
+        Args:
+            title (str): Назва, якої немає в нотатнику.
+            limit (int): Найбільша кількість підказок.
+
+        Returns:
+            list[str]: Схожі назви (порожній список, якщо нотатка існує).
+        """
+        if title.lower() in self.data:
+            return []
+        if self._title_tree is None:
+            self._title_tree = BKTree(self._titles())
+        return self._title_tree.closest(title, limit)
+
+    def suggest_tags(self, tag: str, limit: int = 3) -> list[str]:
+        """Підказує наявні теги, схожі на введений.
+
+        Args:
+            tag (str): Тег із запиту.
+            limit (int): Найбільша кількість підказок.
+
+        Returns:
+            list[str]: Схожі теги (порожній список, якщо такий тег є).
+        """
+        if self._tag_tree is None:
+            self._tag_tree = BKTree(self._tags())
+        return self._tag_tree.closest(tag.lower(), limit)
 
     def find(self, query: str):
         """Пошук нотаток за частковим входженням назви.
@@ -154,6 +543,38 @@ class NoteBook(UserDict):
         query_lower = query.lower()
         return [note for note in self.data.values() if query_lower in note.title.lower()]
 
+    def search(self, query: str, limit: int = 10) -> list[Note]:
+        """Ранжований повнотекстовий пошук нотаток за назвою та текстом (BM25).
+
+        Оцінюються лише нотатки зі списків входжень термінів запиту,
+        а найкращі результати відбираються через купу без повного сортування.
+
+        Args:
+            query (str): Пошуковий запит (одне або кілька слів).
+            limit (int): Максимальна кількість результатів.
+
+        Returns:
+            list[Note]: Нотатки за спаданням релевантності.
+        """
+        self._ensure_text_index()
+        doc_count = len(self._doc_lengths)
+        if not doc_count or limit <= 0:
+            return []
+        avg_length = self._total_length / doc_count or 1
+        scores: dict[str, float] = {}
+        for term in set(tokenize(query)):
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (doc_count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for key, freq in postings.items():
+                norm = 1 - self.BM25_B + self.BM25_B * self._doc_lengths[key] / avg_length
+                scores[key] = scores.get(key, 0.0) + idf * freq * (self.BM25_K1 + 1) / (
+                    freq + self.BM25_K1 * norm
+                )
+        best = heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+        return [self.data[key] for key, _ in best]
+
     def delete(self, title):
         """Видаляє нотатку за назвою.
 
@@ -165,6 +586,6 @@ class NoteBook(UserDict):
         """
         key = title.lower()
         if key in self.data:
-            del self.data[key]
+            del self[key]
             return f"Нотатка {title} видалено."
-        return f"{title} не знайдено."
+        return Refusal(f"{title} не знайдено.")
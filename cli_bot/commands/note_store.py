@@ -0,0 +1,144 @@
+"""Окремий файл текстів нотаток для режимів pickle та journal.
+
+notes.pkl містить лише «легкий» нотатник: назви, теги, дати та для кожної
+нотатки зміщення й довжину її тексту у файлі notes.<ідентифікатор>.bodies.
+Тому під час завантаження читається тільки індекс, а текст — коли нотатку
+вперше показують, редагують чи шукають за змістом.
+
+Нові та змінені тексти дописуються в кінець файлу текстів перед записом
+індексу. Уже записані фрагменти ніколи не переписуються, тож збережений
+індекс завжди посилається на цілі тексти. Коли застарілі фрагменти займають
+більшу частину файлу, тексти переписуються в новий файл з іншим
+ідентифікатором, а старий видаляється після запису індексу.
+"""
+
+import os
+import pickle
+import secrets
+from pathlib import Path
+
+# Файл текстів стискається, коли застарілі фрагменти займають понад половину
+# файлу й щонайменше стільки байтів.
+BODIES_COMPACT_MIN_BYTES = 1024 * 1024
+
+
+class NoteBodies:
+    """Файл текстів нотаток, з якого тексти читаються за зміщенням і довжиною."""
+
+    def __init__(self, path):
+        """Запам'ятовує шлях; файл відкривається під час першого читання.
+
+        Args:
+            path (str | Path): Шлях до файлу текстів.
+        """
+        self.path = Path(path)
+        self._file = None
+
+    def read_bytes(self, offset: int, length: int) -> bytes:
+        """Читає фрагмент файлу.
+
+        Args:
+            offset (int): Зміщення фрагмента.
+            length (int): Довжина фрагмента в байтах.
+
+        Returns:
+            bytes: Прочитані байти.
+        """
+        if self._file is None:
+            self._file = self.path.open("rb")
+        self._file.seek(offset)
+        return self._file.read(length)
+
+    def read(self, offset: int, length: int) -> str:
+        """Читає текст нотатки.
+
+        Args:
+            offset (int): Зміщення тексту.
+            length (int): Довжина тексту в байтах.
+
+        Returns:
+            str: Текст у UTF-8.
+        """
+        return self.read_bytes(offset, length).decode("utf-8")
+
+    def close(self) -> None:
+        """Закриває файл, якщо його було відкрито."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def load_notes(note_path: Path):
+    """Завантажує нотатник із pickle-файлу та підключає його файл текстів.
+
+    Args:
+        note_path (Path): Шлях до notes.pkl.
+
+    Returns:
+        NoteBook: Нотатник; тексти читаються з диска на вимогу.
+    """
+    with note_path.open("rb") as f:
+        notes = pickle.load(f)
+    if getattr(notes, "_bodies_file", None):
+        notes._bodies = NoteBodies(note_path.parent / notes._bodies_file)
+    return notes
+
+
+def _new_bodies_name(note_path: Path) -> str:
+    """Повертає ім'я нового файлу текстів поруч із notes.pkl."""
+    return f"{note_path.stem}.{secrets.token_hex(4)}.bodies"
+
+
+def store_bodies(notes, note_path: Path) -> Path | None:
+    """Записує нові та змінені тексти у файл текстів перед збереженням індексу.
+
+    Після виклику всі нотатки посилаються на файл текстів, тож pickle
+    нотатника містить лише посилання. Якщо файл текстів було переписано
+    начисто, повертається шлях старого файлу — його слід видалити після
+    того, як новий індекс записано.
+
+    Args:
+        notes (NoteBook): Нотатник.
+        note_path (Path): Шлях до notes.pkl.
+
+    Returns:
+        Path | None: Старий файл текстів, який більше не потрібен.
+    """
+    notes_list = list(notes.data.values())
+    old_store = notes._bodies
+    old_path = old_store.path if old_store is not None else None
+
+    pending = [note for note in notes_list if note._body is None]
+    live = sum(note._body[1] for note in notes_list if note._body is not None)
+    size = old_path.stat().st_size if old_path is not None and old_path.exists() else 0
+    garbage = size - live
+    compact = old_path is None or not size or (garbage > live and garbage >= BODIES_COMPACT_MIN_BYTES)
+
+    if compact:
+        name = _new_bodies_name(note_path)
+        path = note_path.parent / name
+        with path.open("wb") as f:
+            for note in notes_list:
+                if note._body is not None and note._text is None:
+                    data = old_store.read_bytes(*note._body)
+                else:
+                    data = note.text.encode("utf-8")
+                note._body = (f.tell(), len(data))
+                f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        if old_store is not None:
+            old_store.close()
+        notes._bodies_file = name
+        notes._bodies = NoteBodies(path)
+        return old_path if old_path is not None and old_path != path else None
+
+    if pending:
+        with old_path.open("ab") as f:
+            for note in pending:
+                data = note.text.encode("utf-8")
+                note._body = (f.tell(), len(data))
+                f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+    return None
@@ -5,8 +5,11 @@
 Усі функції інтегровані з декоратором input_error для обробки помилок.
 """
 
+from itertools import islice
+
 from .decorator import input_error
 from .note_book import Note
+from .parser import parse_paging
 
 
 @input_error
@@ -48,6 +51,35 @@ def find_note(args, notes):
     return "\n\n".join(str(r) for r in results) if results else "Нотаток не знайдено."
 
 
+@input_error
+def search_notes(args, notes):
+    """Ранжований пошук нотаток за словами з назви та тексту.
+
+    Формат:
+        search-notes <слова> [--top N]
+
+    Args:
+        args (list[str]): [*query_words] з необов'язковим «--top N» у кінці.
+        notes (NoteBook): Колекція нотаток.
+
+    Returns:
+        str: Найрелевантніші нотатки або повідомлення про відсутність результатів.
+    """
+    limit = 10
+    if len(args) >= 2 and args[-2] == "--top":
+        try:
+            limit = int(args[-1])
+        except ValueError:
+            return "Помилка: значення --top має бути цілим числом."
+        args = args[:-2]
+
+    if len(args) < 1:
+        return "Помилка: команда 'search-notes' очікує мінімум 1 аргумент: search-notes <слова> [--top N]"
+
+    results = notes.search(" ".join(args), limit)
+    return "\n\n".join(str(r) for r in results) if results else "Нотаток не знайдено."
+
+
 @input_error
 def edit_note(args, notes):
     """Редагує текст існуючої нотатки.
@@ -85,19 +117,43 @@ def delete_note(args, notes):
     return notes.delete(title)
 
 
+def _iter_notes(notes_iter):
+    """Форматує нотатки по одній, відокремлюючи їх порожнім рядком.
+
+    Args:
+        notes_iter (Iterable[Note]): Нотатки для виводу.
+
+    Yields:
+        str: Текст чергової нотатки.
+    """
+    for index, note in enumerate(notes_iter):
+        yield str(note) if index == 0 else "\n" + str(note)
+
+
 @input_error
-def show_notes(notes):
-    """Виводить усі нотатки.
+def show_notes(args, notes):
+    """Виводить усі нотатки потоково.
+
+    Формат:
+        show-notes [--page N] [--size M]
 
     Args:
+        args (list[str]): Необов'язкові параметри посторінкового виводу.
         notes (NoteBook): Колекція нотаток.
 
     Returns:
-        str: Відформатований список або повідомлення про порожність.
+        Iterator[str] | str: Відформатовані нотатки або повідомлення про порожність чи помилку.
     """
+    try:
+        _, offset, size = parse_paging(args)
+    except ValueError as e:
+        return f"Помилка: {e}"
     if not notes.data:
         return "Немає збережених нотаток."
-    return "\n\n".join(str(n) for n in notes.data.values())
+    total = len(notes.data)
+    if offset >= total:
+        return f"На цій сторінці немає нотаток (усього нотаток: {total})."
+    return _iter_notes(islice(notes.data.values(), offset, None if size is None else offset + size))
 
 
 @input_error
@@ -126,6 +182,9 @@ def add_tags_to_note(args, notes):
 def find_note_by_tags(args, notes):
     """Пошук нотаток за тегами.
 
+    Формат:
+        find-by-tag <тег1,тег2,...> [+обов'язковий] [-виключений]
+
     Args:
         args (list[str]): Список тегів або рядок тегів.
         notes (NoteBook): Колекція нотаток.
@@ -134,24 +193,36 @@ def find_note_by_tags(args, notes):
         str: Відформатований список результатів або повідомлення про їх відсутність.
     """
     if len(args) < 1:
-        return "Помилка: команда 'find-by-tag' очікує 1 аргумент: find-by-tag <тег1,тег2,...>"
+        return "Помилка: команда 'find-by-tag' очікує 1 аргумент: find-by-tag <тег1,тег2,...> [+тег] [-тег]"
 
     tags_query = " ".join(args)
     results = notes.find_by_tags(tags_query)
     return "\n\n".join(str(r) for r in results) if results else "Нотаток з цими тегами не знайдено."
 
 
-def sort_notes_by_tags(notes):
+@input_error
+def sort_notes_by_tags(args, notes):
     """Відсортовує нотатки за тегами.
 
+    Формат:
+        sort-notes-by-tag [--page N] [--size M]
+
     Args:
+        args (list[str]): Необов'язкові параметри посторінкового виводу.
         notes (NoteBook): Колекція нотаток.
 
     Returns:
         str: Відсортований список нотаток або повідомлення, якщо нотаток немає.
     """
+    try:
+        _, offset, size = parse_paging(args)
+    except ValueError as e:
+        return f"Помилка: {e}"
+
     if not notes.data:
         return "Немає збережених нотаток для сортування."
 
-    sorted_notes = notes.sort_by_tags()
+    sorted_notes = notes.sort_by_tags(offset, size)
+    if not sorted_notes:
+        return "На цій сторінці немає нотаток."
     return "Нотатки відсортовані за тегами:\n\n" + "\n\n".join(str(n) for n in sorted_notes)
@@ -14,3 +14,42 @@ def parse_input(user_input: str):
         return "", []
     cmd, *args = parts
     return cmd.lower(), args
+
+
+DEFAULT_PAGE_SIZE = 50
+
+
+def parse_paging(args: list[str]):
+    """Виокремлює з аргументів параметри посторінкового виводу --page та --size.
+
+    Параметр --limit N є синонімом --size N (перші N записів).
+
+    Args:
+        args (list[str]): Аргументи команди.
+
+    Returns:
+        tuple[list[str], int, int | None]:
+            - аргументи без параметрів посторінкового виводу;
+            - зміщення (кількість записів, які треба пропустити);
+            - розмір сторінки або None, якщо посторінковий вивід не запитано.
+
+    Raises:
+        ValueError: Якщо значення --page або --size не є додатним цілим числом.
+    """
+    rest: list[str] = []
+    options: dict[str, int] = {}
+    args_iter = iter(args)
+    for arg in args_iter:
+        if arg in ("--page", "--size", "--limit"):
+            value = next(args_iter, "")
+            if not value.isdigit() or int(value) < 1:
+                raise ValueError(f"значення {arg} має бути додатним цілим числом.")
+            options["--size" if arg == "--limit" else arg] = int(value)
+        else:
+            rest.append(arg)
+
+    if not options:
+        return rest, 0, None
+    size = options.get("--size", DEFAULT_PAGE_SIZE)
+    page = options.get("--page", 1)
+    return rest, (page - 1) * size, size
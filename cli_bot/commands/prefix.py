@@ -0,0 +1,85 @@
+"""Упорядкований індекс слів для пошуку за префіксом.
+
+PrefixIndex тримає слова відсортованими за ключем casefold у двох
+паралельних списках (ключі й слова). Пошук за префіксом — один бінарний
+пошук (bisect) до першого ключа з префіксом і послідовне читання далі,
+доки ключі починаються з префікса. Тому перші результати й автодоповнення
+з'являються одразу навіть у дуже великій книзі, а видача йде в алфавітному
+порядку.
+
+Порівняння нечутливе до регістру, а повертаються слова в початковому написанні.
+"""
+
+from bisect import bisect_left, bisect_right
+
+
+class PrefixIndex:
+    """Відсортований список слів із пошуком за префіксом."""
+
+    def __init__(self, words=()):
+        """Створює індекс та (за потреби) наповнює його словами одним сортуванням.
+
+        Args:
+            words (Iterable[str]): Початкові слова.
+        """
+        pairs = sorted((_key(word), word) for word in words)
+        self._keys = [key for key, _ in pairs]
+        self._words = [word for _, word in pairs]
+
+    def __len__(self):
+        """Повертає кількість слів в індексі."""
+        return len(self._words)
+
+    def _bounds(self, key: str) -> tuple[int, int]:
+        """Повертає межі діапазону слів із ключем key."""
+        return bisect_left(self._keys, key), bisect_right(self._keys, key)
+
+    def add(self, word: str) -> None:
+        """Додає слово (повторне додавання нічого не змінює).
+
+        Args:
+            word (str): Слово для додавання.
+        """
+        key = _key(word)
+        lo, hi = self._bounds(key)
+        pos = bisect_left(self._words, word, lo, hi)
+        if pos < hi and self._words[pos] == word:
+            return
+        self._keys.insert(pos, key)
+        self._words.insert(pos, word)
+
+    def discard(self, word: str) -> None:
+        """Видаляє слово, якщо воно є в індексі.
+
+        Args:
+            word (str): Слово для видалення.
+        """
+        lo, hi = self._bounds(_key(word))
+        pos = bisect_left(self._words, word, lo, hi)
+        if pos < hi and self._words[pos] == word:
+            del self._keys[pos]
+            del self._words[pos]
+
+    def iter_prefix(self, prefix: str, limit: int | None = None):
+        """Повертає слова з указаним префіксом в алфавітному порядку.
+
+        Args:
+            prefix (str): Префікс (без урахування регістру).
+            limit (int | None): Найбільша кількість слів (None — без обмеження).
+
+        Yields:
+            str: Слова в початковому написанні.
+        """
+        key = prefix.casefold()
+        keys, words = self._keys, self._words
+        pos = bisect_left(keys, key)
+        end = len(keys) if limit is None else min(len(keys), pos + limit)
+        while pos < end and keys[pos].startswith(key):
+            yield words[pos]
+            pos += 1
+
+
+def _key(word: str) -> str:
+    """Повертає ключ сортування; якщо він збігається зі словом — той самий рядок."""
+    key = word.casefold()
+    return word if key == word else key
@@ -0,0 +1,305 @@
+"""Реєстр команд CLI-асистента з лінивим завантаженням обробників.
+
+Кожна команда реєструється один раз через register() з описом:
+назва, синоніми, мінімальна кількість аргументів і формат виклику,
+з чим працює (адресна книга чи нотатник) і чи змінює вона дані.
+Якщо аргументів замало, обробник не викликається: реєстр повертає
+повідомлення «Помилка: команда ... очікує мінімум N ...».
+
+Реєстрація зібрана в цьому модулі, а не біля обробників: інакше, щоб
+дізнатися про всі команди, довелося б імпортувати всі їхні модулі.
+
+Обробник задається рядком «модуль:функція» і імпортується лише під час
+першого виклику команди, тому модулі з командами, якими користувач
+не скористався, взагалі не завантажуються. Диспетчеризація — один пошук
+у словнику COMMAND_REGISTRY замість ланцюжка порівнянь.
+
+Реєстр також підказує виправлення: для невідомої команди — найближчу
+зареєстровану назву, а для аргументів — схожі імена контактів, назви
+нотаток чи теги (див. suggest_command і suggest_argument).
+
+Кожен виклик команди вимірюється (час, помилки, розмір результату) —
+див. модуль stats і команду stats.
+"""
+
+from contextvars import ContextVar
+from datetime import datetime
+from importlib import import_module
+
+from .decorator import Refusal
+from .fuzzy import BKTree
+from .note_book import frozen_time, parse_tag_query
+from .stats import STATS
+
+# Останній виклик змінюючої команди в поточному контексті: (момент виконання, чи не вдалася вона).
+# log_command записує момент у журнал, а команди, що не вдалися, не журналює.
+last_mutation: ContextVar[tuple[datetime, bool] | None] = ContextVar("last_mutation", default=None)
+
+
+class CommandSpec:
+    """Опис однієї команди та спосіб її виклику."""
+
+    def __init__(self, name, handler, target=None, takes_args=True, min_args=0, usage=None,
+                 mutating=False, aliases=(), suggest=None, replayable=True, local_only=False):
+        """Створює опис команди.
+
+        Args:
+            name (str): Основна назва команди.
+            handler (str | callable | None): «модуль:функція» відносно пакета commands,
+                сама функція або None для команд, які обробляє цикл (exit / close).
+            target (str | None): "book", "notes", "both" (книга й нотатник) або None —
+                що передається обробнику.
+            takes_args (bool): Чи передається обробнику список аргументів.
+            min_args (int): Мінімальна кількість аргументів; з меншою обробник не викликається.
+            usage (str | None): Формат виклику для повідомлення про замало аргументів.
+            mutating (bool): Чи змінює команда дані (False — лише читання).
+            aliases (tuple[str, ...]): Синоніми команди.
+            suggest (str | None): Що означає перший аргумент для підказок:
+                "name" — ім'я контакту, "title" — назва нотатки, "tag" — теги.
+            replayable (bool): Чи можна відтворити змінюючу команду з журналу
+                (False — наприклад, import читає зовнішній файл; після неї
+                у режимі journal записується знімок).
+            local_only (bool): Чи працює команда з файлами на машині, де запущено
+                процес (import, export); серверний режим таких команд не виконує.
+        """
+        self.name = name
+        self.target = target
+        self.takes_args = takes_args
+        self.min_args = min_args
+        self.usage = usage or name
+        self.mutating = mutating
+        self.aliases = tuple(aliases)
+        self.suggest = suggest
+        self.replayable = replayable
+        self.local_only = local_only
+        self._handler = handler
+
+    @property
+    def handler(self):
+        """Повертає функцію-обробник, імпортуючи її модуль під час першого звернення."""
+        if isinstance(self._handler, str):
+            module_name, func_name = self._handler.split(":")
+            module = import_module(f".{module_name}", __package__)
+            self._handler = getattr(module, func_name)
+        return self._handler
+
+    def usage_error(self) -> str:
+        """Повертає повідомлення про замало аргументів (у форматі повідомлень обробників)."""
+        word = "аргумент" if self.min_args == 1 else "аргументи"
+        return f"Помилка: команда '{self.name}' очікує мінімум {self.min_args} {word}: {self.usage}."
+
+    def __call__(self, args, book, notes, at=None):
+        """Викликає обробник із потрібним набором параметрів.
+
+        Якщо аргументів менше за min_args, замість обробника повертається usage_error().
+        Після команди над адресною книгою викликається її release_views (якщо
+        він є), щоб книги, які видають записи як тимчасові представлення
+        (ColumnarAddressBook), записали зміни назад.
+
+        Час виконання, помилки та розмір результату записуються в STATS
+        (без часу першого імпорту модуля обробника).
+
+        Змінююча команда виконується із зафіксованим часом (frozen_time):
+        поточним або переданим at (відтворення журналу); момент і ознака
+        того, що команда не вдалася (помилка або відповідь Refusal), запам'ятовуються
+        в last_mutation.
+
+        Args:
+            args (list[str]): Аргументи команди.
+            book: Екземпляр AddressBook.
+            notes: Екземпляр NoteBook.
+            at (datetime | None): Момент виконання змінюючої команди (None — зараз).
+
+        Returns:
+            Any: Результат обробника.
+        """
+        call_args = [args] if self.takes_args else []
+        if self.target in ("book", "both"):
+            call_args.append(book)
+        if self.target in ("notes", "both"):
+            call_args.append(notes)
+        handler = self.handler
+        moment = (at or datetime.now()) if self.mutating else None
+        with STATS.measure(self.name) as measurement, frozen_time(moment):
+            if self.takes_args and len(args) < self.min_args:
+                result = self.usage_error()
+            else:
+                result = handler(*call_args)
+                if self.target in ("book", "both"):
+                    release_views = getattr(book, "release_views", None)
+                    if release_views is not None:
+                        release_views()
+        result = measurement.result(result)
+        if self.mutating:
+            last_mutation.set((moment, measurement.error or isinstance(result, Refusal)))
+        return result
+
+
+COMMAND_REGISTRY: dict[str, CommandSpec] = {}
+
+# BK-дерево назв команд; будується під час першої підказки.
+_command_tree: BKTree | None = None
+
+
+def register(name, handler, **options) -> CommandSpec:
+    """Реєструє команду та її синоніми.
+
+    Args:
+        name (str): Основна назва команди.
+        handler (str | callable | None): Обробник (див. CommandSpec).
+        **options: Інші параметри CommandSpec.
+
+    Returns:
+        CommandSpec: Зареєстрований опис команди.
+    """
+    global _command_tree
+    spec = CommandSpec(name, handler, **options)
+    _command_tree = None
+    COMMAND_REGISTRY[name] = spec
+    for alias in spec.aliases:
+        COMMAND_REGISTRY[alias] = spec
+    return spec
+
+
+def get_command(name: str) -> CommandSpec | None:
+    """Повертає опис команди за назвою або синонімом.
+
+    Args:
+        name (str): Назва команди.
+
+    Returns:
+        CommandSpec | None: Опис команди або None, якщо її не зареєстровано.
+    """
+    return COMMAND_REGISTRY.get(name)
+
+
+def command_names() -> tuple[str, ...]:
+    """Повертає всі назви та синоніми зареєстрованих команд.
+
+    Returns:
+        tuple[str, ...]: Назви в порядку реєстрації.
+    """
+    return tuple(COMMAND_REGISTRY)
+
+
+def dispatch(name: str, args: list[str], book, notes):
+    """Виконує команду за назвою одним пошуком у реєстрі.
+
+    Args:
+        name (str): Назва команди (у нижньому регістрі).
+        args (list[str]): Аргументи команди.
+        book: Екземпляр AddressBook.
+        notes: Екземпляр NoteBook.
+
+    Returns:
+        Any | None: Результат виконання або None, якщо команда невідома.
+    """
+    spec = COMMAND_REGISTRY.get(name)
+    if spec is None or spec.handler is None:
+        return None
+    return spec(args, book, notes)
+
+
+def suggest_command(name: str) -> str | None:
+    """Пропонує найбільш схожу зареєстровану команду.
+
+    Args:
+        name (str): Команда, введена користувачем.
+
+    Returns:
+        str | None: Найближча назва або None, якщо схожої команди немає.
+    """
+    global _command_tree
+    if _command_tree is None:
+        _command_tree = BKTree(COMMAND_REGISTRY)
+    matches = _command_tree.closest(name, limit=1)
+    return matches[0] if matches else None
+
+
+def suggest_argument(name: str, args: list[str], book, notes) -> str | None:
+    """Підказує існуючі імена, назви нотаток чи теги, схожі на аргумент команди.
+
+    Викликається до виконання команди: якщо аргумент відповідає наявному
+    контакту (нотатці, тегу), підказки немає.
+
+    Args:
+        name (str): Назва команди.
+        args (list[str]): Аргументи команди.
+        book: Екземпляр AddressBook.
+        notes: Екземпляр NoteBook.
+
+    Returns:
+        str | None: Текст підказки або None.
+    """
+    spec = COMMAND_REGISTRY.get(name)
+    if spec is None or spec.suggest is None or not args:
+        return None
+
+    if spec.suggest == "name":
+        matches = book.suggest_names(args[0])
+    elif spec.suggest == "title":
+        matches = notes.suggest_titles(args[0])
+    else:
+        any_tags, all_tags, none_tags = parse_tag_query(" ".join(args))
+        matches = []
+        for tag in sorted(any_tags | all_tags | none_tags):
+            matches.extend(notes.suggest_tags(tag, limit=1))
+    if not matches:
+        return None
+    return "Можливо, ви мали на увазі: " + ", ".join(f"'{match}'" for match in matches) + "?"
+
+
+def _hello():
+    """Відповідь на команду hello."""
+    return "Як я можу допомогти?"
+
+
+register("hello", _hello, takes_args=False)
+register("add", "contacts:add_contact", target="book", mutating=True,
+         min_args=2, usage="add <ім'я> <телефон>")
+register("change", "contacts:change_contact", target="book", mutating=True, suggest="name", min_args=3,
+         usage="change <ім'я> name|phone|address|birthday|email [старе_значення] <нове_значення>")
+register("phone", "contacts:show_phone", target="book", suggest="name", min_args=1, usage="phone <ім'я>")
+register("all", "contacts:show_all", target="book")
+register("add-birthday", "contacts:add_birthday", target="book", mutating=True, suggest="name",
+         min_args=2, usage="add-birthday <ім'я> <дата_народження>")
+register("add-address", "contacts:add_address", target="book", mutating=True, suggest="name",
+         min_args=2, usage="add-address <ім'я> <адреса>")
+register("add-email", "contacts:add_email", target="book", mutating=True, suggest="name",
+         min_args=2, usage="add-email <ім'я> <email>")
+register("show-birthday", "contacts:show_birthday", target="book", suggest="name",
+         min_args=1, usage="show-birthday <ім'я>")
+register("birthdays", "contacts:birthdays", target="book")
+register("birthdays-in", "birthdays_in:birthdays_in", target="book",
+         min_args=1, usage="birthdays-in <кількість_днів> або birthdays-in <від>..<до>")
+register("add-note", "notes:add_note", target="notes", mutating=True,
+         min_args=2, usage="add-note <Назва> <нотатка>")
+register("find-note", "notes:find_note", target="notes", min_args=1, usage="find-note <ключове слово>")
+register("search-notes", "notes:search_notes", target="notes", min_args=1, usage="search-notes <слова> [--top N]")
+register("edit-note", "notes:edit_note", target="notes", mutating=True, suggest="title",
+         min_args=2, usage="edit-note <Назва> <новий текст>")
+register("delete-note", "notes:delete_note", target="notes", mutating=True, suggest="title",
+         min_args=1, usage="delete-note <Назва>")
+register("delete", "contacts:delete_contact", target="book", mutating=True, suggest="name",
+         min_args=1, usage="delete <ім'я>")
+register("email", "contacts:find_by_email", target="book", min_args=1, usage="email <адреса>")
+register("domain", "contacts:find_by_domain", target="book", min_args=1, usage="domain <домен>")
+register("name", "contacts:find_by_name", target="book", suggest="name", min_args=1, usage="name <ім'я>")
+register("prefix", "contacts:find_by_prefix", target="book", min_args=1, usage="prefix <префікс> [--limit N]")
+register("find-phone", "contacts:find_by_phone_part", target="book",
+         min_args=1, usage="find-phone <цифри> [--suffix] [--limit N]")
+register("show-notes", "notes:show_notes", target="notes")
+register("help", "help_text:help_text", takes_args=False)
+register("exit", None, takes_args=False, aliases=("close",))
+register("add-tags", "notes:add_tags_to_note", target="notes", mutating=True, suggest="title",
+         min_args=2, usage="add-tags <Назва нотатки> <тег1 тег2...>")
+register("find-by-tag", "notes:find_note_by_tags", target="notes", suggest="tag",
+         min_args=1, usage="find-by-tag <тег1,тег2,...> [+тег] [-тег]")
+register("sort-notes-by-tag", "notes:sort_notes_by_tags", target="notes")
+register("import", "importer:import_data", target="both", mutating=True, replayable=False, local_only=True,
+         min_args=1, usage="import <файл.csv | файл.jsonl>[.gz | .xz]")
+register("export", "exporter:export_data", target="both", local_only=True,
+         min_args=1, usage="export <файл.csv | .jsonl | .vcf | .ics>[.gz | .xz] [--contacts | --notes]")
+register("stats", "stats:show_stats")
+register("memory", "memory:memory", target="both")
+register("all-table", "all_table:all_table", target="book")
@@ -0,0 +1,191 @@
+"""Серверний режим CLI-асистента (cli-bot serve).
+
+Один процес тримає в пам'яті спільні AddressBook і NoteBook та обслуговує
+багатьох клієнтів через TCP- або Unix-сокет на asyncio:
+- клієнт надсилає команди рядками, як у звичайному CLI;
+- відповідь — рядки результату, після яких іде рядок-маркер END_MARKER;
+- команди виконуються тими самими обробниками з реєстру команд у
+  робочому потоці (asyncio.to_thread) по одній. Сервер свідомо має
+  одного виконавця для всіх команд, зокрема й читаючих: розділення на
+  читачів і письменників немає, бо «читання» теж змінює спільний стан —
+  LazyProxy довантажує файл, пошук нотаток будує індекс, стовпцева книга
+  видає й потім синхронізує Record-представлення, а з'єднання SQLite
+  одне на процес. Паралельне читання через GIL однаково не дало б
+  приросту для обробників на чистому Python. Цикл подій тим часом
+  вільний — приймає з'єднання й надсилає вже готові відповіді іншим
+  клієнтам;
+- відповідь повністю формується під блокуванням, а надсилається вже
+  після його звільнення, тож клієнт, що не читає відповідь, не
+  затримує інших і ніколи не бачить половинчастої зміни;
+- команди, що працюють з файлами на машині сервера (local_only: import і
+  export), не виконуються: інакше будь-який клієнт міг би читати чи
+  перезаписувати файли сервера;
+- змінюючі команди записуються в журнал / базу через log_command і
+  позначають дані для фонового автозбереження (AutoSaver, режим pickle),
+  а під час зупинки сервера дані зберігаються повністю.
+"""
+
+import asyncio
+import contextlib
+import signal
+
+from .parser import parse_input
+from .registry import dispatch, get_command, suggest_argument, suggest_command
+from .storage import AutoSaver, load_data, log_command, save_data
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# Рядок, яким сервер завершує відповідь на кожну команду.
+END_MARKER = "\x04"
+
+# Скільки рядків відповіді надсилається за раз (після кожної порції сервер чекає, поки клієнт їх прочитає).
+STREAM_DRAIN_LINES = 1000
+
+UNKNOWN_COMMAND_MSG = "Команда не існує. Введіть 'help' для ознайомлення."
+LOCAL_ONLY_MSG = "Помилка: команда '{}' працює з файлами на машині сервера й недоступна в серверному режимі."
+
+
+class CommandServer:
+    """Обслуговує клієнтів, виконуючи їхні команди над спільними книгами."""
+
+    def __init__(self, book, notes, saver: AutoSaver | None = None):
+        """Створює сервер над уже завантаженими книгами.
+
+        Args:
+            book: Екземпляр AddressBook.
+            notes: Екземпляр NoteBook.
+            saver (AutoSaver | None): Автозбереження; без нього зміни лише журналюються.
+        """
+        self.book = book
+        self.notes = notes
+        self.saver = saver or AutoSaver(book, notes)
+        self._lock = None
+
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Обробляє команди одного клієнта до exit / close або розриву з'єднання.
+
+        Args:
+            reader (asyncio.StreamReader): Потік вхідних рядків.
+            writer (asyncio.StreamWriter): Потік відповідей.
+        """
+        try:
+            while line := await reader.readline():
+                command, args = parse_input(line.decode("utf-8", errors="replace"))
+                if command in ("close", "exit"):
+                    await self._send(writer, ["До побачення!", END_MARKER])
+                    break
+                if command and not command.startswith("#"):
+                    await self.execute(command, args, writer)
+                await self._send(writer, [END_MARKER])
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+    async def execute(self, command: str, args: list[str], writer: asyncio.StreamWriter) -> None:
+        """Виконує одну команду в робочому потоці й надсилає результат після звільнення блокування.
+
+        Блокування спільне для всіх команд, а не лише змінюючих (див. опис модуля).
+
+        Args:
+            command (str): Назва команди.
+            args (list[str]): Аргументи команди.
+            writer (asyncio.StreamWriter): Потік відповідей клієнту.
+        """
+        async with self._lock:
+            lines = await asyncio.to_thread(self.run_command, command, args)
+        for start in range(0, len(lines), STREAM_DRAIN_LINES):
+            await self._send(writer, lines[start:start + STREAM_DRAIN_LINES])
+
+    def run_command(self, command: str, args: list[str]) -> list[str]:
+        """Виконує команду над спільними книгами та повертає всі рядки відповіді.
+
+        Потоковий результат (генератор) вичитується тут повністю, тож дані
+        читаються лише під блокуванням. Змінюючі команди виконуються під
+        блокуванням автозбереження й записуються в журнал / базу.
+
+        Args:
+            command (str): Назва команди.
+            args (list[str]): Аргументи команди.
+
+        Returns:
+            list[str]: Рядки відповіді (без END_MARKER).
+        """
+        spec = get_command(command)
+        if spec is not None and spec.local_only:
+            return [LOCAL_ONLY_MSG.format(spec.name)]
+        hint = suggest_argument(command, args, self.book, self.notes)
+        with self.saver.lock if spec is not None and spec.mutating else contextlib.nullcontext():
+            result = dispatch(command, args, self.book, self.notes)
+            if spec is not None and spec.mutating:
+                log_command(command, args, self.book, self.notes, saver=self.saver)
+            if result is None:
+                suggestion = suggest_command(command)
+                lines = [
+                    f"{UNKNOWN_COMMAND_MSG} Можливо, ви мали на увазі '{suggestion}'?"
+                    if suggestion else UNKNOWN_COMMAND_MSG
+                ]
+            elif isinstance(result, str):
+                lines = [result]
+            else:
+                lines = list(result)
+        if hint:
+            lines.append(hint)
+        return lines
+
+    @staticmethod
+    async def _send(writer: asyncio.StreamWriter, lines: list[str]) -> None:
+        """Надсилає рядки клієнту та чекає, поки буфер з'єднання звільниться."""
+        if lines:
+            writer.write("".join(line + "\n" for line in lines).encode("utf-8"))
+            await writer.drain()
+
+    async def serve(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, socket_path=None) -> None:
+        """Запускає сервер і обслуговує клієнтів до скасування (Ctrl+C / SIGTERM).
+
+        Args:
+            host (str): Адреса для TCP-сокета.
+            port (int): Порт для TCP-сокета.
+            socket_path (str | Path | None): Шлях Unix-сокета; якщо задано, TCP не використовується.
+        """
+        self._lock = asyncio.Lock()
+        if socket_path is not None:
+            server = await asyncio.start_unix_server(self.handle_client, path=str(socket_path))
+            where = socket_path
+        else:
+            server = await asyncio.start_server(self.handle_client, host, port)
+            where = f"{host}:{port}"
+
+        loop = asyncio.get_running_loop()
+        stop = loop.create_future()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            with contextlib.suppress(NotImplementedError, AttributeError):
+                loop.add_signal_handler(signum, stop.cancel)
+
+        print(f"[INFO] Сервер слухає {where}")
+        async with server:
+            await stop
+
+
+def run_server(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, socket_path=None) -> None:
+    """Завантажує дані, запускає сервер і зберігає дані після його зупинки.
+
+    Args:
+        host (str): Адреса для TCP-сокета.
+        port (int): Порт для TCP-сокета.
+        socket_path (str | Path | None): Шлях Unix-сокета замість TCP.
+    """
+    book, notes = load_data()
+    saver = AutoSaver(book, notes).start()
+    server = CommandServer(book, notes, saver)
+    try:
+        asyncio.run(server.serve(host, port, socket_path))
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        pass
+    finally:
+        saver.stop()
+        save_data(book, notes, force=True)
+        print("[INFO] Сервер зупинено.")
@@ -0,0 +1,718 @@
+"""SQLite-сховище для адресної книги та нотатника (CLI_BOT_STORAGE=sqlite).
+
+Забезпечує:
+- схему з таблицями contacts, phones, emails, notes, note_tags, notes_fts та індексами;
+- ліниві відображення SqliteRecords / SqliteNotes, які читають запис із бази
+  лише під час першого звернення, тож запуск не залежить від обсягу даних;
+- SqliteAddressBook та SqliteNoteBook — наслідники AddressBook / NoteBook,
+  у яких пошук за телефоном, email, доменом, днем народження і тегами
+  виконується індексованими запитами, а повнотекстовий пошук нотаток — через FTS5;
+- дешеве збереження окремого запису після кожної змінюючої команди;
+- одноразовий перенос даних із pickle-файлів у нову базу.
+"""
+
+import pickle
+import sqlite3
+from abc import abstractmethod
+from collections.abc import MutableMapping
+from calendar import isleap
+from datetime import date, datetime
+from itertools import islice
+from pathlib import Path
+
+from .address_book import AddressBook, Record, Phone, Email, Address, Birthday
+from .note_book import NoteBook, Note, tokenize, parse_tag_query
+from .note_store import load_notes
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS contacts (
+    name TEXT PRIMARY KEY,
+    birthday TEXT,
+    address TEXT
+);
+CREATE TABLE IF NOT EXISTS phones (
+    phone TEXT NOT NULL,
+    contact TEXT NOT NULL,
+    pos INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_phones_phone ON phones(phone);
+CREATE INDEX IF NOT EXISTS idx_phones_contact ON phones(contact);
+CREATE TABLE IF NOT EXISTS emails (
+    email_key TEXT NOT NULL,
+    email TEXT NOT NULL,
+    domain TEXT NOT NULL,
+    contact TEXT NOT NULL,
+    pos INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_emails_key ON emails(email_key);
+CREATE INDEX IF NOT EXISTS idx_emails_domain ON emails(domain);
+CREATE INDEX IF NOT EXISTS idx_emails_contact ON emails(contact);
+CREATE INDEX IF NOT EXISTS idx_contacts_birthday_md ON contacts(substr(birthday, 6));
+CREATE TABLE IF NOT EXISTS notes (
+    key TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    text TEXT NOT NULL,
+    created_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS note_tags (
+    tag TEXT NOT NULL,
+    note_key TEXT NOT NULL,
+    PRIMARY KEY (tag, note_key)
+);
+CREATE INDEX IF NOT EXISTS idx_note_tags_note ON note_tags(note_key);
+CREATE VIRTUAL TABLE IF NOT EXISTS notes_fts USING fts5(key UNINDEXED, title, text);
+"""
+
+
+def connect(db_filename) -> sqlite3.Connection:
+    """Відкриває (або створює) базу та гарантує наявність схеми.
+
+    З'єднання можна використовувати з іншого потоку (серверний режим
+    виконує команди в робочому потоці), але лише з одного в кожен момент.
+
+    Args:
+        db_filename (str|Path): Шлях до файлу бази SQLite.
+
+    Returns:
+        sqlite3.Connection: Відкрите з'єднання.
+    """
+    db_path = Path(db_filename)
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db_path, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(SCHEMA)
+    with conn:
+        if conn.execute("SELECT NOT EXISTS (SELECT 1 FROM notes_fts)").fetchone()[0]:
+            conn.execute("INSERT INTO notes_fts(key, title, text) SELECT key, title, text FROM notes")
+    return conn
+
+
+class _SqliteMapping(MutableMapping):
+    """Базове ліниве відображення ключ → об'єкт поверх таблиці SQLite.
+
+    Прочитані об'єкти кешуються, тому зміни «на місці» (наприклад,
+    Record.add_phone) видно одразу, а в базу вони потрапляють через flush.
+
+    Клас абстрактний (MutableMapping — abc): наслідник мусить реалізувати
+    _read, _write, _delete, _keys і __len__, інакше його не вдасться створити.
+    """
+
+    def __init__(self, conn: sqlite3.Connection):
+        """Ініціалізує відображення.
+
+        Args:
+            conn (sqlite3.Connection): З'єднання з базою.
+        """
+        self.conn = conn
+        self._cache = {}
+
+    @abstractmethod
+    def _read(self, key):
+        """Читає об'єкт із бази (None, якщо ключа немає)."""
+
+    @abstractmethod
+    def _write(self, key, value):
+        """Записує об'єкт у базу (без власної транзакції)."""
+
+    @abstractmethod
+    def _delete(self, key):
+        """Видаляє об'єкт із бази (без власної транзакції)."""
+
+    @abstractmethod
+    def _keys(self):
+        """Повертає ключі в порядку додавання."""
+
+    def __getitem__(self, key):
+        if key in self._cache:
+            return self._cache[key]
+        value = self._read(key)
+        if value is None:
+            raise KeyError(key)
+        self._cache[key] = value
+        return value
+
+    def __setitem__(self, key, value):
+        with self.conn:
+            self._write(key, value)
+        self._cache[key] = value
+
+    def __delitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        with self.conn:
+            self._delete(key)
+        self._cache.pop(key, None)
+
+    def __contains__(self, key):
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
+
+    def __iter__(self):
+        return iter(self._keys())
+
+    @abstractmethod
+    def __len__(self):
+        """Повертає кількість об'єктів у базі."""
+
+    def values(self):
+        """Повертає генератор значень у порядку додавання."""
+        return (self[key] for key in self._keys())
+
+    def items(self):
+        """Повертає генератор пар (ключ, значення) у порядку додавання."""
+        return ((key, self[key]) for key in self._keys())
+
+    def scan(self):
+        """Повертає генератор значень у порядку додавання, не заповнюючи кеш.
+
+        Прочитані з бази об'єкти не запам'ятовуються, тож повний прохід
+        (наприклад, експорт) не тримає в пам'яті всю базу; змінювати їх не слід.
+        """
+        cache = self._cache
+        return (cache.get(key) or self._read(key) for key in self._keys())
+
+    def flush(self, key) -> None:
+        """Записує в базу закешований об'єкт, змінений «на місці».
+
+        Args:
+            key: Ключ об'єкта. Якщо об'єкт не читався, нічого не відбувається.
+        """
+        value = self._cache.get(key)
+        if value is not None:
+            with self.conn:
+                self._write(key, value)
+
+    def flush_all(self) -> None:
+        """Записує в базу всі закешовані об'єкти однією транзакцією."""
+        with self.conn:
+            for key, value in self._cache.items():
+                self._write(key, value)
+
+
+class SqliteRecords(_SqliteMapping):
+    """Ліниве відображення ім'я → Record поверх таблиць contacts/phones/emails."""
+
+    def _read(self, name):
+        row = self.conn.execute(
+            "SELECT birthday, address FROM contacts WHERE name = ?", (name,)
+        ).fetchone()
+        if row is None:
+            return None
+        birthday, address = row
+        record = Record(name)
+        for (phone,) in self.conn.execute(
+            "SELECT phone FROM phones WHERE contact = ? ORDER BY pos", (name,)
+        ):
+            record.phones.append(Phone(phone))
+        for (email,) in self.conn.execute(
+            "SELECT email FROM emails WHERE contact = ? ORDER BY pos", (name,)
+        ):
+            record.emails.append(Email(email))
+        if birthday:
+            record.birthday = Birthday(date.fromisoformat(birthday).strftime("%d.%m.%Y"))
+        if address:
+            record.address = Address(address)
+        return record
+
+    def _write(self, name, record):
+        birthday = record.birthday.value.isoformat() if record.birthday else None
+        address = record.address.value if record.address else None
+        self.conn.execute(
+            "INSERT INTO contacts(name, birthday, address) VALUES (?, ?, ?) "
+            "ON CONFLICT(name) DO UPDATE SET birthday = excluded.birthday, address = excluded.address",
+            (name, birthday, address),
+        )
+        self.conn.execute("DELETE FROM phones WHERE contact = ?", (name,))
+        self.conn.executemany(
+            "INSERT INTO phones(phone, contact, pos) VALUES (?, ?, ?)",
+            ((phone.value, name, pos) for pos, phone in enumerate(record.phones)),
+        )
+        self.conn.execute("DELETE FROM emails WHERE contact = ?", (name,))
+        self.conn.executemany(
+            "INSERT INTO emails(email_key, email, domain, contact, pos) VALUES (?, ?, ?, ?, ?)",
+            (
+                (
+                    email.value.casefold(),
+                    email.value,
+                    email.value.casefold().rpartition("@")[2],
+                    name,
+                    pos,
+                )
+                for pos, email in enumerate(record.emails)
+            ),
+        )
+
+    def _delete(self, name):
+        self.conn.execute("DELETE FROM phones WHERE contact = ?", (name,))
+        self.conn.execute("DELETE FROM emails WHERE contact = ?", (name,))
+        self.conn.execute("DELETE FROM contacts WHERE name = ?", (name,))
+
+    def _keys(self):
+        return [name for (name,) in self.conn.execute("SELECT name FROM contacts ORDER BY rowid")]
+
+    def __len__(self):
+        return self.conn.execute("SELECT COUNT(*) FROM contacts").fetchone()[0]
+
+
+class SqliteNotes(_SqliteMapping):
+    """Ліниве відображення ключ (назва в нижньому регістрі) → Note."""
+
+    def _read(self, key):
+        row = self.conn.execute(
+            "SELECT title, text, created_at FROM notes WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        title, text, created_at = row
+        tags = [tag for (tag,) in self.conn.execute(
+            "SELECT tag FROM note_tags WHERE note_key = ?", (key,)
+        )]
+        note = Note(title, text, tags)
+        note.created_at = datetime.fromisoformat(created_at)
+        return note
+
+    def _write(self, key, note):
+        self.conn.execute(
+            "INSERT INTO notes(key, title, text, created_at) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET title = excluded.title, text = excluded.text, "
+            "created_at = excluded.created_at",
+            (key, note.title, note.text, note.created_at.isoformat()),
+        )
+        self.conn.execute("DELETE FROM notes_fts WHERE key = ?", (key,))
+        self.conn.execute(
+            "INSERT INTO notes_fts(key, title, text) VALUES (?, ?, ?)", (key, note.title, note.text)
+        )
+        self.conn.execute("DELETE FROM note_tags WHERE note_key = ?", (key,))
+        self.conn.executemany(
+            "INSERT INTO note_tags(tag, note_key) VALUES (?, ?)",
+            ((tag, key) for tag in note.tags),
+        )
+
+    def _delete(self, key):
+        self.conn.execute("DELETE FROM note_tags WHERE note_key = ?", (key,))
+        self.conn.execute("DELETE FROM notes_fts WHERE key = ?", (key,))
+        self.conn.execute("DELETE FROM notes WHERE key = ?", (key,))
+
+    def _keys(self):
+        return [key for (key,) in self.conn.execute("SELECT key FROM notes ORDER BY rowid")]
+
+    def __len__(self):
+        return self.conn.execute("SELECT COUNT(*) FROM notes").fetchone()[0]
+
+
+class SqliteAddressBook(AddressBook):
+    """Адресна книга, записи якої зберігаються в SQLite та читаються на вимогу."""
+
+    def __init__(self, conn: sqlite3.Connection):
+        """Створює адресну книгу поверх відкритої бази.
+
+        Args:
+            conn (sqlite3.Connection): З'єднання з базою.
+        """
+        super().__init__()
+        self.data = SqliteRecords(conn)
+
+    def _attach(self, record: Record) -> None:
+        """Оновлює лише індекси імен (підказки та префікси): роль інших індексів виконують індекси бази."""
+        self._index_name(record.name.value)
+
+    def _detach(self, record: Record) -> None:
+        """Оновлює лише індекси імен (підказки та префікси): роль інших індексів виконують індекси бази."""
+        self._unindex_name(record.name.value)
+
+    def find_record_by_phone(self, phone: str) -> Record | None:
+        """Шукає контакт за номером телефону через індекс idx_phones_phone.
+
+        Args:
+            phone (str): Номер телефону для пошуку.
+
+        Returns:
+            Record | None: Перший знайдений запис або None.
+        """
+        row = self.data.conn.execute(
+            "SELECT contact FROM phones WHERE phone = ? LIMIT 1", (phone,)
+        ).fetchone()
+        return self.data.get(row[0]) if row else None
+
+    def add_records(self, records) -> None:
+        """Записує пакет нових записів у базу однією транзакцією (масовий імпорт).
+
+        Імена нові, тож рядки лише додаються — без видалення старих телефонів і email.
+
+        Args:
+            records (Iterable[Record]): Нові записи з унікальними іменами.
+        """
+        records = list(records)
+        with self.data.conn as conn:
+            conn.executemany(
+                "INSERT INTO contacts(name, birthday, address) VALUES (?, ?, ?)",
+                (
+                    (
+                        record.name.value,
+                        record.birthday.value.isoformat() if record.birthday else None,
+                        record.address.value if record.address else None,
+                    )
+                    for record in records
+                ),
+            )
+            conn.executemany(
+                "INSERT INTO phones(phone, contact, pos) VALUES (?, ?, ?)",
+                (
+                    (phone.value, record.name.value, pos)
+                    for record in records
+                    for pos, phone in enumerate(record.phones)
+                ),
+            )
+            conn.executemany(
+                "INSERT INTO emails(email_key, email, domain, contact, pos) VALUES (?, ?, ?, ?, ?)",
+                (
+                    (
+                        email.value.casefold(),
+                        email.value,
+                        email.value.casefold().rpartition("@")[2],
+                        record.name.value,
+                        pos,
+                    )
+                    for record in records
+                    for pos, email in enumerate(record.emails)
+                ),
+            )
+        for record in records:
+            self._index_name(record.name.value)
+
+    def known_phones(self) -> set[str]:
+        """Повертає всі номери телефонів із бази (див. AddressBook.known_phones)."""
+        return {phone for (phone,) in self.data.conn.execute("SELECT phone FROM phones")}
+
+    def known_emails(self) -> set[str]:
+        """Повертає всі email у casefold із бази (див. AddressBook.known_emails)."""
+        return {email for (email,) in self.data.conn.execute("SELECT email_key FROM emails")}
+
+    def find_phones(self, digits: str, from_end: bool = False, limit: int | None = None):
+        """Знаходить телефони за початком або кінцем номера (див. AddressBook.find_phones).
+
+        Пошук за початком — проміжок в індексі idx_phones_phone (номери
+        складаються з цифр, а «:» іде в ASCII одразу після «9»). Пошук за
+        кінцем переглядає стовпець телефонів запитом LIKE.
+
+        Args:
+            digits (str): Цифри початку або кінця номера.
+            from_end (bool): Шукати за кінцем номера.
+            limit (int | None): Найбільша кількість номерів (None — без обмеження).
+
+        Returns:
+            Iterator[tuple[str, str]]: Пари (телефон, ім'я контакту).
+        """
+        conn = self.data.conn
+        if from_end:
+            rows = conn.execute("SELECT phone, contact FROM phones WHERE phone LIKE ?", ("%" + digits,))
+            return islice(sorted(rows.fetchall(), key=lambda row: row[0][::-1]), limit)
+        rows = conn.execute(
+            "SELECT phone, contact FROM phones WHERE phone >= ? AND phone < ? ORDER BY phone LIMIT ?",
+            (digits, digits + ":", -1 if limit is None else limit),
+        )
+        return iter(rows.fetchall())
+
+    def find_record_by_email(self, email: str) -> Record | None:
+        """Шукає контакт за email через індекс idx_emails_key.
+
+        Args:
+            email (str): Email для пошуку (без урахування регістру).
+
+        Returns:
+            Record | None: Запис контакту або None.
+        """
+        row = self.data.conn.execute(
+            "SELECT contact FROM emails WHERE email_key = ? LIMIT 1",
+            (email.strip().casefold(),),
+        ).fetchone()
+        return self.data.get(row[0]) if row else None
+
+    def find_records_by_domain(self, domain: str) -> list[Record]:
+        """Повертає контакти з email у вказаному домені через індекс idx_emails_domain.
+
+        Args:
+            domain (str): Домен (з '@' на початку або без нього).
+
+        Returns:
+            list[Record]: Контакти в порядку додавання email.
+        """
+        rows = self.data.conn.execute(
+            "SELECT contact FROM emails WHERE domain = ? GROUP BY contact ORDER BY MIN(rowid)",
+            (domain.strip().lstrip("@").casefold(),),
+        )
+        return [self.data[name] for (name,) in rows.fetchall()]
+
+    def birthdays_on(self, day: date) -> list[Record]:
+        """Повертає контакти з днем народження на вказану дату через індекс idx_contacts_birthday_md.
+
+        Args:
+            day (date): Дата, для якої шукаються дні народження.
+
+        Returns:
+            list[Record]: Знайдені контакти.
+        """
+        keys = [f"{day.month:02d}-{day.day:02d}"]
+        if day.month == 2 and day.day == 28 and not isleap(day.year):
+            keys.append("02-29")
+        placeholders = ", ".join("?" for _ in keys)
+        rows = self.data.conn.execute(
+            f"SELECT name FROM contacts WHERE substr(birthday, 6) IN ({placeholders}) ORDER BY rowid",
+            keys,
+        )
+        return [self.data[name] for (name,) in rows.fetchall()]
+
+    def flush(self, name: str) -> None:
+        """Зберігає в базу зміни запису, зроблені «на місці».
+
+        Args:
+            name (str): Ім'я контакту.
+        """
+        self.data.flush(name)
+
+
+class SqliteNoteBook(NoteBook):
+    """Нотатник, нотатки якого зберігаються в SQLite та читаються на вимогу."""
+
+    def __init__(self, conn: sqlite3.Connection):
+        """Створює нотатник поверх відкритої бази.
+
+        Args:
+            conn (sqlite3.Connection): З'єднання з базою.
+        """
+        super().__init__()
+        self.data = SqliteNotes(conn)
+
+    def add_notes(self, notes) -> None:
+        """Записує пакет нових нотаток у базу однією транзакцією (масовий імпорт).
+
+        Args:
+            notes (Iterable[Note]): Нові нотатки з унікальними назвами.
+        """
+        with self.data.conn:
+            for note in notes:
+                key = note.title.lower()
+                self.data._write(key, note)
+                self._attach(key, note)
+
+    def _attach(self, key: str, note: Note) -> None:
+        """Оновлює лише дерево підказок назв: роль інших індексів виконують індекси бази."""
+        if self._title_tree is not None:
+            self._title_tree.add(note.title)
+
+    def _detach(self, key: str, note: Note) -> None:
+        """Оновлює лише дерева підказок: роль інших індексів виконують індекси бази.
+
+        Тег прибирається з дерева, якщо в базі не лишилося нотаток із ним.
+        """
+        if self._title_tree is not None:
+            self._title_tree.discard(note.title)
+        if self._tag_tree is not None:
+            for tag in note.tags:
+                used = self.data.conn.execute(
+                    "SELECT 1 FROM note_tags WHERE tag = ? LIMIT 1", (tag,)
+                ).fetchone()
+                if used is None:
+                    self._tag_tree.discard(tag)
+
+    def _titles(self):
+        """Читає назви нотаток з бази, не завантажуючи самі нотатки."""
+        return (title for (title,) in self.data.conn.execute("SELECT title FROM notes"))
+
+    def _tags(self):
+        """Читає наявні теги з бази."""
+        return (tag for (tag,) in self.data.conn.execute("SELECT DISTINCT tag FROM note_tags"))
+
+    def _index_text(self, key: str, note: Note) -> None:
+        """Не веде індексів у пам'яті: їхню роль виконує таблиця notes_fts."""
+
+    def _unindex_text(self, key: str, note: Note) -> None:
+        """Не веде індексів у пам'яті: їхню роль виконує таблиця notes_fts."""
+
+    def search(self, query: str, limit: int = 10) -> list[Note]:
+        """Ранжований повнотекстовий пошук через FTS5 з функцією bm25().
+
+        Args:
+            query (str): Пошуковий запит (одне або кілька слів).
+            limit (int): Максимальна кількість результатів.
+
+        Returns:
+            list[Note]: Нотатки за спаданням релевантності.
+        """
+        terms = tokenize(query)
+        if not terms or limit <= 0:
+            return []
+        match = " OR ".join('"' + term.replace('"', '""') + '"' for term in terms)
+        rows = self.data.conn.execute(
+            "SELECT key FROM notes_fts WHERE notes_fts MATCH ? ORDER BY bm25(notes_fts) LIMIT ?",
+            (match, limit),
+        )
+        return [self.data[key] for (key,) in rows.fetchall()]
+
+    def find_by_tags(self, tags_query):
+        """Шукає нотатки за булевим запитом тегів через індекс таблиці note_tags.
+
+        Умови запиту (див. parse_tag_query) перекладаються в UNION / INTERSECT / EXCEPT.
+
+        Args:
+            tags_query (str): Рядок із тегами, розділеними пробілами або комами.
+
+        Returns:
+            list[Note]: Список відповідних нотаток у порядку додавання.
+        """
+        any_tags, all_tags, none_tags = parse_tag_query(tags_query)
+        if not (any_tags or all_tags or none_tags):
+            return []
+
+        parts: list[str] = []
+        params: list[str] = []
+        if any_tags:
+            parts.append(
+                "SELECT note_key FROM note_tags WHERE tag IN (" + ", ".join("?" for _ in any_tags) + ")"
+            )
+            params.extend(sorted(any_tags))
+        elif not all_tags:
+            parts.append("SELECT key FROM notes")
+        for tag in sorted(all_tags):
+            parts.append("SELECT note_key FROM note_tags WHERE tag = ?")
+            params.append(tag)
+        compound = " INTERSECT ".join(parts)
+        if none_tags:
+            compound += (
+                " EXCEPT SELECT note_key FROM note_tags WHERE tag IN ("
+                + ", ".join("?" for _ in none_tags) + ")"
+            )
+            params.extend(sorted(none_tags))
+
+        rows = self.data.conn.execute(
+            f"SELECT key FROM notes WHERE key IN ({compound}) ORDER BY rowid", params
+        )
+        return [self.data[key] for (key,) in rows.fetchall()]
+
+    def sort_by_tags(self, offset: int = 0, limit: int | None = None):
+        """Повертає нотатки, впорядковані за найменшим тегом, читаючи з бази лише сторінку.
+
+        Args:
+            offset (int): Кількість нотаток, які треба пропустити.
+            limit (int | None): Максимальна кількість нотаток (None — усі).
+
+        Returns:
+            list[Note]: Відсортований список нотаток.
+        """
+        rows = self.data.conn.execute(
+            "SELECT n.key FROM notes n LEFT JOIN "
+            "(SELECT note_key, MIN(tag) AS min_tag FROM note_tags GROUP BY note_key) t "
+            "ON t.note_key = n.key "
+            "ORDER BY t.min_tag IS NULL, t.min_tag, n.rowid LIMIT ? OFFSET ?",
+            (-1 if limit is None else limit, offset),
+        )
+        return [self.data[key] for (key,) in rows.fetchall()]
+
+    def find(self, query: str):
+        """Пошук нотаток за частковим входженням назви без читання всіх нотаток.
+
+        Args:
+            query (str): Рядок для пошуку.
+
+        Returns:
+            list[Note]: Усі нотатки, чиї назви містять запит.
+        """
+        rows = self.data.conn.execute(
+            "SELECT key FROM notes WHERE instr(key, ?) > 0 ORDER BY rowid", (query.lower(),)
+        )
+        return [self.data[key] for (key,) in rows.fetchall()]
+
+    def flush(self, title: str) -> None:
+        """Зберігає в базу зміни нотатки, зроблені «на місці».
+
+        Args:
+            title (str): Назва нотатки (незалежно від регістру).
+        """
+        self.data.flush(title.lower())
+        note = self.data._cache.get(title.lower())
+        if note is not None and self._tag_tree is not None:
+            for tag in note.tags:
+                self._tag_tree.add(tag)
+
+
+def load_sqlite(db_filename, contact_filename=None, note_filename=None):
+    """Відкриває SQLite-сховище та повертає книги, що працюють поверх нього.
+
+    Якщо база порожня, а pickle-файли існують, їхній вміст переноситься в базу.
+
+    Args:
+        db_filename (str|Path): Шлях до файлу бази.
+        contact_filename (str|Path|None): Pickle-файл контактів для переносу.
+        note_filename (str|Path|None): Pickle-файл нотаток для переносу.
+
+    Returns:
+        tuple(SqliteAddressBook, SqliteNoteBook): Книги поверх бази.
+    """
+    conn = connect(db_filename)
+    book = SqliteAddressBook(conn)
+    notes = SqliteNoteBook(conn)
+
+    if not len(book) and contact_filename and Path(contact_filename).exists():
+        with Path(contact_filename).open("rb") as f:
+            import_books(pickle.load(f), None, conn)
+        print(f"[INFO] Контакти перенесено з {contact_filename} у {db_filename}")
+    if not len(notes) and note_filename and Path(note_filename).exists():
+        import_books(None, load_notes(Path(note_filename)), conn)
+        print(f"[INFO] Нотатки перенесено з {note_filename} у {db_filename}")
+
+    return book, notes
+
+
+def import_books(book, notes, conn: sqlite3.Connection) -> None:
+    """Записує звичайні AddressBook / NoteBook у базу однією транзакцією.
+
+    Args:
+        book (AddressBook|None): Адресна книга для запису.
+        notes (NoteBook|None): Нотатник для запису.
+        conn (sqlite3.Connection): З'єднання з базою.
+    """
+    records = SqliteRecords(conn)
+    note_rows = SqliteNotes(conn)
+    with conn:
+        if book is not None:
+            for name, record in book.data.items():
+                records._write(name, record)
+        if notes is not None:
+            for key, note in notes.data.items():
+                note_rows._write(key, note)
+
+
+def save_sqlite(book, notes, db_filename, force: bool = False) -> None:
+    """Фіксує стан книг у базі.
+
+    Книги, що вже працюють поверх SQLite, зберігаються після кожної команди,
+    тому для них лише фіксується транзакція; звичайні книги записуються повністю.
+
+    Args:
+        book (AddressBook): Адресна книга.
+        notes (NoteBook): Нотатник.
+        db_filename (str|Path): Шлях до файлу бази.
+        force (bool): Записати всі прочитані за сесію записи (коли покомандне
+            збереження не виконувалося, наприклад у пакетному режимі).
+    """
+    if isinstance(book, SqliteAddressBook):
+        if force:
+            book.data.flush_all()
+            if isinstance(notes, SqliteNoteBook):
+                notes.data.flush_all()
+        book.data.conn.commit()
+        return
+    conn = connect(db_filename)
+    with conn:
+        conn.execute("DELETE FROM phones")
+        conn.execute("DELETE FROM emails")
+        conn.execute("DELETE FROM contacts")
+        conn.execute("DELETE FROM note_tags")
+        conn.execute("DELETE FROM notes_fts")
+        conn.execute("DELETE FROM notes")
+    import_books(book, notes, conn)
+    conn.close()
@@ -0,0 +1,316 @@
+"""Лічильники та час виконання команд (команда stats).
+
+Кожен виклик команди через реєстр (CommandSpec.__call__) вимірюється:
+- кількість викликів і помилок;
+- затримка — у гістограму з логарифмічними кошиками, з якої беруться
+  p50 / p95 / p99 (точність — один кошик, ~15 %), без зберігання
+  окремих вимірів;
+- розмір результату в рядках.
+
+Для потокових результатів (генераторів рядків) до часу обробника
+додається час формування кожного рядка, але не час їх виводу; вимір
+записується, коли вивід завершився або перервався.
+
+Помилкою вважається виняток з обробника, виняток, перехоплений
+декоратором input_error, або текстовий результат, що починається з
+ERROR_PREFIXES («Помилка:», «[ERROR]»). Звичайні відповіді на кшталт
+«не знайдено» помилками не вважаються (хоча CLI за is_error_message і
+виділяє їх червоним), як і довідка чи підсумок імпорту з помилками
+окремих рядків.
+
+Команди, відтворені з журналу під час запуску, не вимірюються
+(див. CommandStats.paused): статистика описує лише поточну сесію.
+
+Якщо задано змінну середовища CLI_BOT_STATS_FILE, під час завершення
+програми статистика записується в цей файл у форматі JSON.
+"""
+
+import json
+import os
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from time import perf_counter
+
+STATS_FILE = os.getenv("CLI_BOT_STATS_FILE")
+
+# Кошиків гістограми на порядок величини (межі зростають у 10 ** (1 / 16) ≈ 1.155 раза).
+_BUCKETS_PER_DECADE = 16
+# Верхні межі кошиків у секундах: від 1 мкс до 1000 с; довші виклики — в останньому кошику.
+_BOUNDS = [1e-6 * 10 ** (i / _BUCKETS_PER_DECADE) for i in range(9 * _BUCKETS_PER_DECADE + 1)]
+
+# Фрагменти, за якими текстовий результат команди вважається повідомленням про помилку.
+ERROR_MARKERS = (
+    "Помилка:",
+    "Невірний номер",
+    "очікує",
+    "вже існує",
+    "не існує",
+    "не знайдено",
+    "вже вказано",
+    "help для ознайомлення",
+    "невірно",
+    "Некоректна",
+    "Невірний email",
+    "не може бути",
+    "поточним",
+    "має бути",
+)
+
+# Вимір команди, що виконується зараз (для позначки помилки з input_error).
+_current: ContextVar["_Measurement | None"] = ContextVar("current_measurement", default=None)
+
+# Чи вимкнено запис вимірів у поточному контексті (див. CommandStats.paused).
+_paused: ContextVar[bool] = ContextVar("stats_paused", default=False)
+
+# Початок текстового результату, за яким він вважається помилкою команди.
+ERROR_PREFIXES = ("[ERROR]", "Помилка:")
+
+
+def is_error_message(text: str) -> bool:
+    """Перевіряє, чи є текстовий результат команди повідомленням про помилку.
+
+    Args:
+        text (str): Результат команди.
+
+    Returns:
+        bool: True, якщо текст містить один із ERROR_MARKERS.
+    """
+    return any(marker in text for marker in ERROR_MARKERS)
+
+
+class CommandMetrics:
+    """Накопичені показники однієї команди."""
+
+    __slots__ = ("calls", "errors", "total", "max", "lines", "_histogram")
+
+    def __init__(self):
+        """Створює порожні показники."""
+        self.calls = 0
+        self.errors = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.lines = 0
+        self._histogram = [0] * (len(_BOUNDS) + 1)
+
+    def add(self, elapsed: float, lines: int, error: bool) -> None:
+        """Додає один вимір.
+
+        Args:
+            elapsed (float): Тривалість у секундах.
+            lines (int): Кількість рядків результату.
+            error (bool): Чи завершилася команда помилкою.
+        """
+        self.calls += 1
+        self.errors += error
+        self.total += elapsed
+        self.max = max(self.max, elapsed)
+        self.lines += lines
+        self._histogram[bisect_left(_BOUNDS, elapsed)] += 1
+
+    def percentile(self, q: float) -> float:
+        """Оцінює q-й процентиль затримки за гістограмою.
+
+        Args:
+            q (float): Частка від 0 до 1 (наприклад, 0.95).
+
+        Returns:
+            float: Верхня межа кошика, в який потрапляє процентиль (не більше
+                за найбільшу затримку), у секундах; 0, якщо вимірів немає.
+        """
+        if not self.calls:
+            return 0.0
+        rank = max(1, round(q * self.calls))
+        seen = 0
+        for index, count in enumerate(self._histogram):
+            seen += count
+            if seen >= rank:
+                bound = _BOUNDS[index] if index < len(_BOUNDS) else self.max
+                return min(bound, self.max)
+        return self.max
+
+    def as_dict(self) -> dict:
+        """Повертає показники для JSON (час — у мілісекундах)."""
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "total_ms": round(self.total * 1000, 3),
+            "p50_ms": round(self.percentile(0.50) * 1000, 3),
+            "p95_ms": round(self.percentile(0.95) * 1000, 3),
+            "p99_ms": round(self.percentile(0.99) * 1000, 3),
+            "max_ms": round(self.max * 1000, 3),
+            "avg_lines": round(self.lines / self.calls, 1) if self.calls else 0,
+        }
+
+
+class _Measurement:
+    """Вимір одного виклику команди (контекстний менеджер навколо обробника)."""
+
+    __slots__ = ("_stats", "_name", "_started", "_token", "elapsed", "error")
+
+    def __init__(self, stats: "CommandStats", name: str):
+        self._stats = stats
+        self._name = name
+        self.elapsed = 0.0
+        self.error = False
+
+    def __enter__(self):
+        self._token = _current.set(self)
+        self._started = perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.elapsed = perf_counter() - self._started
+        _current.reset(self._token)
+        if exc_type is not None:
+            self._stats.record(self._name, self.elapsed, 0, error=True)
+        return False
+
+    def result(self, result):
+        """Записує вимір для результату обробника та повертає результат.
+
+        Рядок або None записуються одразу; ітератор загортається так, щоб
+        вимір записався після того, як його прочитають до кінця чи закриють.
+        """
+        if result is None or isinstance(result, str):
+            lines = 0 if result is None else result.count("\n") + 1
+            self.error = self.error or (result is not None and result.startswith(ERROR_PREFIXES))
+            self._stats.record(self._name, self.elapsed, lines, self.error)
+            return result
+        return self._stream(result)
+
+    def _stream(self, lines):
+        """Передає рядки далі, підсумовуючи лише час їх формування.
+
+        Поки формується рядок, вимір знову поточний, тож mark_error з
+        потокового результату (див. decorator._guard_stream) теж враховується.
+        """
+        elapsed, count = self.elapsed, 0
+        iterator = iter(lines)
+        try:
+            while True:
+                started = perf_counter()
+                token = _current.set(self)
+                try:
+                    line = next(iterator)
+                except StopIteration:
+                    break
+                except Exception:
+                    self.error = True
+                    raise
+                finally:
+                    _current.reset(token)
+                    elapsed += perf_counter() - started
+                count += 1
+                yield line
+        finally:
+            self._stats.record(self._name, elapsed, count, self.error)
+
+
+class CommandStats:
+    """Показники всіх команд, що виконувалися в цьому процесі."""
+
+    def __init__(self):
+        """Створює порожню статистику."""
+        self.metrics: dict[str, CommandMetrics] = {}
+
+    def measure(self, name: str) -> _Measurement:
+        """Повертає вимір для виклику команди name.
+
+        Використання:
+            with STATS.measure(name) as measurement:
+                result = handler(...)
+            return measurement.result(result)
+        """
+        return _Measurement(self, name)
+
+    @contextmanager
+    def paused(self):
+        """Вимикає запис вимірів у межах блоку (наприклад, під час відтворення журналу)."""
+        token = _paused.set(True)
+        try:
+            yield
+        finally:
+            _paused.reset(token)
+
+    def record(self, name: str, elapsed: float, lines: int, error: bool = False) -> None:
+        """Додає вимір команди name (див. CommandMetrics.add), якщо запис не вимкнено."""
+        if _paused.get():
+            return
+        metrics = self.metrics.get(name)
+        if metrics is None:
+            metrics = self.metrics[name] = CommandMetrics()
+        metrics.add(elapsed, lines, error)
+
+    def reset(self) -> None:
+        """Очищує всі показники."""
+        self.metrics.clear()
+
+    def as_dict(self) -> dict:
+        """Повертає показники всіх команд для JSON."""
+        return {name: metrics.as_dict() for name, metrics in sorted(self.metrics.items())}
+
+    def dump(self, path) -> None:
+        """Записує показники у JSON-файл (помилка запису виводиться, але не зупиняє вихід).
+
+        Args:
+            path (str | Path): Шлях до файлу.
+        """
+        try:
+            Path(path).expanduser().write_text(
+                json.dumps(self.as_dict(), ensure_ascii=False, indent=2), encoding="utf-8"
+            )
+        except OSError as e:
+            print(f"[ERROR] Не вдалося записати статистику: {e}")
+
+
+STATS = CommandStats()
+
+
+def mark_error() -> None:
+    """Позначає поточну команду як завершену помилкою (викликає input_error)."""
+    measurement = _current.get()
+    if measurement is not None:
+        measurement.error = True
+
+
+def show_stats(args):
+    """Команда stats: показує час виконання та лічильники команд.
+
+    Формат:
+        stats [reset]
+
+    Команди впорядковано за сумарним часом виконання (найповільніші — вгорі).
+
+    Args:
+        args (list[str]): Порожньо або «reset» для очищення статистики.
+
+    Returns:
+        Iterator[str] | str: Рядки таблиці або повідомлення.
+    """
+    if args == ["reset"]:
+        STATS.reset()
+        return "Статистику команд очищено."
+    if args:
+        return "Помилка: команда 'stats' очікує: stats [reset]."
+    if not STATS.metrics:
+        return "Ще не виконано жодної команди."
+    ordered = sorted(STATS.metrics.items(), key=lambda item: item[1].total, reverse=True)
+    return _iter_stats(ordered)
+
+
+def _iter_stats(ordered):
+    """Форматує таблицю показників команд (час — у мілісекундах)."""
+    headers = ["Команда", "Викликів", "Помилок", "Всього мс", "p50", "p95", "p99", "Макс", "Рядків"]
+    width = max(len(headers[0]), *(len(name) for name, _ in ordered))
+    yield headers[0].ljust(width) + " | " + " | ".join(f"{header:>9}" for header in headers[1:])
+    yield "-" * width + "-+-" + "-+-".join("-" * 9 for _ in headers[1:])
+    for name, metrics in ordered:
+        data = metrics.as_dict()
+        cells = [
+            str(data["calls"]), str(data["errors"]),
+            f"{data['total_ms']:.2f}", f"{data['p50_ms']:.3f}", f"{data['p95_ms']:.3f}",
+            f"{data['p99_ms']:.3f}", f"{data['max_ms']:.3f}", f"{data['avg_lines']:g}",
+        ]
+        yield name.ljust(width) + " | " + " | ".join(f"{cell:>9}" for cell in cells)
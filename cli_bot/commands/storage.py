@@ -3,7 +3,21 @@
 Забезпечує:
 - створення директорії збереження (~/.cli_bot або шлях, заданий CLI_BOT_DATA_DIR);
 - серіалізацію об’єктів AddressBook та NoteBook у pickle-файли;
-- відновлення контактів і нотаток при запуску програми.
+- відновлення контактів і нотаток при запуску програми;
+- режим журналу (CLI_BOT_STORAGE=journal): кожна змінююча команда дописується
+  у journal.log, а повний знімок перезаписується лише після перевищення
+  порогу CLI_BOT_JOURNAL_LIMIT (у байтах);
+- режим SQLite (CLI_BOT_STORAGE=sqlite): контакти й нотатки зберігаються
+  в cli_bot.sqlite3 та читаються з бази на вимогу;
+- фонове автозбереження (AutoSaver) для режиму pickle: змінюючі команди
+  позначають дані як змінені, а окремий потік раз на CLI_BOT_AUTOSAVE_INTERVAL
+  секунд або після CLI_BOT_AUTOSAVE_MUTATIONS змін записує один спільний знімок;
+- ліниве завантаження (режими pickle і journal): кожен файл читається лише
+  тоді, коли він уперше потрібен команді, а тексти нотаток лежать окремо
+  від notes.pkl і читаються на вимогу (див. note_store). Незавантажені
+  книги не перезаписуються під час збереження;
+- стовпцевий формат адресної книги (CLI_BOT_BOOK_LAYOUT=columnar, див. columnar):
+  книга іншого формату перетворюється під час завантаження.
 
 У разі відсутності файлів створюються нові порожні об'єкти.
 Усі операції супроводжуються консольними повідомленнями INFO / ERROR.
@@ -11,40 +25,245 @@
 
 import os
 import pickle
+import sys
+import threading
 from pathlib import Path
 
 from .address_book import AddressBook
+from .columnar import ColumnarAddressBook
 from .note_book import NoteBook
+from .journal import append_entry, replay_journal, journal_position, journal_size, reset_journal
+from .lazy import LazyProxy, is_loaded, unwrap
+from .note_store import load_notes, store_bodies
+from .registry import get_command, last_mutation
+from .sqlite_storage import load_sqlite, save_sqlite
 
 _DEFAULT_DIR = Path.home() / ".cli_bot"
 DATA_DIR = Path(os.getenv("CLI_BOT_DATA_DIR", _DEFAULT_DIR)).expanduser()
 DATA_CONTACT_FILE = DATA_DIR / "addressbook.pkl"
 DATA_NOTE_FILE = DATA_DIR / "notes.pkl"
+DATA_JOURNAL_FILE = DATA_DIR / "journal.log"
+DATA_SQLITE_FILE = DATA_DIR / "cli_bot.sqlite3"
 
+STORAGE_BACKEND = os.getenv("CLI_BOT_STORAGE", "pickle").strip().lower()
+JOURNAL_COMPACT_BYTES = int(os.getenv("CLI_BOT_JOURNAL_LIMIT", 1024 * 1024))
+AUTOSAVE_INTERVAL = float(os.getenv("CLI_BOT_AUTOSAVE_INTERVAL", 30))
+AUTOSAVE_MUTATIONS = int(os.getenv("CLI_BOT_AUTOSAVE_MUTATIONS", 20))
+BOOK_LAYOUT = os.getenv("CLI_BOT_BOOK_LAYOUT", "records").strip().lower()
 
-def save_data(book, notes, contact_filename=DATA_CONTACT_FILE, note_filename=DATA_NOTE_FILE):
+
+def _write_atomic(path: Path, write) -> None:
+    """Записує файл через тимчасовий файл, fsync та атомарне перейменування.
+
+    Після збою на диску лишається або старий, або новий файл, але не обрізаний.
+
+    Args:
+        path (Path): Кінцевий шлях файлу.
+        write (callable): Функція, що записує вміст у відкритий бінарний файл.
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    with tmp_path.open("wb") as f:
+        write(f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def _dump_atomic(obj, path: Path) -> None:
+    """Записує об'єкт у pickle-файл через тимчасовий файл та атомарне перейменування.
+
+    Args:
+        obj: Об'єкт для серіалізації.
+        path (Path): Кінцевий шлях файлу.
+    """
+    _write_atomic(path, lambda f: pickle.dump(obj, f))
+
+
+def _dump_notes(notes, path: Path) -> None:
+    """Записує тексти нотаток у файл текстів, а потім атомарно — сам нотатник.
+
+    Args:
+        notes (NoteBook): Нотатник.
+        path (Path): Шлях до notes.pkl.
+    """
+    stale = store_bodies(notes, path)
+    _dump_atomic(notes, path)
+    if stale is not None:
+        stale.unlink(missing_ok=True)
+
+
+class AutoSaver:
+    """Фонове автозбереження знімка pickle зі згортанням частих змін.
+
+    Змінюючі команди викликають mark_dirty (через log_command). Потік
+    автозбереження прокидається раз на interval секунд або одразу після
+    max_pending змін і, якщо дані змінено, записує один знімок на всі
+    накопичені зміни.
+
+    Знімок серіалізується в пам'ять під lock, а на диск пишеться вже без
+    нього, тому цикл команд чекає лише на pickle, а не на файлове введення-виведення.
+    Код, що змінює книги, має виконуватися під тим самим lock.
+    Книги, які ще не завантажувалися з диска (LazyProxy), не перезаписуються.
+
+    У режимах journal і sqlite кожна зміна й так потрапляє на диск одразу,
+    тому там потік не запускається (enabled=False), а lock і mark_dirty
+    лишаються безпечними заглушками.
+    """
+
+    def __init__(self, book, notes, contact_filename=DATA_CONTACT_FILE, note_filename=DATA_NOTE_FILE,
+                 interval: float = AUTOSAVE_INTERVAL, max_pending: int = AUTOSAVE_MUTATIONS):
+        """Налаштовує автозбереження (потік запускається методом start).
+
+        Args:
+            book (AddressBook): Адресна книга.
+            notes (NoteBook): Нотатник.
+            contact_filename (str|Path): Шлях до файлу з контактами.
+            note_filename (str|Path): Шлях до файлу з нотатками.
+            interval (float): Період перевірки змін у секундах (0 — вимкнути).
+            max_pending (int): Кількість змін, після якої збереження не чекає кінця періоду.
+        """
+        self.book = book
+        self.notes = notes
+        self.contact_path = Path(contact_filename)
+        self.note_path = Path(note_filename)
+        self.interval = interval
+        self.max_pending = max(1, max_pending)
+        self.enabled = STORAGE_BACKEND == "pickle" and interval > 0
+        self.lock = threading.RLock()
+        self._pending = 0
+        self._wake = threading.Event()
+        self._stopping = False
+        self._thread = None
+
+    def start(self) -> "AutoSaver":
+        """Запускає фоновий потік (якщо автозбереження увімкнено).
+
+        Returns:
+            AutoSaver: Цей самий об'єкт (для зручного ланцюжка викликів).
+        """
+        if self.enabled and self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="cli-bot-autosave", daemon=True)
+            self._thread.start()
+        return self
+
+    def mark_dirty(self) -> None:
+        """Позначає дані зміненими; після max_pending змін будить потік збереження."""
+        with self.lock:
+            self._pending += 1
+            if self._pending >= self.max_pending:
+                self._wake.set()
+
+    def save_now(self) -> bool:
+        """Записує знімок, якщо з моменту попереднього збереження були зміни.
+
+        Returns:
+            bool: True, якщо знімок записано.
+        """
+        with self.lock:
+            pending = self._pending
+            if not pending:
+                return False
+            try:
+                book_data = pickle.dumps(unwrap(self.book)) if is_loaded(self.book) else None
+                notes_data = pickle.dumps(unwrap(self.notes)) if is_loaded(self.notes) else None
+            except Exception as e:
+                print(f"[ERROR] Помилка автозбереження: {e}")
+                return False
+            self._pending = 0
+
+        try:
+            self.contact_path.parent.mkdir(parents=True, exist_ok=True)
+            self.note_path.parent.mkdir(parents=True, exist_ok=True)
+            if book_data is not None:
+                _write_atomic(self.contact_path, lambda f: f.write(book_data))
+            if notes_data is not None:
+                _write_atomic(self.note_path, lambda f: f.write(notes_data))
+        except Exception as e:
+            with self.lock:
+                self._pending += pending
+            print(f"[ERROR] Помилка автозбереження: {e}")
+            return False
+        return True
+
+    def _run(self) -> None:
+        """Цикл фонового потоку: чекає на період або на сигнал і зберігає зміни."""
+        while not self._stopping:
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            if self._stopping:
+                break
+            self.save_now()
+
+    def stop(self) -> None:
+        """Зупиняє фоновий потік і чекає завершення поточного запису.
+
+        Підсумкове збереження виконує save_data після зупинки.
+        """
+        self._stopping = True
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+
+def save_data(book, notes, contact_filename=DATA_CONTACT_FILE, note_filename=DATA_NOTE_FILE,
+              journal_filename=DATA_JOURNAL_FILE, force=False):
     """Зберігає дані адресної книги та нотаток у pickle-файли.
 
+    У режимі journal знімок перезаписується лише тоді, коли журнал перевищив
+    поріг JOURNAL_COMPACT_BYTES (або force=True); після успішного запису журнал очищується.
+    Кожен знімок зберігає позицію журналу, яку він уже містить (journal_position),
+    тож якщо записати вдалося лише один із файлів, журнал не застосує свої зміни
+    до нього вдруге.
+    Книга, яку так і не завантажили з диска, не змінилася, тому її файл не перезаписується.
+
     Args:
         book (AddressBook): Об’єкт адресної книги, який потрібно зберегти.
         notes (NoteBook): Об’єкт нотаток.
         contact_filename (str|Path): Шлях до файлу з контактами.
         note_filename (str|Path): Шлях до файлу з нотатками.
+        journal_filename (str|Path): Шлях до журналу змін (режим journal).
+        force (bool): Зберегти повний стан, навіть якщо зміни не фіксувалися
+            покомандно через log_command (пакетний режим).
 
     Returns:
         None. Виводить інформаційні або помилкові повідомлення у консоль.
     """
     contact_path = Path(contact_filename)
     note_path = Path(note_filename)
+
+    if STORAGE_BACKEND == "sqlite":
+        try:
+            save_sqlite(book, notes, DATA_SQLITE_FILE, force=force)
+            print(f"[INFO] Дані збережено у базі: {DATA_SQLITE_FILE}")
+        except Exception as e:
+            print(f"[ERROR] Помилка збереження даних: {e}")
+        return
+
+    if (
+        STORAGE_BACKEND == "journal"
+        and not force
+        and journal_size(journal_filename) < JOURNAL_COMPACT_BYTES
+    ):
+        print(f"[INFO] Зміни вже збережено в журналі: {journal_filename}")
+        return
+
     try:
         contact_path.parent.mkdir(parents=True, exist_ok=True)
         note_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with contact_path.open("wb") as f:
-            pickle.dump(book, f)
+        position = journal_position(journal_filename) if STORAGE_BACKEND == "journal" else None
+        if is_loaded(book):
+            if position is not None:
+                unwrap(book).journal_position = position
+            _dump_atomic(unwrap(book), contact_path)
+        if is_loaded(notes):
+            if position is not None:
+                unwrap(notes).journal_position = position
+            _dump_notes(unwrap(notes), note_path)
 
-        with note_path.open("wb") as f:
-            pickle.dump(notes, f)
+        if STORAGE_BACKEND == "journal":
+            reset_journal(journal_filename)
 
         print(f"[INFO] Дані збережено у файлах: {contact_path}, {note_path}")
 
@@ -52,42 +271,165 @@ def save_data(book, notes, contact_filename=DATA_CONTACT_FILE, note_filename=DAT
         print(f"[ERROR] Помилка збереження даних: {e}")
 
 
-def load_data(contact_filename=DATA_CONTACT_FILE, note_filename=DATA_NOTE_FILE):
+def log_command(command: str, args: list[str], book, notes, journal_filename=DATA_JOURNAL_FILE,
+                saver: AutoSaver | None = None) -> None:
+    """Фіксує змінюючу команду у сховищі, що підтримує покомандне збереження.
+
+    У режимі journal команда дописується в журнал разом із моментом виконання
+    (команди, що завершилися помилкою чи відмовою — відповіддю Refusal,
+    пропускаються); коли журнал перевищує поріг
+    JOURNAL_COMPACT_BYTES, він згортається в новий знімок через save_data.
+    Команди, які не можна відтворити з журналу (replayable=False), одразу
+    записуються знімком.
+    У режимі sqlite в базу записується лише змінений контакт або нотатка.
+    Якщо передано saver, дані позначаються зміненими для автозбереження.
+
+    Args:
+        command (str): Назва виконаної команди.
+        args (list[str]): Аргументи команди.
+        book (AddressBook): Поточна адресна книга.
+        notes (NoteBook): Поточний нотатник.
+        journal_filename (str|Path): Шлях до журналу змін.
+        saver (AutoSaver | None): Автозбереження, яке треба повідомити про зміну.
+    """
+    spec = get_command(command)
+    if spec is None or not spec.mutating:
+        return
+    if saver is not None:
+        saver.mark_dirty()
+    if STORAGE_BACKEND == "sqlite":
+        owner = {"book": book, "notes": notes}.get(spec.target)
+        if args and hasattr(owner, "flush"):
+            owner.flush(args[0])
+        return
+    if STORAGE_BACKEND != "journal":
+        return
+    if not spec.replayable:
+        save_data(book, notes, journal_filename=journal_filename, force=True)
+        return
+    moment, failed = last_mutation.get() or (None, False)
+    if failed:
+        return
+    try:
+        append_entry(journal_filename, spec.name, args, at=moment)
+    except OSError as e:
+        print(f"[ERROR] Помилка запису журналу: {e}")
+        return
+    if journal_size(journal_filename) >= JOURNAL_COMPACT_BYTES:
+        save_data(book, notes, journal_filename=journal_filename)
+
+
+def load_data(contact_filename=DATA_CONTACT_FILE, note_filename=DATA_NOTE_FILE,
+              journal_filename=DATA_JOURNAL_FILE):
     """Завантажує дані контактів і нотаток із pickle-файлів.
 
     Якщо файлів не існує, створює нові об’єкти AddressBook та NoteBook.
-    У разі помилки завантаження повертає порожні структури.
+    Наявні файли не читаються одразу: замість книг повертаються LazyProxy,
+    які завантажують файл під час першого звернення команди до нього.
+    У режимі sqlite повертає книги, що читають дані з бази на вимогу.
+    У режимі journal поверх знімка відтворюються команди з журналу.
+    У разі помилки завантаження повертає порожні структури. У режимі sqlite
+    натомість завершує роботу: збереження порожніх книг перезаписало б базу
+    (зокрема, коли її лише тимчасово заблокував інший процес).
 
     Args:
         contact_filename (str|Path): Шлях до файлу контактів.
         note_filename (str|Path): Шлях до файлу нотаток.
+        journal_filename (str|Path): Шлях до журналу змін (режим journal).
 
     Returns:
         tuple(AddressBook, NoteBook): Завантажені або новостворені об’єкти.
+
+    Raises:
+        SystemExit: Якщо в режимі sqlite базу не вдалося відкрити.
     """
     contact_path = Path(contact_filename)
     note_path = Path(note_filename)
 
     try:
-        # Завантаження контактів
+        if STORAGE_BACKEND == "sqlite":
+            book, notes = load_sqlite(DATA_SQLITE_FILE, contact_path, note_path)
+            print(f"[INFO] Підключено базу даних: {DATA_SQLITE_FILE}")
+            return book, notes
+
+        # Контакти
         if not contact_path.exists():
             print("[INFO] Файл адресної книги не знайдено, створено нову.")
-            book = AddressBook()
+            book = _new_book()
         else:
-            with contact_path.open("rb") as f:
-                book = pickle.load(f)
+            book = LazyProxy(lambda: _load_lazily(contact_path, _load_book, _new_book))
 
-        # Завантаження нотаток
+        # Нотатки
         if not note_path.exists():
             print("[INFO] Файл нотаток не знайдено, створено новий.")
             notes = NoteBook()
         else:
-            with note_path.open("rb") as f:
-                notes = pickle.load(f)
+            notes = LazyProxy(lambda: _load_lazily(note_path, load_notes, NoteBook))
 
-        print(f"[INFO] Дані завантажено з файлів: {contact_path}, {note_path}")
+        if STORAGE_BACKEND == "journal":
+            replayed = replay_journal(journal_filename, book, notes)
+            if replayed:
+                print(f"[INFO] Відтворено змін із журналу: {replayed}")
+
+        print(f"[INFO] Підключено файли даних: {contact_path}, {note_path} (читаються під час першого звернення)")
         return book, notes
 
     except Exception as e:
+        if STORAGE_BACKEND == "sqlite":
+            print(f"[ERROR] Не вдалося відкрити базу {DATA_SQLITE_FILE}: {e}. "
+                  "Роботу зупинено, щоб не перезаписати базу порожніми даними.")
+            raise SystemExit(1) from e
         print(f"[ERROR] Помилка завантаження даних: {e}")
-        return AddressBook(), NoteBook()
+        return _new_book(), NoteBook()
+
+
+def _new_book() -> AddressBook:
+    """Створює порожню адресну книгу у форматі CLI_BOT_BOOK_LAYOUT."""
+    return ColumnarAddressBook() if BOOK_LAYOUT == "columnar" else AddressBook()
+
+
+def _load_book(path: Path) -> AddressBook:
+    """Завантажує адресну книгу з pickle-файлу та за потреби змінює її формат.
+
+    Позиція журналу, яку містить знімок (journal_position), переходить до перетвореної книги.
+
+    Args:
+        path (Path): Шлях до файлу контактів.
+
+    Returns:
+        AddressBook: Книга у форматі CLI_BOT_BOOK_LAYOUT.
+    """
+    with path.open("rb") as f:
+        book = pickle.load(f)
+    columnar = isinstance(book, ColumnarAddressBook)
+    if BOOK_LAYOUT == "columnar" and not columnar:
+        converted = ColumnarAddressBook.from_book(book)
+    elif BOOK_LAYOUT != "columnar" and columnar:
+        converted = book.to_book()
+    else:
+        return book
+    position = getattr(book, "journal_position", None)
+    if position is not None:
+        converted.journal_position = position
+    return converted
+
+
+def _load_lazily(path: Path, load, empty):
+    """Завантажує книгу для LazyProxy під час першого звернення до неї.
+
+    Помилка виводиться в stderr, щоб не змішуватися з результатом команди,
+    яка спричинила завантаження.
+
+    Args:
+        path (Path): Шлях до файлу.
+        load (callable): Функція, що читає файл.
+        empty (callable): Створює порожню книгу на випадок помилки.
+
+    Returns:
+        Завантажена або нова порожня книга.
+    """
+    try:
+        return load(path)
+    except Exception as e:
+        print(f"[ERROR] Помилка завантаження даних з {path}: {e}", file=sys.stderr)
+        return empty()
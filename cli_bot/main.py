@@ -3,82 +3,60 @@
 Забезпечує:
 - завантаження даних контактів і нотаток;
 - цикл обробки команд користувача;
-- виконання команд через execute_command;
-- підказки для схожих команд (suggest_command);
-- кольоровий вивід результатів і помилок.
+- виконання команд через execute_command (реєстр команд commands.registry);
+- підказки для схожих команд (suggest_command) та аргументів —
+  імен контактів, назв нотаток і тегів (suggest_argument);
+- кольоровий вивід результатів і помилок;
+- потоковий вивід великих результатів (генераторів рядків);
+- автодоповнення назв команд та імен контактів клавішею Tab (readline);
+- пакетний режим (--batch або вхід через pipe) без підказок і кольорів;
+- серверний режим (serve) і тонкий клієнт до нього (connect);
+- запис статистики команд у JSON під час виходу (CLI_BOT_STATS_FILE);
+- трасування пам'яті від самого запуску (--trace-memory, команда memory).
 """
 
 try:
     from commands import (
-        add_contact, change_contact, show_phone, show_all,
-        add_birthday, show_birthday, birthdays, birthdays_in,
-        add_address, add_email, delete_contact, find_by_email, find_by_name,
-        add_note, show_notes, find_note, edit_note, delete_note,
-        add_tags_to_note, find_note_by_tags, sort_notes_by_tags,
-        parse_input, save_data, load_data, help_text, all_table,
+        parse_input, save_data, load_data, log_command, dispatch,
+        suggest_command, suggest_argument, command_names, get_command,
+        run_server, DEFAULT_HOST, DEFAULT_PORT, END_MARKER, AutoSaver, STATS, STATS_FILE, is_error_message,
+        start_tracing,
     )
 except ImportError:  # pragma: no cover - fallback for script execution
     from commands import (  # type: ignore
-        add_contact, change_contact, show_phone, show_all,
-        add_birthday, show_birthday, birthdays, birthdays_in,
-        add_address, add_email, delete_contact, find_by_email, find_by_name,
-        add_note, show_notes, find_note, edit_note, delete_note,
-        add_tags_to_note, find_note_by_tags, sort_notes_by_tags,
-        parse_input, save_data, load_data, help_text, all_table,
+        parse_input, save_data, load_data, log_command, dispatch,
+        suggest_command, suggest_argument, command_names, get_command,
+        run_server, DEFAULT_HOST, DEFAULT_PORT, END_MARKER, AutoSaver, STATS, STATS_FILE, is_error_message,
+        start_tracing,
     )
 
-from difflib import get_close_matches
+import argparse
+import atexit
+import contextlib
+import re
+import socket
+import sys
+
+try:
+    import readline
+except ImportError:  # pragma: no cover - readline недоступний (наприклад, у Windows)
+    readline = None
 
 from colorama import init, Fore, Style
 init(autoreset=True)
 
 ERROR_MSG = "Команда не існує. Введіть 'help' для ознайомлення."
 
-COMMANDS = (
-    "hello",
-    "add",
-    "change",
-    "phone",
-    "all",
-    "add-birthday",
-    "add-address",
-    "add-email",
-    "show-birthday",
-    "birthdays",
-    "birthdays-in",
-    "add-note",
-    "find-note",
-    "edit-note",
-    "delete-note",
-    "delete",
-    "email",
-    "name",
-    "show-notes",
-    "help",
-    "close",
-    "exit",
-    "add-tags",
-    "find-by-tag",
-    "sort-notes-by-tag",
-    "all-table",
-)
-
-
-def suggest_command(user_cmd: str):
-    """Пропонує найбільш схожу відому команду.
-
-    Args:
-        user_cmd (str): Команда, введена користувачем.
+# Кількість рядків, що накопичуються перед записом у stdout у пакетному режимі.
+BATCH_FLUSH_LINES = 1000
 
-    Returns:
-        str | None: Найближчий збіг із COMMANDS або None, якщо збігу немає.
-    """
-    matches = get_close_matches(user_cmd, COMMANDS, n=1, cutoff=0.6)
-    return matches[0] if matches else None
+_ANSI_PATTERN = re.compile(r"\x1b\[[0-9;]*m")
 
+# Найбільша кількість імен, які пропонує автодоповнення.
+COMPLETION_LIMIT = 50
 
 def execute_command(command: str, args: list[str], book, notes):
-    """Виконує команду, маршрутизуючи її до відповідної функції.
+    """Виконує команду через реєстр команд (один пошук у словнику).
 
     Args:
         command (str): Назва команди (у нижньому регістрі).
@@ -89,56 +67,55 @@ def execute_command(command: str, args: list[str], book, notes):
     Returns:
         Any | None: Результат виконання команди або None, якщо команда невідома.
     """
-    if command == "hello":
-        return "Як я можу допомогти?"
-    elif command == "add":
-        return add_contact(args, book)
-    elif command == "change":
-        return change_contact(args, book)
-    elif command == "phone":
-        return show_phone(args, book)
-    elif command == "all":
-        return show_all(book)
-    elif command == "add-birthday":
-        return add_birthday(args, book)
-    elif command == "show-birthday":
-        return show_birthday(args, book)
-    elif command == "birthdays":
-        return birthdays(book)
-    elif command == "birthdays-in":
-        return birthdays_in(args, book)
-    elif command == "add-address":
-        return add_address(args, book)
-    elif command == "add-email":
-        return add_email(args, book)
-    elif command == "delete":
-        return delete_contact(args, book)
-    elif command == "email":
-        return find_by_email(args, book)
-    elif command == "name":
-        return find_by_name(args, book)
-    elif command == "add-note":
-        return add_note(args, notes)
-    elif command == "find-note":
-        return find_note(args, notes)
-    elif command == "edit-note":
-        return edit_note(args, notes)
-    elif command == "delete-note":
-        return delete_note(args, notes)
-    elif command == "show-notes":
-        return show_notes(notes)
-    elif command == "add-tags":
-        return add_tags_to_note(args, notes)
-    elif command == "find-by-tag":
-        return find_note_by_tags(args, notes)
-    elif command == "sort-notes-by-tag":
-        return sort_notes_by_tags(notes)
-    elif command == "help":
-        return help_text()
-    elif command == "all-table":
-        return all_table(book)
+    return dispatch(command, args, book, notes)
+
+
+def make_completer(book):
+    """Створює функцію автодоповнення для readline.
+
+    Перше слово доповнюється назвою команди, аргументи команд адресної
+    книги — іменами контактів з відсортованого індексу книги (не більше
+    COMPLETION_LIMIT, тож доповнення миттєве навіть для дуже великої книги).
+
+    Args:
+        book: Екземпляр AddressBook.
+
+    Returns:
+        callable: Функція complete(text, state) у форматі readline.
+    """
+    matches: list[str] = []
+
+    def complete(text: str, state: int) -> str | None:
+        nonlocal matches
+        if state == 0:
+            words = readline.get_line_buffer()[:readline.get_begidx()].split()
+            if not words:
+                matches = [name for name in command_names() if name.startswith(text.lower())]
+            else:
+                spec = get_command(words[0].lower())
+                if spec is not None and spec.target == "book":
+                    matches = list(book.names_with_prefix(text, COMPLETION_LIMIT))
+                else:
+                    matches = []
+        return matches[state] if state < len(matches) else None
+
+    return complete
+
+
+def setup_completion(book) -> None:
+    """Вмикає автодоповнення клавішею Tab, якщо доступний readline.
+
+    Args:
+        book: Екземпляр AddressBook.
+    """
+    if readline is None:
+        return
+    readline.set_completer(make_completer(book))
+    readline.set_completer_delims(" \t\n")
+    if "libedit" in (readline.__doc__ or ""):
+        readline.parse_and_bind("bind ^I rl_complete")
     else:
-        return None
+        readline.parse_and_bind("tab: complete")
 
 
 def print_colored(message, color=Fore.GREEN):
@@ -151,16 +128,259 @@ def print_colored(message, color=Fore.GREEN):
     print(color + str(message))
 
 
-def main():
+def print_stream(lines, color=Fore.YELLOW):
+    """Друкує рядки результату по мірі їх формування.
+
+    Args:
+        lines: Ітератор рядків (наприклад, генератор від show_all чи all_table).
+        color: Колір із colorama.Fore.
+    """
+    for line in lines:
+        print(color + line)
+
+
+def print_result(result):
+    """Виводить результат команди: рядок — з підсвіткою помилок, ітератор — потоково.
+
+    Args:
+        result: Рядок-повідомлення або ітератор рядків.
+    """
+    if not isinstance(result, str):
+        print_stream(result, Fore.YELLOW)
+        return
+
+    if is_error_message(result):
+        print_colored(result, Fore.RED)
+    else:
+        print_colored(result, Fore.YELLOW)
+
+
+def run_batch(lines, book, notes, out=None) -> int:
+    """Виконує команди з потоку рядків без підказок, підтверджень і кольорів.
+
+    Порожні рядки та рядки, що починаються з «#», пропускаються;
+    exit / close завершують обробку. Вивід накопичується блоками
+    по BATCH_FLUSH_LINES рядків і лише тоді записується в out.
+    Як і в інтерактивному циклі, кожна змінююча команда одразу фіксується
+    через log_command (журнал або база SQLite), тож наступні команди пакета
+    бачать її результат.
+
+    Args:
+        lines (Iterable[str]): Рядки з командами.
+        book: Екземпляр AddressBook.
+        notes: Екземпляр NoteBook.
+        out: Потік виводу (за замовчуванням sys.stdout).
+
+    Returns:
+        int: Кількість виконаних команд.
+    """
+    out = out or sys.stdout
+    buffer: list[str] = []
+
+    def emit(text: str) -> None:
+        buffer.append(_ANSI_PATTERN.sub("", text))
+        if len(buffer) >= BATCH_FLUSH_LINES:
+            out.write("\n".join(buffer) + "\n")
+            out.flush()
+            buffer.clear()
+
+    executed = 0
+    for line in lines:
+        command, args = parse_input(line)
+        if not command or command.startswith("#"):
+            continue
+        if command in ("close", "exit"):
+            break
+
+        hint = suggest_argument(command, args, book, notes)
+        result = execute_command(command, args, book, notes)
+        log_command(command, args, book, notes)
+        executed += 1
+        if result is None:
+            suggestion = suggest_command(command)
+            emit(f"{ERROR_MSG} Можливо, ви мали на увазі '{suggestion}'?" if suggestion else ERROR_MSG)
+        elif isinstance(result, str):
+            emit(result)
+        else:
+            for chunk in result:
+                emit(chunk)
+        if hint:
+            emit(hint)
+
+    if buffer:
+        out.write("\n".join(buffer) + "\n")
+        out.flush()
+    return executed
+
+
+def run_batch_mode(source: str) -> None:
+    """Запускає пакетний режим: завантаження, виконання всіх команд і одне збереження.
+
+    Службові повідомлення сховища ([INFO] / [ERROR]) виводяться в stderr,
+    щоб stdout містив лише результати команд.
+
+    Args:
+        source (str): Шлях до файлу з командами або «-» для stdin.
+    """
+    with contextlib.redirect_stdout(sys.stderr):
+        book, notes = load_data()
+
+    try:
+        if source == "-":
+            run_batch(sys.stdin, book, notes)
+        else:
+            with open(source, encoding="utf-8") as commands_file:
+                run_batch(commands_file, book, notes)
+    finally:
+        with contextlib.redirect_stdout(sys.stderr):
+            save_data(book, notes, force=True)
+
+
+def _connect(host: str, port: int, socket_path=None) -> socket.socket:
+    """Відкриває з'єднання із сервером cli-bot serve.
+
+    Args:
+        host (str): Адреса TCP-сервера.
+        port (int): Порт TCP-сервера.
+        socket_path (str | None): Шлях Unix-сокета (має пріоритет над TCP).
+
+    Returns:
+        socket.socket: Підключений сокет.
+    """
+    if socket_path is not None:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.connect(socket_path)
+        return sock
+    return socket.create_connection((host, port))
+
+
+def _read_reply(stream):
+    """Читає рядки відповіді сервера до маркера END_MARKER.
+
+    Args:
+        stream: Двонапрямлений бінарний потік сокета.
+
+    Yields:
+        str: Чергові рядки відповіді.
+
+    Raises:
+        ConnectionError: Якщо сервер закрив з'єднання посеред відповіді.
+    """
+    while True:
+        raw = stream.readline()
+        if not raw:
+            raise ConnectionError("сервер закрив з'єднання")
+        line = raw.decode("utf-8").rstrip("\n")
+        if line == END_MARKER:
+            return
+        yield line
+
+
+def run_client(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, socket_path=None) -> None:
+    """Тонкий клієнт: надсилає команди серверу й виводить відповіді по мірі надходження.
+
+    Дані не завантажуються локально — усі команди виконує сервер.
+    Якщо stdin не є терміналом, команди читаються з нього без запрошення,
+    а вивід очищується від кольорів (як у пакетному режимі).
+
+    Args:
+        host (str): Адреса TCP-сервера.
+        port (int): Порт TCP-сервера.
+        socket_path (str | None): Шлях Unix-сокета (має пріоритет над TCP).
+    """
+    try:
+        sock = _connect(host, port, socket_path)
+    except OSError as e:
+        print_colored(f"Помилка: не вдалося підключитися до сервера: {e}", Fore.RED)
+        return
+
+    interactive = sys.stdin.isatty()
+    with sock, sock.makefile("rwb") as stream:
+        try:
+            while True:
+                if interactive:
+                    line = input(Fore.CYAN + "Введіть команду: " + Style.RESET_ALL)
+                else:
+                    line = sys.stdin.readline()
+                    if not line:
+                        break
+                command, _ = parse_input(line)
+                if not command:
+                    continue
+
+                stream.write((line.strip() + "\n").encode("utf-8"))
+                stream.flush()
+                for reply in _read_reply(stream):
+                    if interactive:
+                        print_result(reply)
+                    else:
+                        print(_ANSI_PATTERN.sub("", reply))
+
+                if command in ("close", "exit"):
+                    break
+        except (KeyboardInterrupt, EOFError):
+            pass
+        except ConnectionError as e:
+            print_colored(f"Помилка: {e}", Fore.RED)
+
+
+def main(argv=None):
     """Точка входу CLI-асистента.
 
+    - розбирає аргументи командного рядка (--batch FILE, serve, connect);
+    - у режимі serve запускає сервер зі спільними даними, у режимі connect — клієнт до нього;
+    - у пакетному режимі (або коли stdin не є терміналом) виконує команди без підказок;
     - завантажує дані з диска,
-    - запускає цикл введення команд,
+    - запускає цикл введення команд з автодоповненням команд та імен (Tab),
     - виконує команди та виводить результати з кольорами,
     - пропонує виправлення при помилці в назві команди,
-    - зберігає дані при завершенні або натисканні Ctrl+C.
+    - у режимі pickle у фоні зберігає зміни (AutoSaver), щоб їх не втратити при аварійному завершенні;
+    - зберігає дані при завершенні або натисканні Ctrl+C;
+    - якщо задано CLI_BOT_STATS_FILE, записує статистику команд у JSON під час виходу;
+    - з --trace-memory вмикає tracemalloc до завантаження даних (звіти — команда memory).
+
+    Args:
+        argv (list[str] | None): Аргументи командного рядка (None — sys.argv[1:]).
     """
+    parser = argparse.ArgumentParser(prog="cli-bot", description="Персональний асистент.")
+    parser.add_argument(
+        "--batch",
+        metavar="FILE",
+        help="виконати команди з файлу ('-' — зі stdin) без підказок і кольорів",
+    )
+    parser.add_argument(
+        "--trace-memory",
+        action="store_true",
+        help="відстежувати виділення пам'яті з самого запуску (tracemalloc; звіти — команда memory)",
+    )
+    address = argparse.ArgumentParser(add_help=False)
+    address.add_argument("--host", default=DEFAULT_HOST, help=f"адреса TCP-сервера (за замовчуванням {DEFAULT_HOST})")
+    address.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"порт TCP-сервера (за замовчуванням {DEFAULT_PORT})")
+    address.add_argument("--socket", metavar="PATH", help="шлях Unix-сокета замість TCP")
+    modes = parser.add_subparsers(dest="mode")
+    modes.add_parser("serve", parents=[address], help="запустити сервер зі спільними контактами й нотатками")
+    modes.add_parser("connect", parents=[address], help="підключитися до запущеного сервера")
+    options = parser.parse_args(argv)
+
+    if STATS_FILE:
+        atexit.register(STATS.dump, STATS_FILE)
+    if options.trace_memory:
+        start_tracing()
+
+    if options.mode == "serve":
+        run_server(options.host, options.port, options.socket)
+        return
+    if options.mode == "connect":
+        run_client(options.host, options.port, options.socket)
+        return
+
+    if options.batch is not None or not sys.stdin.isatty():
+        run_batch_mode(options.batch or "-")
+        return
+
     book, notes = load_data()
+    saver = AutoSaver(book, notes).start()
+    setup_completion(book)
     print_colored("Ласкаво просимо до асистента!", Fore.GREEN)
 
     try:
@@ -173,32 +393,19 @@ def main():
 
             if command in ("close", "exit"):
                 print_colored("До побачення!", Fore.GREEN)
+                saver.stop()
                 save_data(book, notes)
                 break
 
-            result = execute_command(command, args, book, notes)
+            hint = suggest_argument(command, args, book, notes)
+            with saver.lock:
+                result = execute_command(command, args, book, notes)
+                log_command(command, args, book, notes, saver=saver)
 
             if result is not None:
-                error_keys = [
-                    "Помилка:",
-                    "Невірний номер",
-                    "очікує",
-                    "вже існує",
-                    "не існує",
-                    "не знайдено",
-                    "вже вказано",
-                    "help для ознайомлення",
-                    "невірно",
-                    "Некоректна",
-                    "Невірний email",
-                    "не може бути",
-                    "поточним",
-                    "має бути",
-                ]
-                if any(key in str(result) for key in error_keys):
-                    print_colored(result, Fore.RED)
-                else:
-                    print_colored(result, Fore.YELLOW)
+                print_result(result)
+                if hint:
+                    print_colored(hint, Fore.CYAN)
                 continue
 
             suggestion = suggest_command(command)
@@ -209,14 +416,20 @@ def main():
                     + Style.RESET_ALL
                 ).strip().lower()
                 if answer in ("y", "yes", "т", "так"):
-                    result = execute_command(suggestion, args, book, notes)
+                    hint = suggest_argument(suggestion, args, book, notes)
+                    with saver.lock:
+                        result = execute_command(suggestion, args, book, notes)
+                        log_command(suggestion, args, book, notes, saver=saver)
                     if result is not None:
-                        print(result)
+                        print_result(result)
+                        if hint:
+                            print_colored(hint, Fore.CYAN)
                 else:
                     print_colored(ERROR_MSG, Fore.RED)
             else:
                 print_colored(ERROR_MSG, Fore.RED)
     except KeyboardInterrupt:
+        saver.stop()
         save_data(book, notes)
 
 
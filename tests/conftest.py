@@ -0,0 +1,12 @@
+"""Спільні налаштування тестів.
+
+Модулі команд імпортуються як пакет commands (тека cli_bot додається
+в sys.path), так само як під час запуску main.py скриптом.
+"""
+
+import sys
+from pathlib import Path
+
+_APP_DIR = str(Path(__file__).resolve().parent.parent / "cli_bot")
+if _APP_DIR not in sys.path:
+    sys.path.insert(0, _APP_DIR)
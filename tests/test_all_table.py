@@ -0,0 +1,51 @@
+"""Команда all-table: потокова таблиця, посторінковий вивід і ширина стовпців."""
+
+import importlib
+import re
+
+from commands.address_book import AddressBook, Record
+
+all_table = importlib.import_module("commands.all_table")
+
+_COLORS = re.compile(r"\x1b\[[0-9;]*m")
+
+
+def plain(lines):
+    """Повертає рядки таблиці без кольорових escape-послідовностей."""
+    return [_COLORS.sub("", line) for line in lines]
+
+
+def make_book(count):
+    """Книга з контактами Name000, Name001, ... з одним телефоном."""
+    book = AddressBook()
+    for i in range(count):
+        record = Record(f"Name{i:03}")
+        record.add_phone(f"{i:010}")
+        book.add_record(record)
+    return book
+
+
+def test_pages_and_past_the_end():
+    book = make_book(25)
+
+    lines = plain(all_table.all_table(["--page", "3", "--size", "10"], book))
+    assert [line.split(" | ")[0].strip() for line in lines[2:]] == [f"Name{i:03}" for i in range(20, 25)]
+
+    assert plain(all_table.all_table(["--limit", "2"], book))[2].startswith("Name000")
+    assert "усього контактів: 25" in all_table.all_table(["--page", "4", "--size", "10"], book)
+    assert all_table.all_table(["--page", "0"], book).startswith("Помилка")
+    assert all_table.all_table([], AddressBook()) == "Немає збережених контактів."
+
+
+def test_values_wider_than_sample_are_not_cut():
+    book = make_book(3)
+    book.find("Name002").add_address("Kyiv, Khreshchatyk street 1, apartment 22")
+
+    lines = plain(all_table.iter_table(book.data.values(), sample_size=1))
+
+    header = lines[0].split(" | ")
+    assert len(lines) == 5
+    assert "Kyiv, Khreshchatyk street 1, apartment 22" in lines[-1]
+    assert "…" not in "".join(lines)
+    # Рядки, що вміщуються у вибрану ширину, лишаються вирівняними із заголовком.
+    assert [len(cell) for cell in lines[2].split(" | ")] == [len(cell) for cell in header]
@@ -0,0 +1,113 @@
+"""Фонове автозбереження: облік змін, об'єднання записів і атомарні файли."""
+
+import importlib
+import pickle
+import time
+
+import pytest
+
+from commands.address_book import AddressBook
+from commands.lazy import LazyProxy
+from commands.note_book import NoteBook
+from commands.registry import dispatch
+
+storage = importlib.import_module("commands.storage")
+
+
+@pytest.fixture
+def paths(tmp_path, monkeypatch):
+    """Шляхи до знімків у тимчасовій теці, режим pickle."""
+    monkeypatch.setattr(storage, "STORAGE_BACKEND", "pickle")
+    return tmp_path / "addressbook.pkl", tmp_path / "notes.pkl"
+
+
+def saved_names(path):
+    """Імена контактів зі знімка на диску."""
+    with path.open("rb") as f:
+        return sorted(pickle.load(f).data)
+
+
+def run(saver, line, book, notes):
+    """Виконує команду й позначає зміну так само, як цикл команд."""
+    command, *args = line.split()
+    with saver.lock:
+        dispatch(command, args, book, notes)
+        storage.log_command(command, args, book, notes, saver=saver)
+
+
+def test_changes_are_coalesced_into_one_snapshot(paths):
+    contacts, note_file = paths
+    book, notes = AddressBook(), NoteBook()
+    saver = storage.AutoSaver(book, notes, contacts, note_file, interval=60, max_pending=100)
+
+    assert not saver.save_now()
+    run(saver, "add Ann 0123456789", book, notes)
+    run(saver, "add Bob 0987654321", book, notes)
+    run(saver, "phone Ann", book, notes)
+    assert saver._pending == 2
+
+    assert saver.save_now()
+    assert saved_names(contacts) == ["Ann", "Bob"]
+    assert not saver.save_now()
+
+
+def test_thread_wakes_after_max_pending(paths):
+    contacts, note_file = paths
+    book, notes = AddressBook(), NoteBook()
+    saver = storage.AutoSaver(book, notes, contacts, note_file, interval=60, max_pending=2).start()
+    try:
+        run(saver, "add Ann 0123456789", book, notes)
+        time.sleep(0.2)
+        assert not contacts.exists()
+
+        run(saver, "add Bob 0987654321", book, notes)
+        deadline = time.monotonic() + 10
+        while not contacts.exists() and time.monotonic() < deadline:
+            time.sleep(0.02)
+        assert saved_names(contacts) == ["Ann", "Bob"]
+    finally:
+        saver.stop()
+
+
+def test_failed_write_keeps_old_file_and_pending_changes(paths, monkeypatch):
+    contacts, note_file = paths
+    book, notes = AddressBook(), NoteBook()
+    saver = storage.AutoSaver(book, notes, contacts, note_file, interval=60)
+    run(saver, "add Ann 0123456789", book, notes)
+    saver.save_now()
+    run(saver, "add Bob 0987654321", book, notes)
+
+    def fail(fd):
+        raise OSError("disk full")
+
+    # Збій після запису тимчасового файлу, до перейменування.
+    with monkeypatch.context() as patch:
+        patch.setattr(storage.os, "fsync", fail)
+        assert not saver.save_now()
+
+    assert saved_names(contacts) == ["Ann"]
+    assert saver._pending == 1
+    assert saver.save_now()
+    assert saved_names(contacts) == ["Ann", "Bob"]
+
+
+def test_unloaded_books_are_not_rewritten(paths):
+    contacts, note_file = paths
+    storage._dump_atomic(NoteBook(), note_file)
+    before = note_file.stat().st_mtime_ns
+    book, notes = AddressBook(), LazyProxy(lambda: pytest.fail("notes must not be loaded"))
+    saver = storage.AutoSaver(book, notes, contacts, note_file, interval=60)
+
+    run(saver, "add Ann 0123456789", book, notes)
+    assert saver.save_now()
+
+    assert saved_names(contacts) == ["Ann"]
+    assert note_file.stat().st_mtime_ns == before
+
+
+def test_disabled_outside_pickle_mode(paths, monkeypatch):
+    monkeypatch.setattr(storage, "STORAGE_BACKEND", "journal")
+    saver = storage.AutoSaver(AddressBook(), NoteBook(), *paths).start()
+
+    assert not saver.enabled and saver._thread is None
+    saver.stop()
@@ -0,0 +1,74 @@
+"""Пакетний режим: виконання команд із потоку рядків без інтерактиву."""
+
+import importlib
+import io
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from commands.address_book import AddressBook
+from commands.note_book import NoteBook
+
+main = importlib.import_module("main")
+
+MAIN_SCRIPT = Path(main.__file__)
+
+
+class CountingOut(io.StringIO):
+    """Потік, що рахує записи (скидання блоків виводу)."""
+
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, text):
+        self.writes += 1
+        return super().write(text)
+
+
+def test_run_batch_skips_comments_and_stops_at_exit():
+    out = io.StringIO()
+    book, notes = AddressBook(), NoteBook()
+
+    executed = main.run_batch(
+        ["add Ann 0123456789\n", "\n", "# коментар\n", "phone Ann\n", "phnoe Ann\n", "exit\n", "add Bob 0987654321\n"],
+        book, notes, out=out,
+    )
+
+    lines = out.getvalue().splitlines()
+    assert executed == 3
+    assert lines[0] == "Контакт додано. Телефон додано."
+    assert lines[1] == "Телефони контакту Ann: 0123456789"
+    assert "'phone'" in lines[2]
+    assert "\x1b[" not in out.getvalue()
+    assert book.find("Bob") is None
+
+
+def test_run_batch_writes_output_in_blocks(monkeypatch):
+    monkeypatch.setattr(main, "BATCH_FLUSH_LINES", 10)
+    out = CountingOut()
+
+    main.run_batch([f"add Name{i} {i:010}" for i in range(25)], AddressBook(), NoteBook(), out=out)
+
+    assert out.writes == 3
+    assert len(out.getvalue().splitlines()) == 25
+
+
+def test_batch_mode_saves_once_and_keeps_stdout_clean(tmp_path):
+    env = {**os.environ, "CLI_BOT_DATA_DIR": str(tmp_path), "CLI_BOT_STORAGE": "pickle"}
+    commands = "add Ann 0123456789\nadd-note Plan buy milk\n"
+
+    first = subprocess.run(
+        [sys.executable, str(MAIN_SCRIPT), "--batch", "-"],
+        input=commands, capture_output=True, text=True, env=env, timeout=60, check=True,
+    )
+    second = subprocess.run(
+        [sys.executable, str(MAIN_SCRIPT), "--batch", "-"],
+        input="phone Ann\nfind-note Plan\n", capture_output=True, text=True, env=env, timeout=60, check=True,
+    )
+
+    assert "[INFO]" not in first.stdout and "[INFO]" in first.stderr
+    assert first.stdout.splitlines() == ["Контакт додано. Телефон додано.", "Нотатку 'Plan' додано."]
+    assert "Телефони контакту Ann: 0123456789" in second.stdout
+    assert "buy milk" in second.stdout
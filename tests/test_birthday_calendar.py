@@ -0,0 +1,96 @@
+"""Календарний індекс днів народження: команда birthdays і узгодженість після змін."""
+
+import random
+from datetime import date, timedelta
+
+import pytest
+
+from commands import address_book
+from commands.address_book import AddressBook, Record
+from commands.registry import dispatch
+
+
+def freeze_today(monkeypatch, today):
+    """Підміняє date.today() у модулі адресної книги."""
+
+    class FrozenDate(date):
+        @classmethod
+        def today(cls):
+            return today
+
+    monkeypatch.setattr(address_book, "date", FrozenDate)
+
+
+def upcoming_by_scan(book, today, days):
+    """Вікно привітань повним проходом по записах (як до появи календаря)."""
+    horizon = today + timedelta(days=days)
+    found = []
+    for record in book.data.values():
+        if record.birthday is None:
+            continue
+        birthday = record.birthday.value
+        next_birthday = birthday.replace(year=today.year)
+        if next_birthday < today:
+            next_birthday = next_birthday.replace(year=today.year + 1)
+        congrats = next_birthday
+        if congrats.weekday() >= 5:
+            congrats += timedelta(days=7 - congrats.weekday())
+        if congrats <= horizon:
+            found.append({"name": record.name.value, "congrats_date": congrats, "birthday": birthday})
+    found.sort(key=lambda x: (x["congrats_date"], x["name"]))
+    return found
+
+
+def calendar(book):
+    """Повертає календар як (місяць, день) → відсортовані імена."""
+    return {key: sorted(r.name.value for r in bucket) for key, bucket in book._birthday_index.items()}
+
+
+def calendar_by_scan(book):
+    """Будує той самий календар повним проходом по записах."""
+    found = {}
+    for name, record in book.data.items():
+        if record.birthday is not None:
+            found.setdefault((record.birthday.value.month, record.birthday.value.day), []).append(name)
+    return {key: sorted(names) for key, names in found.items()}
+
+
+@pytest.fixture
+def book():
+    """Книга з днями народження (без 29 лютого — старий прохід на ньому падав)."""
+    rng = random.Random(5)
+    book = AddressBook()
+    for i in range(300):
+        record = Record(f"Name{i:03}")
+        birthday = date(1970, 1, 1) + timedelta(days=rng.randrange(30 * 365))
+        if (birthday.month, birthday.day) != (2, 29):
+            record.add_birthday(f"{birthday:%d.%m.%Y}")
+        book.add_record(record)
+    return book
+
+
+@pytest.mark.parametrize("today", [date(2026, 10, 16), date(2025, 12, 27), date(2024, 2, 24), date(2026, 6, 6)])
+@pytest.mark.parametrize("days", [0, 7, 30])
+def test_upcoming_matches_full_scan(monkeypatch, book, today, days):
+    freeze_today(monkeypatch, today)
+
+    assert book.get_upcomming_birthdays(days) == upcoming_by_scan(book, today, days)
+
+
+def test_calendar_follows_change_rename_and_delete(book):
+    dispatch("change", ["Name001", "birthday", "01.01.2001"], book, None)
+    dispatch("change", ["Name002", "name", "Renamed"], book, None)
+    dispatch("delete", ["Name003"], book, None)
+    dispatch("add", ["Fresh", "0123456789"], book, None)
+    dispatch("add-birthday", ["Fresh", "29.02.1996"], book, None)
+
+    assert calendar(book) == calendar_by_scan(book)
+    assert "Name001" in [r.name.value for r in book.birthdays_on(date(2027, 1, 1))]
+    assert "Fresh" in [r.name.value for r in book.birthdays_on(date(2027, 2, 28))]
+    assert "Fresh" not in [r.name.value for r in book.birthdays_on(date(2028, 2, 28))]
+
+
+def test_birthdays_command_validates_window(book):
+    assert dispatch("birthdays", ["367"], book, None).startswith("Помилка")
+    assert dispatch("birthdays", ["x"], book, None).startswith("Помилка")
+    assert dispatch("birthdays", ["1", "2"], book, None).startswith("Помилка")
@@ -0,0 +1,78 @@
+"""Команда birthdays-in: наступний день народження рівно через N днів і вікна A..B."""
+
+import importlib
+from calendar import isleap
+from datetime import date, timedelta
+
+import pytest
+
+from commands.address_book import AddressBook, Record
+
+birthdays_in = importlib.import_module("commands.birthdays_in")
+
+BIRTHDAYS = {
+    "Leap": "29.02.1996",
+    "Feb28": "28.02.1990",
+    "Mar1": "01.03.1985",
+    "NewYear": "01.01.2000",
+    "Eve": "31.12.1999",
+    "Today": "16.10.1980",
+}
+
+
+@pytest.fixture
+def book():
+    """Книга з днями народження на межах року та навколо 29 лютого."""
+    book = AddressBook()
+    for name, birthday in BIRTHDAYS.items():
+        record = Record(name)
+        record.add_birthday(birthday)
+        book.add_record(record)
+    return book
+
+
+def freeze_today(monkeypatch, today):
+    """Підміняє date.today() у модулі команди."""
+
+    class FrozenDate(date):
+        @classmethod
+        def today(cls):
+            return today
+
+    monkeypatch.setattr(birthdays_in, "date", FrozenDate)
+
+
+def next_birthday(birthday: date, today: date) -> date:
+    """Наступний день народження (29 лютого у невисокосний рік — 28 лютого)."""
+    for year in (today.year, today.year + 1):
+        day = 28 if (birthday.month, birthday.day) == (2, 29) and not isleap(year) else birthday.day
+        candidate = date(year, birthday.month, day)
+        if candidate >= today:
+            return candidate
+    raise AssertionError("unreachable")
+
+
+@pytest.mark.parametrize(
+    "today", [date(2026, 10, 16), date(2023, 3, 1), date(2024, 2, 28), date(2023, 2, 28), date(2024, 12, 31)]
+)
+def test_matches_next_occurrence(monkeypatch, book, today):
+    freeze_today(monkeypatch, today)
+    for days in list(range(0, 370)) + [400, 730, 1000]:
+        target = today + timedelta(days=days)
+        expected = sorted(
+            name for name, record in book.data.items()
+            if next_birthday(record.birthday.value, today) == target
+        )
+        answer = birthdays_in.birthdays_in([str(days)], book)
+        found = sorted(answer.rsplit(" у ", 1)[1].rstrip(".").split(", ")) if answer.startswith("День") else []
+        assert found == expected, (today, days)
+
+
+def test_range_groups_by_date(monkeypatch, book):
+    freeze_today(monkeypatch, date(2026, 2, 20))
+
+    answer = birthdays_in.birthdays_in(["0..10"], book)
+
+    assert answer.splitlines() == ["28.02.2026 (через 8 днів): Feb28, Leap", "01.03.2026 (через 9 днів): Mar1"]
+    assert birthdays_in.birthdays_in(["0..400"], book).startswith("Помилка")
+    assert birthdays_in.birthdays_in(["-1"], book).startswith("Помилка")
@@ -0,0 +1,160 @@
+"""Стовпцева адресна книга: сумісність зі звичайною AddressBook."""
+
+import importlib
+import pickle
+import random
+from datetime import date, timedelta
+
+import pytest
+
+from commands import columnar
+from commands.address_book import AddressBook, Record
+from commands.columnar import ColumnarAddressBook
+from commands.lazy import unwrap
+from commands.note_book import NoteBook
+from commands.registry import Refusal, dispatch
+
+storage = importlib.import_module("commands.storage")
+
+
+@pytest.fixture
+def book():
+    """Звичайна книга з випадковими (детермінованими) контактами."""
+    rng = random.Random(17)
+    book = AddressBook()
+    for i in range(400):
+        record = Record(f"Name{i:03}")
+        record.add_phone(f"0{rng.randrange(10**9):09}")
+        if i % 7:
+            birthday = date(1960, 1, 1) + timedelta(days=rng.randrange(40 * 366))
+            record.add_birthday(f"{birthday:%d.%m.%Y}")
+        if i % 3 == 0:
+            record.add_email(f"user{i}@{rng.choice(['example.com', 'mail.ua'])}")
+        book.add_record(record)
+    book.find("Name001").add_birthday("29.02.1996")
+    return book
+
+
+WINDOWS = [
+    (date(2026, 10, 16), 0),
+    (date(2026, 10, 16), 7),
+    (date(2023, 2, 20), 20),
+    (date(2024, 2, 20), 20),
+    (date(2024, 12, 25), 30),
+    (date(2025, 3, 1), 366),
+]
+
+
+@pytest.mark.skipif(columnar.np is None, reason="NumPy не встановлено")
+@pytest.mark.parametrize("first,days", WINDOWS)
+@pytest.mark.parametrize("shift_weekends", [False, True])
+def test_numpy_and_fallback_windows_agree(monkeypatch, book, first, days, shift_weekends):
+    fast = ColumnarAddressBook.from_book(book)
+    # Змінений і видалений контакти лишають у стовпцях порожні рядки.
+    for owner in (book, fast):
+        owner.delete("Name002")
+        owner.find("Name007").add_birthday("01.01.2001")
+    fast.release_views()
+    last = first + timedelta(days=days)
+
+    vectorized = fast.birthdays_between(first, last, shift_weekends)
+    with monkeypatch.context() as patch:
+        patch.setattr(columnar, "np", None)
+        fallback = fast.birthdays_between(first, last, shift_weekends)
+    plain = book.birthdays_between(first, last, shift_weekends)
+
+    assert vectorized == fallback == plain
+
+
+SCRIPT = [
+    "add Zoe 0671112233",
+    "add-email Zoe zoe@Example.com",
+    "add Zoe 0671119999",
+    "change Name003 phone {} 0501234567",
+    "add-email Name006 second@mail.ua",
+    "delete Name009",
+    "add-birthday Zoe 29.02.2000",
+    "change Zoe phone 0671112233 0931112233",
+    "change Name008 name Yan",
+    "add-email Yan yan@example.com",
+]
+
+QUERIES = [
+    "phone Zoe",
+    "phone Name003",
+    "email zoe@example.com",
+    "email USER6@example.com",
+    "domain example.com",
+    "domain @mail.ua",
+    "find-phone 067",
+    "find-phone 067 --limit 1",
+    "find-phone 2233 --suffix",
+    "find-phone 0501234567",
+    "show-birthday Zoe",
+    "phone Yan",
+    "all",
+]
+
+
+def run(line, book):
+    """Виконує команду через реєстр (з release_views, як у циклі команд) і повертає весь вивід."""
+    command, *args = line.split()
+    result = dispatch(command, args, book, NoteBook())
+    return result if isinstance(result, str) else list(result)
+
+
+def test_commands_give_the_same_answers(book):
+    fast = ColumnarAddressBook.from_book(book)
+    old_phone = book.find("Name003").phones[0].value
+
+    for line in SCRIPT:
+        line = line.format(old_phone)
+        answer = run(line, fast)
+        assert not isinstance(answer, Refusal) and answer == run(line, book), line
+        for query in QUERIES:
+            assert run(query, fast) == run(query, book), (line, query)
+
+    assert fast.find("Name009") is None and fast.find("Name008") is None
+    assert fast.find_record_by_phone("0501234567").name.value == "Name003"
+    assert fast.find_record_by_email("yan@example.com").name.value == "Yan"
+
+
+def test_direct_record_changes_are_written_back(book):
+    fast = ColumnarAddressBook.from_book(book)
+    fast.find("Name010").add_phone("0939998877")
+    fast.release_views()
+
+    assert fast.find_record_by_phone("0939998877").name.value == "Name010"
+    assert [p for p, name in fast.find_phones("093999")] == ["0939998877"]
+
+
+def test_conversions_and_pickle_keep_contacts(book):
+    fast = ColumnarAddressBook.from_book(book)
+    fast.delete("Name005")
+    fast.find("Name004").add_email("four@example.com")
+    fast.release_views()
+
+    restored = pickle.loads(pickle.dumps(fast))
+    plain = restored.to_book()
+
+    assert type(plain) is AddressBook and list(plain.data) == list(fast.data)
+    for name in fast.data:
+        assert str(plain.find(name)) == str(fast.find(name)) == str(restored.find(name))
+    assert plain.find_record_by_email("FOUR@example.com") is plain.find("Name004")
+
+
+def test_storage_converts_between_layouts(book, tmp_path, monkeypatch):
+    monkeypatch.setattr(storage, "STORAGE_BACKEND", "pickle")
+    contacts, note_file = tmp_path / "addressbook.pkl", tmp_path / "notes.pkl"
+    storage.save_data(book, NoteBook(), contacts, note_file, force=True)
+
+    monkeypatch.setattr(storage, "BOOK_LAYOUT", "columnar")
+    loaded, notes = storage.load_data(contacts, note_file)
+    assert isinstance(unwrap(loaded), ColumnarAddressBook)
+    assert run("find-phone 0", loaded) == run("find-phone 0", book)
+    storage.save_data(loaded, notes, contacts, note_file, force=True)
+
+    monkeypatch.setattr(storage, "BOOK_LAYOUT", "records")
+    loaded, _ = storage.load_data(contacts, note_file)
+    assert type(unwrap(loaded)) is AddressBook
+    assert run("all", loaded) == run("all", book)
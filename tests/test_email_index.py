@@ -0,0 +1,71 @@
+"""Індекси email (у casefold) і домену: пошук та перевірка дублікатів після змін."""
+
+import pytest
+
+from commands.address_book import AddressBook
+from commands.decorator import Refusal
+from commands.registry import dispatch
+
+
+def indexed_emails(book):
+    """Повертає індекси як (email → ім'я, домен → імена)."""
+    emails = {key: record.name.value for key, record in book._email_index.items()}
+    domains = {domain: sorted(r.name.value for r in owners) for domain, owners in book._domain_index.items()}
+    return emails, domains
+
+
+def actual_emails(book):
+    """Будує ті самі індекси повним проходом по записах."""
+    emails, domains = {}, {}
+    for name, record in book.data.items():
+        for email in record.emails:
+            key = email.value.casefold()
+            emails[key] = name
+            owners = domains.setdefault(key.rpartition("@")[2], [])
+            if name not in owners:
+                owners.append(name)
+    return emails, {domain: sorted(owners) for domain, owners in domains.items()}
+
+
+@pytest.fixture
+def book():
+    """Книга з контактами, що мають email у двох доменах."""
+    book = AddressBook()
+    for name, phone in (("Ann", "0123456789"), ("Bob", "0987654321")):
+        dispatch("add", [name, phone], book, None)
+    dispatch("add-email", ["Ann", "Ann@Example.com"], book, None)
+    dispatch("add-email", ["Ann", "ann@mail.ua"], book, None)
+    dispatch("add-email", ["Bob", "bob@example.com"], book, None)
+    return book
+
+
+def test_lookup_ignores_case(book):
+    assert book.find_record_by_email(" ANN@example.COM ") is book.find("Ann")
+    assert "Ann" in dispatch("email", ["ann@EXAMPLE.com"], book, None)
+    assert [r.name.value for r in book.find_records_by_domain("@EXAMPLE.com")] == ["Ann", "Bob"]
+    assert isinstance(dispatch("add-email", ["Bob", "ann@example.com"], book, None), Refusal)
+
+
+def test_indexes_follow_change_rename_and_delete(book):
+    dispatch("change", ["Ann", "email", "ann@example.com", "ann@new.org"], book, None)
+    assert book.find_record_by_email("ann@example.com") is None
+    assert [r.name.value for r in book.find_records_by_domain("example.com")] == ["Bob"]
+
+    # Звільнену адресу може взяти інший контакт.
+    assert not isinstance(dispatch("add-email", ["Bob", "ANN@example.com"], book, None), Refusal)
+    assert isinstance(dispatch("change", ["Ann", "email", "ann@new.org", "bob@example.com"], book, None), Refusal)
+
+    dispatch("change", ["Ann", "name", "Anna"], book, None)
+    assert book.find_record_by_email("ann@mail.ua").name.value == "Anna"
+
+    dispatch("delete", ["Bob"], book, None)
+    assert book.find_records_by_domain("example.com") == []
+    assert indexed_emails(book) == actual_emails(book)
+
+
+def test_domain_stays_while_another_email_uses_it(book):
+    dispatch("add-email", ["Bob", "robert@example.com"], book, None)
+    dispatch("change", ["Bob", "email", "bob@example.com", "bob@mail.ua"], book, None)
+
+    assert [r.name.value for r in book.find_records_by_domain("example.com")] == ["Ann", "Bob"]
+    assert indexed_emails(book) == actual_emails(book)
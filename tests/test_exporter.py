@@ -0,0 +1,109 @@
+"""Потоковий експорт у CSV / JSONL / vCard / iCalendar і зворотний імпорт експортованих файлів."""
+
+from datetime import datetime
+
+import pytest
+
+from commands.address_book import AddressBook, Record
+from commands.exporter import _contact_row, _note_row, export_file
+from commands.importer import import_file
+from commands.note_book import Note, NoteBook
+
+
+@pytest.fixture
+def book():
+    """Книга з контактами, що мають усі поля, і контактом лише з телефоном."""
+    book = AddressBook()
+    ann = Record("Ann")
+    ann.add_phone("0123456789")
+    ann.add_phone("0987654321")
+    ann.add_email("ann@example.com")
+    ann.add_birthday("29.02.1996")
+    ann.add_address("Kyiv, Khreshchatyk 1; apt 2")
+    book.add_record(ann)
+    bob = Record("Bob")
+    bob.add_phone("0501234567")
+    book.add_record(bob)
+    return book
+
+
+@pytest.fixture
+def notes():
+    """Нотатник із багаторядковою нотаткою з тегами та нотаткою без тегів."""
+    notes = NoteBook()
+    plan = Note("Plan", "buy milk,\n\"fresh\" one", tags=["home", "shop"])
+    plan.created_at = datetime(2024, 5, 1, 12, 30, 15)
+    notes.add(plan)
+    notes.add(Note("Idea", "write tests"))
+    return notes
+
+
+def rows(owner, row):
+    """Повертає поля всіх записів книги чи нотатника в порядку додавання."""
+    return [row(value) for value in owner.data.values()]
+
+
+@pytest.mark.parametrize("name", ["backup.csv", "backup.jsonl", "backup.csv.gz", "backup.jsonl.xz"])
+def test_round_trip(tmp_path, book, notes, name):
+    path = tmp_path / name
+    report = export_file(path, book, notes)
+    assert (report.contacts, report.notes) == (2, 2)
+
+    restored_book, restored_notes = AddressBook(), NoteBook()
+    imported = import_file(path, restored_book, restored_notes)
+
+    assert (imported.contacts, imported.notes, imported.error_count) == (2, 2, 0)
+    assert rows(restored_book, _contact_row) == rows(book, _contact_row)
+    assert rows(restored_notes, _note_row) == rows(notes, _note_row)
+
+
+def unfold(path):
+    """Читає рядки vCard / iCalendar, склеюючи перенесені (RFC 5545, 3.1)."""
+    data = path.read_bytes().decode("utf-8")
+    assert data.endswith("\r\n")
+    return data.replace("\r\n ", "").split("\r\n")[:-1]
+
+
+def test_vcard_export(tmp_path, book):
+    path = tmp_path / "contacts.vcf"
+    report = export_file(path, book, None, with_notes=False)
+
+    lines = unfold(path)
+    assert report.contacts == 2
+    assert lines.count("BEGIN:VCARD") == lines.count("END:VCARD") == 2
+    assert "FN:Ann" in lines
+    assert "TEL;TYPE=CELL:0123456789" in lines
+    assert "TEL;TYPE=CELL:0987654321" in lines
+    assert "EMAIL;TYPE=INTERNET:ann@example.com" in lines
+    assert "BDAY:1996-02-29" in lines
+    assert "ADR;TYPE=HOME:;;Kyiv\\, Khreshchatyk 1\\; apt 2;;;;" in lines
+    assert "TEL;TYPE=CELL:0501234567" in lines
+
+
+def test_icalendar_export(tmp_path, book):
+    path = tmp_path / "birthdays.ics"
+    report = export_file(path, book, None, with_notes=False)
+
+    lines = unfold(path)
+    assert report.contacts == 1
+    assert lines[0] == "BEGIN:VCALENDAR" and lines[-1] == "END:VCALENDAR"
+    assert lines.count("BEGIN:VEVENT") == 1
+    assert "DTSTART;VALUE=DATE:19960229" in lines
+    assert "RRULE:FREQ=YEARLY;BYMONTH=2;BYMONTHDAY=-1" in lines
+    assert "SUMMARY:День народження: Ann" in lines
+
+
+def test_long_lines_are_folded(tmp_path, book):
+    book.find("Bob").add_address("Вулиця " * 20)
+    path = tmp_path / "contacts.vcf"
+    export_file(path, book, None, with_notes=False)
+
+    for line in path.read_bytes().split(b"\r\n"):
+        assert len(line) <= 75
+        line.decode("utf-8")
+    assert any(line.startswith("ADR;TYPE=HOME:;;Вулиця") for line in unfold(path))
+
+
+def test_notes_only_formats_reject_vcard(tmp_path, notes):
+    with pytest.raises(ValueError):
+        export_file(tmp_path / "notes.vcf", None, notes, contacts=False)
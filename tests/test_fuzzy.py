@@ -0,0 +1,81 @@
+"""Підказки команд і аргументів: відстань Левенштейна та BK-дерево."""
+
+import random
+
+import pytest
+
+from commands.address_book import AddressBook, Record
+from commands.fuzzy import BKTree, edit_distance
+from commands.note_book import Note, NoteBook
+from commands.registry import suggest_argument, suggest_command
+
+ALPHABET = "abcяєі"
+
+
+def levenshtein(a, b):
+    """Відстань Левенштейна класичним динамічним програмуванням."""
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b)))
+        previous = current
+    return previous[-1]
+
+
+def random_words(rng, count, max_length):
+    """Випадкові слова з малого алфавіту (багато близьких пар)."""
+    return ["".join(rng.choice(ALPHABET) for _ in range(rng.randrange(0, max_length))) for _ in range(count)]
+
+
+def test_edit_distance_matches_dynamic_programming():
+    rng = random.Random(1)
+    words = random_words(rng, 150, 12) + ["a" * 70, "a" * 69 + "b", "ab" * 40]
+    for a, b in zip(words, reversed(words)):
+        assert edit_distance(a, b) == levenshtein(a, b), (a, b)
+
+
+def test_search_matches_brute_force_after_discards():
+    rng = random.Random(2)
+    words = sorted(set(random_words(rng, 300, 8)))
+    tree = BKTree(words)
+    removed = set(words[::5])
+    for word in removed:
+        tree.discard(word)
+    tree.add(words[0])
+    kept = [word for word in words if word not in removed or word == words[0]]
+
+    assert len(tree) == len(kept)
+    for query in random_words(rng, 40, 8):
+        for radius in (0, 1, 2):
+            expected = sorted((levenshtein(query, word), word) for word in kept if levenshtein(query, word) <= radius)
+            assert sorted(tree.search(query, radius)) == expected
+
+
+def test_closest_is_case_insensitive_and_silent_for_exact_words():
+    tree = BKTree(["Alexander", "Alex", "Ann"])
+
+    assert tree.closest("alexandr") == ["Alexander"]
+    assert tree.closest("Ann") == []
+    assert tree.closest("zzzz") == []
+
+
+@pytest.mark.parametrize("typo,expected", [("phnoe", "phone"), ("ad", "add"), ("seach-notes", "search-notes")])
+def test_command_suggestions(typo, expected):
+    assert suggest_command(typo) == expected
+
+
+def test_argument_suggestions_follow_changes():
+    book, notes = AddressBook(), NoteBook()
+    book.add_record(Record("Olena"))
+    notes.add(Note("Shopping", "milk", ["home"]))
+
+    assert "'Olena'" in suggest_argument("phone", ["Olna"], book, notes)
+    assert suggest_argument("phone", ["Olena"], book, notes) is None
+    assert "'Shopping'" in suggest_argument("edit-note", ["Shoping", "x"], book, notes)
+    assert "'home'" in suggest_argument("find-by-tag", ["+hom"], book, notes)
+
+    book.delete("Olena")
+    book.add_record(Record("Oleg"))
+    assert suggest_argument("phone", ["Olna"], book, notes) is None
+    assert "'Oleg'" in suggest_argument("phone", ["Olg"], book, notes)
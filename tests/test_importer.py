@@ -0,0 +1,74 @@
+"""Імпорт контактів і нотаток: розбір дат, перевірка рядків, стиснуті файли."""
+
+import gzip
+import json
+from datetime import datetime
+
+import pytest
+
+from commands.address_book import AddressBook, Record
+from commands.importer import import_file, import_rows, parse_date
+from commands.note_book import NoteBook
+
+
+@pytest.mark.parametrize(
+    "value",
+    ["01.02.1990", "29.02.1996", "1.2.1990", "+1.02.1990", " 1.02.1990", "1_.02.1990",
+     "01.+2.1990", "01.02.1_90", "01-02-1990", "31.04.2020", "29.02.1990", "٠١.٠٢.١٩٩٠", ""],
+)
+def test_parse_date_matches_strptime(value):
+    try:
+        expected = datetime.strptime(value, "%d.%m.%Y").date()
+    except ValueError:
+        with pytest.raises(ValueError):
+            parse_date(value)
+    else:
+        assert parse_date(value) == expected
+
+
+def test_invalid_rows_are_reported_and_skipped():
+    book, notes = AddressBook(), NoteBook()
+    existing = Record("Ann")
+    existing.add_phone("0123456789")
+    book.add_record(existing)
+
+    report = import_rows(
+        [
+            {"name": "Bob", "phones": "0987654321; 0501234567", "email": "bob@example.com"},
+            {"name": "Ann", "phone": "0631234567"},
+            {"name": "Eve", "phone": "0123456789"},
+            {"name": "Dan", "phone": "0501234567"},
+            {"name": "Kim", "phone": "12"},
+            {"name": "Max", "email": "BOB@example.com"},
+            {"name": "Liz", "birthday": "+1.02.1990"},
+            {"title": "Plan", "text": "buy milk", "tags": ["home"]},
+            {"title": "plan", "text": "again"},
+            {"title": "Empty"},
+        ],
+        book, notes,
+    )
+
+    assert (report.contacts, report.notes, report.error_count) == (1, 1, 8)
+    assert [error.split(":")[0] for error in report.errors] == [f"Рядок {n}" for n in (2, 3, 4, 5, 6, 7, 9, 10)]
+    assert [phone.value for phone in book.find("Bob").phones] == ["0987654321", "0501234567"]
+    assert book.find("Liz") is None
+    assert notes.data["plan"].tags == {"home"}
+
+
+def test_compressed_jsonl_with_broken_lines(tmp_path):
+    path = tmp_path / "contacts.jsonl.gz"
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        f.write(json.dumps({"name": "Ann", "phone": "0123456789", "birthday": "01.02.1990"}) + "\n")
+        f.write("\n{broken\n[1, 2]\n")
+        f.write(json.dumps({"name": "Bob"}) + "\n")
+    book = AddressBook()
+
+    report = import_file(path, book, NoteBook())
+
+    assert (report.contacts, report.error_count) == (2, 2)
+    assert str(book.find("Ann").birthday) == "01.02.1990"
+
+
+def test_unsupported_file_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        import_file(tmp_path / "contacts.txt", AddressBook(), NoteBook())
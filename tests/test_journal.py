@@ -0,0 +1,154 @@
+"""Режим journal: відновлення стану після збою з журналу змін."""
+
+import importlib
+import json
+
+import pytest
+
+from commands.registry import dispatch
+
+storage = importlib.import_module("commands.storage")
+
+
+@pytest.fixture
+def files(tmp_path, monkeypatch):
+    """Шляхи до знімків і журналу у тимчасовій теці, режим journal."""
+    monkeypatch.setattr(storage, "STORAGE_BACKEND", "journal")
+    monkeypatch.setattr(storage, "JOURNAL_COMPACT_BYTES", 1024 * 1024)
+    return tmp_path / "addressbook.pkl", tmp_path / "notes.pkl", tmp_path / "journal.log"
+
+
+def run(lines, book, notes, journal):
+    """Виконує команди так само, як інтерактивний цикл: dispatch і log_command."""
+    for line in lines:
+        command, *args = line.split()
+        dispatch(command, args, book, notes)
+        storage.log_command(command, args, book, notes, journal_filename=journal)
+
+
+def journal_commands(journal):
+    """Повертає назви команд, записаних у журнал (без рядка-заголовка)."""
+    entries = (json.loads(line) for line in journal.read_text(encoding="utf-8").splitlines())
+    return [entry["cmd"] for entry in entries if "cmd" in entry]
+
+
+def test_replay_restores_state_without_snapshot(files):
+    contacts, note_file, journal = files
+    book, notes = storage.load_data(contacts, note_file, journal)
+    run(
+        [
+            "add Ann 0123456789",
+            "add-email Ann ann@example.com",
+            "add-birthday Ann 01.02.1990",
+            "add-note Plan buy milk",
+            "add-tags Plan home",
+        ],
+        book, notes, journal,
+    )
+    created_at = notes.data["plan"].created_at
+
+    # Збій: save_data не викликається, знімків на диску немає.
+    assert not contacts.exists() and not note_file.exists()
+    restored_book, restored_notes = storage.load_data(contacts, note_file, journal)
+
+    record = restored_book.find("Ann")
+    assert [phone.value for phone in record.phones] == ["0123456789"]
+    assert [email.value for email in record.emails] == ["ann@example.com"]
+    assert str(record.birthday) == "01.02.1990"
+    note = restored_notes.data["plan"]
+    assert note.read_text() == "buy milk"
+    assert note.tags == {"home"}
+    assert note.created_at == created_at
+
+
+def test_replay_on_top_of_snapshot(files):
+    contacts, note_file, journal = files
+    book, notes = storage.load_data(contacts, note_file, journal)
+    run(["add Ann 0123456789"], book, notes, journal)
+    storage.save_data(book, notes, contacts, note_file, journal, force=True)
+    assert not journal.exists()
+
+    run(["add Bob 0987654321", "delete Ann"], book, notes, journal)
+    restored_book, _ = storage.load_data(contacts, note_file, journal)
+
+    assert restored_book.find("Ann") is None
+    assert restored_book.find("Bob") is not None
+
+
+def test_failed_commands_are_not_journaled(files):
+    contacts, note_file, journal = files
+    book, notes = storage.load_data(contacts, note_file, journal)
+    run(["add Ann 12", "delete Nobody", "add Bob 0987654321", "add-email Bob invalid"], book, notes, journal)
+
+    assert journal_commands(journal) == ["add"]
+
+
+def test_short_arguments_do_not_hide_refusals(files):
+    contacts, note_file, journal = files
+    book, notes = storage.load_data(contacts, note_file, journal)
+    run(["delete і", "delete-note а", "edit-note не знайдено"], book, notes, journal)
+
+    assert not journal.exists()
+
+
+def test_argument_text_does_not_hide_success(files):
+    contacts, note_file, journal = files
+    book, notes = storage.load_data(contacts, note_file, journal)
+    run(["add-note поточним план на тиждень"], book, notes, journal)
+
+    _, restored_notes = storage.load_data(contacts, note_file, journal)
+
+    assert restored_notes.data["поточним"].read_text() == "план на тиждень"
+
+
+def test_truncated_last_entry_is_ignored(files):
+    contacts, note_file, journal = files
+    book, notes = storage.load_data(contacts, note_file, journal)
+    run(["add Ann 0123456789"], book, notes, journal)
+    with journal.open("a", encoding="utf-8") as f:
+        f.write('{"seq":2,"cmd":"add","args":["Bob","09876')
+
+    restored_book, restored_notes = storage.load_data(contacts, note_file, journal)
+
+    assert restored_book.find("Ann") is not None
+    assert restored_book.find("Bob") is None
+
+    # Наступний запис починається з нового рядка, а не дописується до обірваного.
+    run(["add Bob 0987654321"], restored_book, restored_notes, journal)
+    again_book, _ = storage.load_data(contacts, note_file, journal)
+    assert again_book.find("Bob") is not None
+
+
+def test_partial_compaction_does_not_replay_into_written_snapshot(files, monkeypatch):
+    contacts, note_file, journal = files
+    book, notes = storage.load_data(contacts, note_file, journal)
+    run(
+        ["add Ann 0123456789", "change Ann phone 0123456789 0987654321", "add-note Plan buy milk"],
+        book, notes, journal,
+    )
+
+    def fail(notes, path):
+        raise OSError("disk full")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(storage, "_dump_notes", fail)
+        storage.save_data(book, notes, contacts, note_file, journal, force=True)
+    assert contacts.exists() and not note_file.exists() and journal.exists()
+
+    restored_book, restored_notes = storage.load_data(contacts, note_file, journal)
+
+    assert [phone.value for phone in restored_book.find("Ann").phones] == ["0987654321"]
+    assert restored_notes.data["plan"].read_text() == "buy milk"
+
+
+def test_new_journal_after_compaction_is_replayed(files):
+    contacts, note_file, journal = files
+    book, notes = storage.load_data(contacts, note_file, journal)
+    run(["add Ann 0123456789", "add-note Plan buy milk"], book, notes, journal)
+    storage.save_data(book, notes, contacts, note_file, journal, force=True)
+
+    run(["add Bob 0987654321", "edit-note Plan buy bread"], book, notes, journal)
+    restored_book, restored_notes = storage.load_data(contacts, note_file, journal)
+
+    assert restored_book.find("Bob") is not None
+    assert restored_notes.data["plan"].read_text() == "buy bread"
@@ -0,0 +1,89 @@
+"""Ліниве завантаження: файли читаються лише тоді, коли їх потребує команда."""
+
+import importlib
+import pickle
+
+import pytest
+
+from commands import note_store
+from commands.lazy import LazyProxy, is_loaded, unwrap
+from commands.registry import dispatch
+
+storage = importlib.import_module("commands.storage")
+
+
+@pytest.fixture
+def files(tmp_path, monkeypatch):
+    """Збережені контакти й нотатки у тимчасовій теці, режим pickle."""
+    monkeypatch.setattr(storage, "STORAGE_BACKEND", "pickle")
+    contacts, note_file = tmp_path / "addressbook.pkl", tmp_path / "notes.pkl"
+    book, notes = storage.load_data(contacts, note_file)
+    dispatch("add", ["Ann", "0123456789"], book, notes)
+    dispatch("add-note", ["Plan", "buy", "milk", "секретний-текст"], book, notes)
+    dispatch("add-note", ["Idea", "write", "tests"], book, notes)
+    dispatch("add-tags", ["Plan", "home"], book, notes)
+    storage.save_data(book, notes, contacts, note_file, force=True)
+    return contacts, note_file
+
+
+def test_contact_command_does_not_read_notes(files):
+    contacts, note_file = files
+    before = note_file.stat().st_mtime_ns
+    book, notes = storage.load_data(contacts, note_file)
+    assert isinstance(book, LazyProxy) and not is_loaded(book) and not is_loaded(notes)
+
+    dispatch("add", ["Bob", "0987654321"], book, notes)
+    storage.save_data(book, notes, contacts, note_file, force=True)
+
+    assert is_loaded(book) and not is_loaded(notes)
+    assert note_file.stat().st_mtime_ns == before
+    restored_book, _ = storage.load_data(contacts, note_file)
+    assert restored_book.find("Bob") is not None
+
+
+def test_note_texts_are_read_on_demand(files):
+    contacts, note_file = files
+    assert "секретний-текст".encode() not in note_file.read_bytes()
+
+    _, notes = storage.load_data(contacts, note_file)
+    assert [note.title for note in notes.find_by_tags("home")] == ["Plan"]
+    assert all(note._text is None for note in notes.data.values())
+
+    assert "секретний-текст" in dispatch("find-note", ["Plan"], None, notes)
+    assert notes.data["plan"]._text is not None
+    assert notes.data["idea"]._text is None
+    assert [note.title for note in notes.search("tests")] == ["Idea"]
+
+
+def test_edited_texts_survive_appends_and_compaction(files, monkeypatch):
+    contacts, note_file = files
+    book, notes = storage.load_data(contacts, note_file)
+    dispatch("edit-note", ["Idea", "write", "more", "tests"], book, notes)
+    storage.save_data(book, notes, contacts, note_file, force=True)
+
+    book, notes = storage.load_data(contacts, note_file)
+    assert notes.data["idea"].text == "write more tests"
+    old_bodies = notes._bodies.path
+
+    # Застарілі фрагменти переважають живі — файл текстів переписується начисто.
+    monkeypatch.setattr(note_store, "BODIES_COMPACT_MIN_BYTES", 0)
+    dispatch("edit-note", ["Idea", "done"], book, notes)
+    dispatch("edit-note", ["Plan", "buy", "bread"], book, notes)
+    storage.save_data(book, notes, contacts, note_file, force=True)
+
+    assert not old_bodies.exists()
+    book, notes = storage.load_data(contacts, note_file)
+    assert book.find("Ann") is not None
+    assert notes._bodies.path != old_bodies
+    assert notes.data["plan"].text == "buy bread"
+    assert notes.data["idea"].text == "done"
+
+
+def test_pickled_proxy_restores_the_loaded_object(files):
+    contacts, note_file = files
+    book, _ = storage.load_data(contacts, note_file)
+
+    restored = pickle.loads(pickle.dumps(book))
+
+    assert type(restored) is type(unwrap(book))
+    assert restored.find_record_by_phone("0123456789") is restored.find("Ann")
@@ -0,0 +1,105 @@
+"""Профілювання пам'яті: трасування, позначка й різниця, обхід об'єктів книг."""
+
+import importlib
+import tracemalloc
+from collections import Counter
+
+import pytest
+
+from commands.address_book import AddressBook, Record
+from commands.lazy import LazyProxy
+from commands.note_book import Note, NoteBook
+from commands.registry import dispatch
+
+memory = importlib.import_module("commands.memory")
+
+
+@pytest.fixture(autouse=True)
+def no_tracing(monkeypatch):
+    """Кожен тест починає без трасування й позначки та вимикає трасування наприкінці."""
+    was_tracing = tracemalloc.is_tracing()
+    tracemalloc.stop()
+    monkeypatch.setattr(memory, "_mark", None)
+    yield
+    tracemalloc.stop()
+    if was_tracing:
+        tracemalloc.start(memory.TRACE_FRAMES)
+
+
+def run(line, book=None, notes=None):
+    """Виконує команду memory через реєстр і повертає весь вивід."""
+    command, *args = line.split()
+    result = dispatch(command, args, book, notes)
+    return result if isinstance(result, str) else list(result)
+
+
+def make_book(count):
+    """Книга з count контактами, у кожного телефон і email."""
+    book = AddressBook()
+    for i in range(count):
+        record = Record(f"Name{i:04}")
+        record.add_phone(f"{i:010}")
+        record.add_email(f"user{i}@example.com")
+        book.add_record(record)
+    return book
+
+
+def test_tracing_lifecycle():
+    assert run("memory").startswith("Трасування пам'яті не ввімкнено")
+    assert run("memory mark").startswith("Трасування пам'яті не ввімкнено")
+
+    assert run("memory start").startswith("Трасування пам'яті ввімкнено")
+    assert run("memory start") == "Трасування пам'яті вже ввімкнено."
+    assert run("memory diff") == "Помилка: спочатку збережіть позначку командою memory mark."
+    report = run("memory --top 3")
+    assert report[0].startswith("Відстежується:")
+    assert len([line for line in report if line.startswith("  ")]) <= 6
+
+    assert run("memory stop") == "Трасування пам'яті вимкнено."
+    assert run("memory stop") == "Трасування пам'яті не ввімкнено."
+
+
+def test_diff_shows_allocations_since_mark():
+    run("memory start")
+    assert run("memory mark").startswith("Позначку збережено")
+
+    payload = [bytes(1000) for _ in range(2000)]
+    report = run("memory diff --top 5")
+
+    assert report[0].startswith("Зміна з моменту позначки: +")
+    assert any("tests/test_memory.py" in line and "payload = " in line for line in report)
+    assert len(payload) == 2000
+
+
+@pytest.mark.parametrize("line", ["memory --top 0", "memory --top x", "memory mark diff", "memory clear"])
+def test_invalid_arguments(line):
+    assert run(line).startswith("Помилка")
+
+
+def test_objects_report_without_tracing():
+    small = make_book(10)
+    notes = NoteBook()
+    notes.add(Note("Plan", "buy milk", ["home"]))
+
+    report = run("memory objects", small, notes)
+    assert not tracemalloc.is_tracing()
+    assert report[0] == "Пам'ять за частинами:"
+    assert report[1].startswith("  Контакти — дані:") and report[2].startswith("  Нотатки — дані:")
+    kinds = {line.split(maxsplit=2)[2] for line in report[report.index("За типами об'єктів:") + 1:]}
+    assert {"Record", "поля (Field)", "Note", "рядки (str)"} <= kinds
+
+    unloaded = LazyProxy(lambda: pytest.fail("notes must not be loaded"))
+    assert "  Нотатки: файл ще не завантажено." in run("memory objects", small, unloaded)
+
+
+def test_objects_are_counted_once_and_grow_with_the_book():
+    def measured(book):
+        seen, kinds = {id(book), id(book.__dict__)}, Counter()
+        data = memory._deep_size(book.data, seen, kinds, {})
+        indexes = sum(memory._deep_size(v, seen, kinds, {}) for k, v in vars(book).items() if k != "data")
+        # Індекси посилаються на ті самі записи — повторно вони не рахуються.
+        assert memory._deep_size(book.data, seen, kinds, {}) == 0
+        assert sum(kinds.values()) == data + indexes
+        return data
+
+    assert measured(make_book(400)) > 20 * measured(make_book(10))
@@ -0,0 +1,82 @@
+"""Повнотекстовий пошук нотаток (BM25) за інвертованим індексом."""
+
+import math
+import random
+from collections import Counter
+
+import pytest
+
+from commands.note_book import Note, NoteBook, tokenize
+from commands.registry import dispatch
+
+WORDS = ["milk", "bread", "план", "зустріч", "report", "tax", "кава", "trip", "gift", "call"]
+
+
+def bm25_by_scan(notes, query):
+    """Оцінки BM25 повним проходом по нотатках (без індексу)."""
+    docs = {key: Counter(tokenize(note.title) + tokenize(note.text)) for key, note in notes.data.items()}
+    avg_length = sum(sum(doc.values()) for doc in docs.values()) / len(docs) or 1
+    scores = {}
+    for term in set(tokenize(query)):
+        having = [key for key, doc in docs.items() if term in doc]
+        if not having:
+            continue
+        idf = math.log(1 + (len(docs) - len(having) + 0.5) / (len(having) + 0.5))
+        for key in having:
+            freq, length = docs[key][term], sum(docs[key].values())
+            norm = 1 - NoteBook.BM25_B + NoteBook.BM25_B * length / avg_length
+            scores[key] = scores.get(key, 0.0) + idf * freq * (NoteBook.BM25_K1 + 1) / (freq + NoteBook.BM25_K1 * norm)
+    return scores
+
+
+@pytest.fixture
+def notes():
+    """Нотатник із випадковими (детермінованими) текстами."""
+    rng = random.Random(3)
+    notes = NoteBook()
+    for i in range(60):
+        text = " ".join(rng.choice(WORDS) for _ in range(rng.randrange(1, 15)))
+        notes.add(Note(f"Note{i}", text))
+    return notes
+
+
+def assert_ranked(notes, query, limit=10):
+    """Перевіряє, що пошук повертає найкращі за BM25 нотатки за спаданням оцінки."""
+    scores = bm25_by_scan(notes, query)
+    found = [note.title.lower() for note in notes.search(query, limit)]
+    assert len(found) == min(limit, len(scores))
+    ranked = [scores[key] for key in found]
+    assert ranked == sorted(ranked, reverse=True)
+    best = sorted(scores.values(), reverse=True)[:limit]
+    assert ranked == pytest.approx(best)
+
+
+@pytest.mark.parametrize("query", ["milk", "кава trip", "План ЗУСТРІЧ report", "absent", "gift gift"])
+def test_ranking_matches_bm25(notes, query):
+    assert_ranked(notes, query)
+
+
+def test_index_follows_edit_and_delete(notes):
+    notes.search("milk")
+    dispatch("edit-note", ["Note1", "unique", "words", "here"], None, notes)
+    dispatch("delete-note", ["Note2"], None, notes)
+    notes.add(Note("Fresh", "milk milk milk"))
+
+    assert [note.title for note in notes.search("unique")] == ["Note1"]
+    assert "note2" not in [note.title.lower() for note in notes.search(" ".join(WORDS), 100)]
+    assert_ranked(notes, "milk bread")
+
+    fresh = NoteBook()
+    for note in notes.data.values():
+        fresh.add(Note(note.title, note.text))
+    fresh.search("x")
+    assert notes._postings == fresh._postings
+    assert notes._total_length == fresh._total_length
+
+
+def test_index_is_built_on_first_search(notes):
+    assert not notes._text_indexed
+    assert "Нотаток не знайдено." == dispatch("search-notes", ["absent"], None, notes)
+    assert notes._text_indexed
+    assert dispatch("search-notes", ["milk", "--top", "x"], None, notes).startswith("Помилка")
+    assert dispatch("search-notes", ["milk", "--top", "2"], None, notes).count("\n\n") <= 1
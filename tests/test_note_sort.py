@@ -0,0 +1,66 @@
+"""Порядок sort-notes-by-tag, що підтримується інкрементально, і його сторінки."""
+
+import random
+
+import pytest
+
+from commands.note_book import Note, NoteBook
+from commands.registry import dispatch
+
+
+def sorted_by_scan(notes):
+    """Назви нотаток, відсортовані повним сортуванням (без тегів — у кінці, рівні — за додаванням)."""
+    ordered = sorted(
+        enumerate(notes.data.values()),
+        key=lambda item: (not item[1].tags, min(item[1].tags, default=""), item[0]),
+    )
+    return [note.title for _, note in ordered]
+
+
+@pytest.fixture
+def notes():
+    """Нотатник із випадковими (детермінованими) тегами, частина нотаток без тегів."""
+    rng = random.Random(8)
+    notes = NoteBook()
+    for i in range(50):
+        tags = rng.sample(["b", "a", "c", "я", "d"], rng.randrange(0, 3))
+        notes.add(Note(f"Note{i}", "text", tags))
+    return notes
+
+
+def titles(notes, offset=0, limit=None):
+    """Назви нотаток з однієї сторінки sort_by_tags."""
+    return [note.title for note in notes.sort_by_tags(offset, limit)]
+
+
+def test_order_follows_changes(notes):
+    assert titles(notes) == sorted_by_scan(notes)
+
+    untagged = next(note.title for note in notes.data.values() if not note.tags)
+    dispatch("add-tags", [untagged, "0first"], None, notes)
+    dispatch("add-tags", ["Note3", "zz"], None, notes)
+    dispatch("delete-note", ["Note4"], None, notes)
+    dispatch("edit-note", ["Note5", "new", "text"], None, notes)
+    notes.add(Note("Late", "text"))
+
+    assert titles(notes)[0] == untagged
+    assert titles(notes)[-1] == "Late"
+    assert titles(notes) == sorted_by_scan(notes)
+
+
+def test_pages_cover_the_whole_order(notes):
+    pages = [titles(notes, offset, 7) for offset in range(0, 57, 7)]
+
+    assert sum(pages, []) == sorted_by_scan(notes)
+    assert pages[-1] == []
+
+
+def test_command_pages(notes):
+    second = dispatch("sort-notes-by-tag", ["--page", "2", "--size", "5"], None, notes)
+
+    assert second.startswith("Нотатки відсортовані за тегами:")
+    assert second.count("Створено:") == 5
+    assert sorted_by_scan(notes)[5] in second
+    assert dispatch("sort-notes-by-tag", ["--page", "20", "--size", "5"], None, notes) == "На цій сторінці немає нотаток."
+    assert dispatch("sort-notes-by-tag", ["--size", "0"], None, notes).startswith("Помилка")
+    assert dispatch("sort-notes-by-tag", [], None, NoteBook()) == "Немає збережених нотаток для сортування."
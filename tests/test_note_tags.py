@@ -0,0 +1,58 @@
+"""Запити за тегами (OR / +AND / -NOT) за індексом тегів."""
+
+import random
+
+import pytest
+
+from commands.note_book import Note, NoteBook, parse_tag_query
+from commands.registry import dispatch
+
+TAGS = ["work", "home", "urgent", "archived", "ідея", "shop"]
+
+
+def matches_by_scan(notes, query):
+    """Назви нотаток, що відповідають запиту, повним проходом у порядку додавання."""
+    any_tags, all_tags, none_tags = parse_tag_query(query)
+    if not (any_tags or all_tags or none_tags):
+        return []
+    return [
+        note.title for note in notes.data.values()
+        if (not any_tags or note.tags & any_tags) and all_tags <= note.tags and not note.tags & none_tags
+    ]
+
+
+@pytest.fixture
+def notes():
+    """Нотатник із випадковими (детермінованими) тегами, частина нотаток без тегів."""
+    rng = random.Random(11)
+    notes = NoteBook()
+    for i in range(80):
+        notes.add(Note(f"Note{i}", "text", rng.sample(TAGS, rng.randrange(0, 4))))
+    return notes
+
+
+QUERIES = ["work", "work,home", "+work +urgent", "home -archived", "-archived", "ІДЕЯ +shop -work", "missing", "+missing", ","]
+
+
+@pytest.mark.parametrize("query", QUERIES)
+def test_query_matches_full_scan(notes, query):
+    assert [note.title for note in notes.find_by_tags(query)] == matches_by_scan(notes, query)
+
+
+def test_index_follows_add_tags_and_delete(notes):
+    dispatch("add-tags", ["Note0", "Fresh", "work"], None, notes)
+    dispatch("delete-note", ["Note1"], None, notes)
+    notes.add(Note("Late", "text", ["fresh"]))
+
+    assert [note.title for note in notes.find_by_tags("fresh")] == ["Note0", "Late"]
+    for query in QUERIES:
+        assert [note.title for note in notes.find_by_tags(query)] == matches_by_scan(notes, query)
+    assert {tag: keys for tag, keys in notes._tag_index.items()} == {
+        tag: {key for key, note in notes.data.items() if tag in note.tags}
+        for tag in set().union(*(note.tags for note in notes.data.values()))
+    }
+
+
+def test_find_by_tag_command(notes):
+    assert dispatch("find-by-tag", ["missing"], None, notes) == "Нотаток з цими тегами не знайдено."
+    assert "Note" in dispatch("find-by-tag", ["+work", "-home"], None, notes)
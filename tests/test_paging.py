@@ -0,0 +1,62 @@
+"""Потоковий і посторінковий вивід команд all та show-notes."""
+
+import pytest
+
+from commands.address_book import AddressBook, Record
+from commands.note_book import Note, NoteBook
+from commands.parser import DEFAULT_PAGE_SIZE, parse_paging
+from commands.registry import dispatch
+
+
+@pytest.fixture
+def book():
+    """Книга з 120 контактами."""
+    book = AddressBook()
+    for i in range(120):
+        record = Record(f"Name{i:03}")
+        record.add_phone(f"{i:010}")
+        book.add_record(record)
+    return book
+
+
+def test_parse_paging():
+    assert parse_paging(["Ann"]) == (["Ann"], 0, None)
+    assert parse_paging(["--page", "3"]) == ([], 2 * DEFAULT_PAGE_SIZE, DEFAULT_PAGE_SIZE)
+    assert parse_paging(["x", "--limit", "5", "--page", "2"]) == (["x"], 5, 5)
+    for bad in (["--page"], ["--size", "0"], ["--page", "-1"], ["--limit", "x"]):
+        with pytest.raises(ValueError):
+            parse_paging(bad)
+
+
+def test_all_formats_records_lazily(monkeypatch, book):
+    formatted = []
+    monkeypatch.setattr(Record, "__str__", lambda record: formatted.append(record.name.value) or record.name.value)
+
+    lines = dispatch("all", [], book, None)
+    assert formatted == []
+    assert next(lines) == "Name000"
+    assert formatted == ["Name000"]
+
+
+def test_all_pages(book):
+    page = list(dispatch("all", ["--page", "3", "--size", "50"], book, None))
+
+    assert len(page) == 20
+    assert "Name100" in page[0]
+    assert dispatch("all", ["--page", "4", "--size", "50"], book, None) == (
+        "На цій сторінці немає контактів (усього контактів: 120)."
+    )
+    assert dispatch("all", [], AddressBook(), None) == "Немає збережених контактів."
+
+
+def test_show_notes_pages():
+    notes = NoteBook()
+    for i in range(12):
+        notes.add(Note(f"Note{i}", "text"))
+
+    page = list(dispatch("show-notes", ["--page", "2", "--size", "5"], None, notes))
+
+    assert len(page) == 5
+    assert "Note5" in page[0] and page[1].startswith("\n")
+    assert "усього нотаток: 12" in dispatch("show-notes", ["--page", "4", "--size", "5"], None, notes)
+    assert dispatch("show-notes", ["--size", "x"], None, notes).startswith("Помилка")
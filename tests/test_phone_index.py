@@ -0,0 +1,69 @@
+"""Індекс телефон → контакт: перевірка дублікатів і пошук після змін."""
+
+import pickle
+
+import pytest
+
+from commands.address_book import AddressBook
+from commands.decorator import Refusal
+from commands.registry import dispatch
+
+
+def indexed_phones(book):
+    """Повертає індекс як словник телефон → ім'я контакту."""
+    return {phone: record.name.value for phone, record in book._phone_index.items()}
+
+
+def actual_phones(book):
+    """Будує той самий словник повним проходом по записах."""
+    return {phone.value: name for name, record in book.data.items() for phone in record.phones}
+
+
+@pytest.fixture
+def book():
+    """Книга з двома контактами, у першого — два телефони."""
+    book = AddressBook()
+    dispatch("add", ["Ann", "0123456789"], book, None)
+    dispatch("add", ["Ann", "0501234567"], book, None)
+    dispatch("add", ["Bob", "0987654321"], book, None)
+    return book
+
+
+def test_phone_used_by_another_contact_is_refused(book):
+    assert isinstance(dispatch("add", ["Eve", "0123456789"], book, None), Refusal)
+    assert isinstance(dispatch("change", ["Bob", "phone", "0987654321", "0501234567"], book, None), Refusal)
+    assert book.find("Eve") is None
+    assert indexed_phones(book) == actual_phones(book)
+
+
+def test_index_follows_change_remove_rename_and_delete(book):
+    dispatch("change", ["Ann", "phone", "0123456789", "0631112233"], book, None)
+    assert book.find_record_by_phone("0123456789") is None
+    assert book.find_record_by_phone("0631112233") is book.find("Ann")
+
+    # Звільнений номер можна віддати іншому контакту.
+    assert not isinstance(dispatch("add", ["Eve", "0123456789"], book, None), Refusal)
+
+    dispatch("change", ["Ann", "name", "Anna"], book, None)
+    assert book.find_record_by_phone("0501234567").name.value == "Anna"
+
+    book.find("Anna").remove("0501234567")
+    dispatch("delete", ["Bob"], book, None)
+    assert book.find_record_by_phone("0501234567") is None
+    assert book.find_record_by_phone("0987654321") is None
+    assert indexed_phones(book) == actual_phones(book)
+
+
+def test_invalid_new_phone_keeps_old_one_indexed(book):
+    assert isinstance(dispatch("change", ["Ann", "phone", "0123456789", "12"], book, None), Refusal)
+
+    assert book.find_record_by_phone("0123456789") is book.find("Ann")
+    assert indexed_phones(book) == actual_phones(book)
+
+
+def test_index_is_rebuilt_after_pickle(book):
+    restored = pickle.loads(pickle.dumps(book))
+
+    assert "_phone_index" not in book.__getstate__()
+    assert indexed_phones(restored) == actual_phones(book)
+    assert restored.find_record_by_phone("0987654321") is restored.find("Bob")
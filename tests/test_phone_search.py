@@ -0,0 +1,93 @@
+"""Пошук телефонів за початком і кінцем номера (команда find-phone)."""
+
+import importlib
+import random
+
+import pytest
+
+from commands.address_book import AddressBook
+from commands.columnar import ColumnarAddressBook
+from commands.note_book import NoteBook
+from commands.registry import dispatch
+
+storage = importlib.import_module("commands.storage")
+
+QUERIES = ["0", "06", "067", "0671", "9", "89", "0000000000", "5"]
+
+
+def make_book(kind, tmp_path, monkeypatch):
+    """Порожня книга потрібного виду: звичайна, стовпцева або в базі SQLite."""
+    monkeypatch.setattr(storage, "STORAGE_BACKEND", "sqlite" if kind == "sqlite" else "pickle")
+    if kind == "records":
+        return AddressBook()
+    if kind == "columnar":
+        return ColumnarAddressBook()
+    monkeypatch.setattr(storage, "DATA_SQLITE_FILE", tmp_path / "cli_bot.sqlite3")
+    book, _ = storage.load_data(tmp_path / "addressbook.pkl", tmp_path / "notes.pkl")
+    return book
+
+
+def expected(book, digits, from_end):
+    """Пари (телефон, ім'я) повним проходом по записах, у порядку індексу."""
+    pairs = [
+        (phone.value, name)
+        for name, record in book.data.items()
+        for phone in record.phones
+        if (phone.value.endswith(digits) if from_end else phone.value.startswith(digits))
+    ]
+    return sorted(pairs, key=lambda pair: pair[0][::-1] if from_end else pair[0])
+
+
+def run(line, book):
+    """Виконує команду через реєстр так само, як цикл команд, і повертає весь вивід."""
+    command, *args = line.split()
+    notes = NoteBook()
+    result = dispatch(command, args, book, notes)
+    storage.log_command(command, args, book, notes)
+    return result if isinstance(result, str) else list(result)
+
+
+@pytest.mark.parametrize("kind", ["records", "columnar", "sqlite"])
+def test_search_matches_brute_force_after_changes(kind, tmp_path, monkeypatch):
+    rng = random.Random(20)
+    book = make_book(kind, tmp_path, monkeypatch)
+    phones = sorted({f"0{rng.choice('5679')}{rng.randrange(10**8):08}" for _ in range(300)})
+    for i, phone in enumerate(phones):
+        run(f"add Name{i % 120:03} {phone}", book)
+
+    # Пошук до змін будує індекси, тож далі вони мають стежити за кожною зміною.
+    book.find_phones("0", False, 1)
+    book.find_phones("0", True, 1)
+    run(f"change Name001 phone {book.find('Name001').phones[0].value} 0671234567", book)
+    run("delete Name002", book)
+    run("change Name003 name Renamed", book)
+    record = book.find("Name004")
+    record.remove(record.phones[0].value)
+    # Зміну поза командою стовпцям і базі передають явно, як це робить цикл команд.
+    if kind == "columnar":
+        book.release_views()
+    elif kind == "sqlite":
+        book.flush("Name004")
+    run("add Name005 0000000089", book)
+
+    for digits in QUERIES:
+        for from_end in (False, True):
+            result = list(book.find_phones(digits, from_end))
+            assert result == expected(book, digits, from_end), (digits, from_end)
+            assert list(book.find_phones(digits, from_end, 3)) == result[:3]
+
+
+def test_command_pages_and_validates_digits():
+    book = AddressBook()
+    for i in range(25):
+        run(f"add Name{i:02} 067{i:07}", book)
+    run("add Other 0501234567", book)
+
+    lines = run("find-phone 067 --page 3 --size 10", book)
+    assert lines == [f"067{i:07} — Name{i:02}" for i in range(20, 25)]
+    assert run("find-phone 067 --limit 2", book) == ["0670000000 — Name00", "0670000001 — Name01"]
+    assert run("find-phone 4567 --suffix", book) == ["0501234567 — Other"]
+    assert run("find-phone 067 --page 4 --size 10", book).startswith("Немає телефонів")
+    assert run("find-phone 99 --suffix", book) == "Немає телефонів, що закінчуються на 99."
+    for bad in ("find-phone 06x", "find-phone 012345678901", "find-phone ٠٦٧"):
+        assert run(bad, book).startswith("Помилка"), bad
@@ -0,0 +1,101 @@
+"""Завантаження pickle-файлів старих версій (словники стану) у класи з __slots__."""
+
+import copyreg
+import importlib
+import pickle
+import sys
+from datetime import date, datetime
+
+import pytest
+
+from commands.address_book import Address, AddressBook, Birthday, Email, Name, Phone, Record
+from commands.note_book import Note, NoteBook
+
+storage = importlib.import_module("commands.storage")
+
+
+class OldState:
+    """Об'єкт, що серіалізується так, як pickle записував класи зі словником __dict__."""
+
+    def __init__(self, cls, state):
+        self.cls, self.state = cls, state
+
+    def __reduce_ex__(self, protocol):
+        return copyreg._reconstructor, (self.cls, object, None), self.state
+
+
+def old_field(cls, value, attr="value"):
+    """Поле у форматі старих версій: словник {"value": ...} ({"_value": ...} у Phone)."""
+    return OldState(cls, {attr: value})
+
+
+def old_book_bytes():
+    """Адресна книга й нотатник так, як їх зберігала версія без індексів і __slots__."""
+    ann = OldState(Record, {
+        "name": old_field(Name, "Ann"),
+        "phones": [old_field(Phone, "0123456789", "_value"), old_field(Phone, "0501234567", "_value")],
+        "birthday": old_field(Birthday, date(1990, 2, 1)),
+        "address": old_field(Address, "Kyiv"),
+        "emails": [old_field(Email, "Ann@Example.com")],
+    })
+    bob = OldState(Record, {"name": old_field(Name, "Bob"), "phones": [], "birthday": None})
+    book = OldState(AddressBook, {"data": {"Ann": ann, "Bob": bob}})
+    plan = OldState(Note, {
+        "title": "Plan", "text": "buy milk", "created_at": datetime(2024, 5, 1, 12, 30), "tags": {"home"},
+    })
+    notes = OldState(NoteBook, {"data": {"plan": plan}})
+    return pickle.dumps(book), pickle.dumps(notes)
+
+
+@pytest.fixture
+def files(tmp_path, monkeypatch):
+    """Файли старого формату в тимчасовій теці, режим pickle."""
+    monkeypatch.setattr(storage, "STORAGE_BACKEND", "pickle")
+    contacts, note_file = tmp_path / "addressbook.pkl", tmp_path / "notes.pkl"
+    book_bytes, notes_bytes = old_book_bytes()
+    contacts.write_bytes(book_bytes)
+    note_file.write_bytes(notes_bytes)
+    return contacts, note_file
+
+
+def check(book, notes):
+    """Перевіряє вміст і робочі індекси відновлених книг."""
+    ann = book.find("Ann")
+    assert isinstance(ann, Record) and not hasattr(ann, "__dict__")
+    assert [phone.value for phone in ann.phones] == ["0123456789", "0501234567"]
+    assert str(ann.birthday) == "01.02.1990" and str(ann.address) == "Kyiv"
+    assert book.find("Bob").emails == [] and book.find("Bob").address is None
+    assert book.find_record_by_phone("0501234567") is ann
+    assert book.find_record_by_email("ann@example.com") is ann
+    assert [r.name.value for r in book.birthdays_on(date(2026, 2, 1))] == ["Ann"]
+
+    note = notes.data["plan"]
+    assert note.text == "buy milk" and note.tags == {"home"}
+    assert note.created_at == datetime(2024, 5, 1, 12, 30)
+    assert [n.title for n in notes.find_by_tags("home")] == ["Plan"]
+    assert [n.title for n in notes.search("milk")] == ["Plan"]
+
+
+def test_old_files_load_and_migrate_on_save(files):
+    contacts, note_file = files
+    book, notes = storage.load_data(contacts, note_file)
+    check(book, notes)
+
+    assert book.find("Bob").add_phone("0987654321") == "Телефон додано."
+    storage.save_data(book, notes, contacts, note_file, force=True)
+
+    assert b"buy milk" not in note_file.read_bytes()
+    restored_book, restored_notes = storage.load_data(contacts, note_file)
+    check(restored_book, restored_notes)
+    assert restored_book.find_record_by_phone("0987654321") is restored_book.find("Bob")
+
+
+def test_restored_objects_are_slotted_and_share_tags(files):
+    contacts, note_file = files
+    book, notes = storage.load_data(contacts, note_file)
+    ann = book.find("Ann")
+    fields = [ann.name, ann.birthday, ann.address, *ann.phones, *ann.emails]
+
+    assert not any(hasattr(obj, "__dict__") for obj in [ann, *fields, notes.data["plan"]])
+    tag = next(iter(notes.data["plan"].tags))
+    assert tag is sys.intern("".join(["ho", "me"]))
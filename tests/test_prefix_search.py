@@ -0,0 +1,110 @@
+"""Пошук контактів за префіксом імені та автодоповнення клавішею Tab."""
+
+import importlib
+import random
+
+import pytest
+
+from commands.address_book import AddressBook, Record
+from commands.prefix import PrefixIndex
+from commands.registry import dispatch
+
+main = importlib.import_module("main")
+
+NAMES = ["Olena", "oleg", "Olga", "Ostap", "Öl", "Ann", "anna", "Anatoliy", "Bob", "Олег", "Олена", "ольга"]
+
+
+def expected(words, prefix):
+    """Слова з префіксом у порядку індексу — повним проходом."""
+    key = prefix.casefold()
+    return sorted((word for word in words if word.casefold().startswith(key)), key=lambda w: (w.casefold(), w))
+
+
+def test_index_matches_brute_force_after_changes():
+    rng = random.Random(19)
+    words = sorted({"".join(rng.choice("aAbBоО") for _ in range(rng.randrange(1, 7))) for _ in range(400)})
+    rng.shuffle(words)
+    index = PrefixIndex(words[:200])
+    for word in words[150:]:
+        index.add(word)
+    removed = set(words[::4])
+    for word in removed:
+        index.discard(word)
+    kept = set(words) - removed
+
+    assert len(index) == len(kept)
+    for prefix in ["", "a", "A", "ab", "о", "Оa", "bbb", "x"]:
+        assert list(index.iter_prefix(prefix)) == expected(kept, prefix), prefix
+        assert list(index.iter_prefix(prefix, 3)) == expected(kept, prefix)[:3]
+
+
+@pytest.fixture
+def book():
+    """Книга з іменами в різному регістрі, латиницею й кирилицею."""
+    book = AddressBook()
+    for name in NAMES:
+        book.add_record(Record(name))
+    return book
+
+
+def test_book_index_follows_add_rename_and_delete(book):
+    assert list(book.names_with_prefix("ol")) == ["oleg", "Olena", "Olga"]
+    assert list(book.names_with_prefix("ОЛ")) == ["Олег", "Олена", "ольга"]
+
+    dispatch("change", ["Olga", "name", "Halyna"], book, None)
+    dispatch("delete", ["oleg"], book, None)
+    dispatch("add", ["Olexa", "0123456789"], book, None)
+
+    names = list(book.data)
+    for prefix in ["ol", "Ol", "h", "", "о", "an"]:
+        assert list(book.names_with_prefix(prefix)) == expected(names, prefix), prefix
+    assert list(book.names_with_prefix("ol", 1)) == ["Olena"]
+
+
+def test_prefix_command_pages_in_alphabetical_order():
+    book = AddressBook()
+    for i in reversed(range(30)):
+        book.add_record(Record(f"Name{i:02}"))
+    book.add_record(Record("Other"))
+
+    pages = [dispatch("prefix", ["name", "--page", str(page), "--size", "8"], book, None) for page in (1, 2, 4)]
+    assert [len(list(page)) for page in pages[:2]] == [8, 8]
+    assert list(pages[2]) == [str(book.find(f"Name{i}")) for i in range(24, 30)]
+    assert "Немає контактів" in dispatch("prefix", ["name", "--page", "5", "--size", "8"], book, None)
+    assert "Немає контактів" in dispatch("prefix", ["xyz"], book, None)
+
+
+class FakeReadline:
+    """Рядок введення так, як його бачить функція автодоповнення readline."""
+
+    def __init__(self, line):
+        self.line = line
+
+    def get_line_buffer(self):
+        return self.line
+
+    def get_begidx(self):
+        return self.line.rfind(" ") + 1
+
+
+def completions(complete, monkeypatch, line):
+    """Усі варіанти, які readline отримав би для рядка line."""
+    monkeypatch.setattr(main, "readline", FakeReadline(line))
+    text = line[line.rfind(" ") + 1:]
+    results, state = [], 0
+    while (match := complete(text, state)) is not None:
+        results.append(match)
+        state += 1
+    return results
+
+
+def test_completion_uses_commands_and_book_names(book, monkeypatch):
+    complete = main.make_completer(book)
+
+    assert "add-birthday" in completions(complete, monkeypatch, "add-b")
+    assert completions(complete, monkeypatch, "phone ol") == ["oleg", "Olena", "Olga"]
+    assert completions(complete, monkeypatch, "add-note ol") == []
+
+    dispatch("delete", ["Olena"], book, None)
+    monkeypatch.setattr(main, "COMPLETION_LIMIT", 1)
+    assert completions(complete, monkeypatch, "phone ol") == ["oleg"]
@@ -0,0 +1,56 @@
+"""Реєстр команд: перевірка кількості аргументів, синоніми й ліниве завантаження обробників."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from commands.address_book import AddressBook
+from commands.note_book import NoteBook
+from commands.registry import COMMAND_REGISTRY, dispatch, get_command
+
+CLI_BOT_DIR = Path(__file__).resolve().parent.parent / "cli_bot"
+
+
+def test_every_handler_resolves():
+    for name, spec in COMMAND_REGISTRY.items():
+        if spec._handler is not None:
+            assert callable(spec.handler), name
+        assert spec.target in (None, "book", "notes", "both"), name
+
+
+@pytest.mark.parametrize("line", ["add Ann", "change Ann phone", "delete", "birthdays-in", "add-tags Plan"])
+def test_too_few_arguments_do_not_reach_handler(line):
+    command, *args = line.split()
+    spec = get_command(command)
+
+    result = dispatch(command, args, AddressBook(), NoteBook())
+
+    assert result == spec.usage_error()
+    assert result.startswith(f"Помилка: команда '{command}' очікує мінімум {spec.min_args}")
+
+
+def test_aliases_and_unknown_commands():
+    assert get_command("close") is get_command("exit")
+    assert dispatch("exit", [], None, None) is None
+    assert dispatch("no-such-command", [], None, None) is None
+    assert dispatch("hello", ["ignored"], None, None) == "Як я можу допомогти?"
+
+
+def test_handler_modules_are_imported_on_first_use():
+    script = (
+        "import sys\n"
+        "from commands.registry import dispatch\n"
+        "dispatch('hello', [], None, None)\n"
+        "lazy = ('commands.importer', 'commands.exporter', 'commands.memory', 'commands.all_table')\n"
+        "print(sorted(name for name in lazy if name in sys.modules))\n"
+        "from commands.address_book import AddressBook\n"
+        "dispatch('all-table', [], AddressBook(), None)\n"
+        "print(sorted(name for name in lazy if name in sys.modules))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], cwd=CLI_BOT_DIR, capture_output=True, text=True, timeout=60, check=True,
+    )
+
+    assert result.stdout.splitlines() == ["[]", "['commands.all_table']"]
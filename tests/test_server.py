@@ -0,0 +1,111 @@
+"""Серверний режим: протокол рядків із END_MARKER, спільні книги для клієнтів і тонкий клієнт connect."""
+
+import asyncio
+import importlib
+import os
+import signal
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from commands.address_book import AddressBook
+from commands.note_book import NoteBook
+from commands.server import END_MARKER, LOCAL_ONLY_MSG, CommandServer
+
+storage = importlib.import_module("commands.storage")
+main = importlib.import_module("main")
+
+MAIN_SCRIPT = Path(main.__file__)
+
+
+async def ask(reader, writer, line):
+    """Надсилає команду й повертає рядки відповіді до END_MARKER."""
+    writer.write((line + "\n").encode("utf-8"))
+    await writer.drain()
+    lines = []
+    while (reply := (await reader.readline()).decode("utf-8").rstrip("\n")) != END_MARKER:
+        lines.append(reply)
+    return lines
+
+
+async def session(socket_path, book, notes):
+    """Два клієнти працюють із тими самими книгами через Unix-сокет."""
+    server = CommandServer(book, notes, storage.AutoSaver(book, notes, interval=0))
+    server._lock = asyncio.Lock()
+    async with await asyncio.start_unix_server(server.handle_client, path=str(socket_path)):
+        first = await asyncio.open_unix_connection(str(socket_path))
+        second = await asyncio.open_unix_connection(str(socket_path))
+
+        replies = {
+            "add": await ask(*first, "add Ann 0123456789"),
+            "phone": await ask(*second, "phone Ann"),
+            "import": await ask(*second, "import /etc/passwd.csv"),
+            "typo": await ask(*first, "phnoe Ann"),
+            "comment": await ask(*first, "# коментар"),
+            "all": await ask(*second, "all"),
+        }
+        reader, writer = second
+        writer.write(b"exit\n")
+        await writer.drain()
+        replies["exit"] = [(await reader.readline()).decode("utf-8").rstrip("\n")]
+        replies["closed"] = await asyncio.wait_for(reader.read(), timeout=5)
+        for _, writer in (first, second):
+            writer.close()
+    return replies
+
+
+@pytest.mark.skipif(not hasattr(asyncio, "start_unix_server"), reason="потрібні Unix-сокети")
+def test_clients_share_books(tmp_path, monkeypatch):
+    monkeypatch.setattr(storage, "STORAGE_BACKEND", "pickle")
+    book, notes = AddressBook(), NoteBook()
+
+    replies = asyncio.run(session(tmp_path / "bot.sock", book, notes))
+
+    assert book.find("Ann") is not None
+    assert any("0123456789" in line for line in replies["phone"])
+    assert replies["import"] == [LOCAL_ONLY_MSG.format("import")]
+    assert "'phone'" in replies["typo"][0]
+    assert replies["comment"] == []
+    assert any("Ann" in line for line in replies["all"])
+    assert replies["exit"] == ["До побачення!"]
+    assert replies["closed"] == END_MARKER.encode() + b"\n"
+
+
+@pytest.mark.skipif(not hasattr(asyncio, "start_unix_server"), reason="потрібні Unix-сокети")
+def test_serve_and_connect_processes(tmp_path):
+    env = {**os.environ, "CLI_BOT_DATA_DIR": str(tmp_path), "CLI_BOT_STORAGE": "pickle"}
+    socket_path = tmp_path / "bot.sock"
+    server = subprocess.Popen(
+        [sys.executable, str(MAIN_SCRIPT), "serve", "--socket", str(socket_path)],
+        stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, env=env,
+    )
+    try:
+        deadline = time.monotonic() + 30
+        while not socket_path.exists():
+            assert server.poll() is None and time.monotonic() < deadline, "сервер не запустився"
+            time.sleep(0.05)
+
+        def connect(commands):
+            return subprocess.run(
+                [sys.executable, str(MAIN_SCRIPT), "connect", "--socket", str(socket_path)],
+                input=commands, capture_output=True, text=True, env=env, timeout=60, check=True,
+            ).stdout.splitlines()
+
+        assert connect("add Ann 0123456789\nadd-note Plan buy milk\n") == [
+            "Контакт додано. Телефон додано.", "Нотатку 'Plan' додано.",
+        ]
+        second = connect("\nphone Ann\nexit\nphone Ann\n")
+        assert second == ["Телефони контакту Ann: 0123456789", "До побачення!"]
+    finally:
+        server.send_signal(signal.SIGTERM)
+        output, _ = server.communicate(timeout=60)
+
+    assert "[INFO] Сервер зупинено." in output
+    after = subprocess.run(
+        [sys.executable, str(MAIN_SCRIPT), "--batch", "-"],
+        input="find-note Plan\n", capture_output=True, text=True, env=env, timeout=60, check=True,
+    )
+    assert "buy milk" in after.stdout
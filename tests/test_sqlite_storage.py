@@ -0,0 +1,70 @@
+"""Режим sqlite: зміни «на місці» потрапляють у базу одразу після команди."""
+
+import importlib
+import io
+import sqlite3
+
+import pytest
+
+from commands.sqlite_storage import _SqliteMapping, load_sqlite
+
+storage = importlib.import_module("commands.storage")
+main = importlib.import_module("main")
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    """Шлях до тимчасової бази, режим sqlite."""
+    path = tmp_path / "cli_bot.sqlite3"
+    monkeypatch.setattr(storage, "STORAGE_BACKEND", "sqlite")
+    monkeypatch.setattr(storage, "DATA_SQLITE_FILE", path)
+    return path
+
+
+def test_batch_flushes_each_mutation(db, tmp_path):
+    book, notes = storage.load_data(tmp_path / "addressbook.pkl", tmp_path / "notes.pkl")
+    out = io.StringIO()
+    main.run_batch(
+        [
+            "add Ann 0123456789",
+            "add-email Ann ann@example.com",
+            "add-birthday Ann 01.02.1990",
+            "add-note Plan buy milk",
+            "add-tags Plan home",
+            "email ann@example.com",
+        ],
+        book, notes, out=out,
+    )
+    assert "не знайдено" not in out.getvalue()
+
+    # Нове з'єднання бачить лише те, що вже записано в базу.
+    restored_book, restored_notes = load_sqlite(db)
+    record = restored_book.find("Ann")
+    assert [email.value for email in record.emails] == ["ann@example.com"]
+    assert str(record.birthday) == "01.02.1990"
+    assert restored_notes.data["plan"].tags == {"home"}
+
+
+def test_unreadable_database_stops_instead_of_starting_empty(db, tmp_path, monkeypatch):
+    book, notes = load_sqlite(db)
+    main.run_batch(["add Ann 0123456789"], book, notes, out=io.StringIO())
+    book.data.conn.close()
+
+    def locked(*args):
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(storage, "load_sqlite", locked)
+    with pytest.raises(SystemExit):
+        storage.load_data(tmp_path / "addressbook.pkl", tmp_path / "notes.pkl")
+
+    restored_book, _ = load_sqlite(db)
+    assert restored_book.find("Ann") is not None
+
+
+def test_mapping_requires_storage_hooks():
+    class Incomplete(_SqliteMapping):
+        def _read(self, key):
+            return None
+
+    with pytest.raises(TypeError):
+        Incomplete(None)
@@ -0,0 +1,114 @@
+"""Лічильники, процентилі й помилки команд (команда stats)."""
+
+import importlib
+import json
+
+import pytest
+
+from commands.address_book import AddressBook
+from commands.decorator import input_error
+from commands.note_book import NoteBook
+from commands.registry import dispatch
+from commands.stats import STATS, CommandMetrics
+
+storage = importlib.import_module("commands.storage")
+
+
+@pytest.fixture(autouse=True)
+def clean_stats():
+    """Кожен тест починає з порожньої статистики процесу."""
+    STATS.reset()
+    yield
+    STATS.reset()
+
+
+def run(line, book, notes):
+    """Виконує команду через реєстр і читає потоковий результат до кінця."""
+    command, *args = line.split()
+    result = dispatch(command, args, book, notes)
+    return result if result is None or isinstance(result, str) else list(result)
+
+
+def test_calls_errors_and_lines_are_counted():
+    book, notes = AddressBook(), NoteBook()
+    for line in ["add Ann 0123456789", "add Bob 0987654321", "phone", "phone Nobody", "find-phone 0x", "all"]:
+        run(line, book, notes)
+
+    data = STATS.as_dict()
+    assert (data["add"]["calls"], data["add"]["errors"]) == (2, 0)
+    # «не знайдено» — звичайна відповідь, а нестача аргументів — помилка.
+    assert (data["phone"]["calls"], data["phone"]["errors"]) == (2, 1)
+    assert data["find-phone"]["errors"] == 1
+    assert data["all"]["avg_lines"] == 2
+
+
+def test_stream_is_recorded_when_finished_or_closed():
+    book, notes = AddressBook(), NoteBook()
+    for i in range(5):
+        run(f"add Name{i} 012345678{i}", book, notes)
+
+    lines = dispatch("all", [], book, notes)
+    assert "all" not in STATS.metrics
+    next(lines)
+    lines.close()
+    assert STATS.metrics["all"].lines == 1
+
+
+def test_exceptions_caught_by_input_error_count_as_errors():
+    @input_error
+    def broken(args):
+        raise KeyError(args)
+
+    with STATS.measure("broken") as measurement:
+        result = broken([])
+    assert measurement.result(result) == "Введіть ім'я користувача або контакт не знайдено."
+
+    with pytest.raises(RuntimeError), STATS.measure("crash"):
+        raise RuntimeError
+
+    assert STATS.metrics["broken"].errors == 1 and STATS.metrics["crash"].errors == 1
+
+
+def test_percentiles_stay_within_one_bucket():
+    metrics = CommandMetrics()
+    for ms in range(1, 101):
+        metrics.add(ms / 1000, 1, False)
+
+    for q, exact in ((0.50, 0.050), (0.95, 0.095), (0.99, 0.099)):
+        assert exact <= metrics.percentile(q) <= exact * 1.16
+    assert metrics.percentile(1.0) == metrics.max == 0.1
+    assert CommandMetrics().percentile(0.5) == 0
+
+
+def test_replayed_journal_is_not_counted(tmp_path, monkeypatch):
+    monkeypatch.setattr(storage, "STORAGE_BACKEND", "journal")
+    contacts, note_file, journal = tmp_path / "addressbook.pkl", tmp_path / "notes.pkl", tmp_path / "journal.log"
+    book, notes = storage.load_data(contacts, note_file, journal)
+    for line in ["add Ann 0123456789", "add Bob 0987654321"]:
+        run(line, book, notes)
+        command, *args = line.split()
+        storage.log_command(command, args, book, notes, journal_filename=journal)
+    STATS.reset()
+
+    book, _ = storage.load_data(contacts, note_file, journal)
+    assert book.find("Bob") is not None
+    assert STATS.metrics == {}
+
+
+def test_stats_command_reset_and_dump(tmp_path):
+    book, notes = AddressBook(), NoteBook()
+    assert run("stats", book, notes) == "Ще не виконано жодної команди."
+    run("add Ann 0123456789", book, notes)
+
+    table = run("stats", book, notes)
+    rows = [[cell.strip() for cell in row.split("|")] for row in table]
+    assert rows[0][:3] == ["Команда", "Викликів", "Помилок"]
+    assert {row[0]: row[1:3] for row in rows[2:]} == {"add": ["1", "0"], "stats": ["1", "0"]}
+
+    path = tmp_path / "stats.json"
+    STATS.dump(path)
+    assert json.loads(path.read_text(encoding="utf-8"))["add"]["calls"] == 1
+
+    assert run("stats reset", book, notes) == "Статистику команд очищено."
+    assert list(STATS.metrics) == ["stats"]
+    assert run("stats x", book, notes).startswith("Помилка")